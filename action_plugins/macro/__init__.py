@@ -51,6 +51,7 @@ class MacroFunctor(gremlin.base_profile.AbstractFunctor):
             self.macro.add_action(seq)
         self.macro.exclusive = action.exclusive
         self.macro.repeat = action.repeat
+        MacroFunctor.manager.compile(self.macro)
 
     def process_event(self, event, value):
         MacroFunctor.manager.queue_macro(self.macro)
@@ -119,6 +119,8 @@ class MapToKeyboardFunctor(gremlin.base_profile.AbstractFunctor):
         # Execute release in reverse order
         for key in reversed(action.keys):
             self.release.release(key_from_code(key[0], key[1]))
+        gremlin.macro.MacroManager().compile(self.press)
+        gremlin.macro.MacroManager().compile(self.release)
 
     def process_event(self, event, value):
         if value.current:
@@ -17,10 +17,12 @@
 
 
 import os
+import threading
 from lxml import etree as ElementTree
 
 from PySide6 import QtWidgets, QtCore, QtGui
 import gremlin.base_profile
+import gremlin.clock
 
 import gremlin.config
 import gremlin.config
@@ -39,8 +41,6 @@ from gremlin.keyboard import Key, key_from_name, key_from_code
 from gremlin.ui.virtual_keyboard import *
 from gremlin.types import MouseButton, MouseAction, MouseClickMode, KeyboardOutputMode
 import logging
-import threading
-import time
 from gremlin.util import log_info
 
 class MapToKeyboardExWidget(gremlin.ui.input_item.AbstractActionWidget):
@@ -309,8 +309,9 @@ class MapToKeyboardExFunctor(gremlin.base_profile.AbstractFunctor):
         self.delay = action.delay / 1000
         self.autorepeat_delay = action.autorepeat_delay / 1000
         self.is_pressed = False
-        self._ar_thread = None
-        self._ar_running = False
+        self._ar_timer = None
+        self._ar_active = False
+        self._ar_lock = threading.Lock()
 
         if self.delay < 0:
             self.delay = 0
@@ -342,18 +343,41 @@ class MapToKeyboardExFunctor(gremlin.base_profile.AbstractFunctor):
         self.release.completed_callback = self._macro_completed
         self.delay_press_release.completed_callback = self._macro_completed
 
+        manager = gremlin.macro.MacroManager()
+        for macro in (self.press, self.release, self.delay_press_release):
+            manager.compile(macro)
+
     def _macro_completed(self):
         ''' called when a macro is done running '''
         self.is_pressed = False
 
+    def _ar_start(self):
+        ''' starts autorepeat unless already running '''
+        with self._ar_lock:
+            if self._ar_active:
+                return False
+            self._ar_active = True
+        self._ar_execute()
+        return True
+
+    def _ar_cancel(self):
+        ''' stops autorepeat '''
+        with self._ar_lock:
+            was_active = self._ar_active
+            self._ar_active = False
+            if self._ar_timer is not None:
+                self._ar_timer.cancel()
+                self._ar_timer = None
+        return was_active
+
     def profile_start(self):
-        self._ar_running = False
+        self._ar_cancel()
 
     def profile_stop(self):
         # release all keys
         if self.mode == KeyboardOutputMode.Hold:
             gremlin.macro.MacroManager().queue_macro(self.release)
-        self._ar_running = False
+        self._ar_cancel()
 
     def process_event(self, event, value):
         if event.event_type == InputType.JoystickAxis or value.current:
@@ -387,19 +411,17 @@ class MapToKeyboardExFunctor(gremlin.base_profile.AbstractFunctor):
                         event
                     )
             elif self.mode == KeyboardOutputMode.AutoRepeat:
-                # setup autorepeat thread
-                if self._ar_thread is None:
-                    self._ar_thread = threading.Thread(target=self._ar_execute)
-                    self._ar_running = True
-                    self._ar_thread.start()
+                # start autorepeat
+                if self._ar_start():
+                    if gremlin.config.Configuration().verbose:
+                        log_info("autorepeat start...")
         else:
             # release
             if self.mode == KeyboardOutputMode.Hold:
                 gremlin.macro.MacroManager().queue_macro(self.release)
-            self._ar_running = False
-            if self._ar_thread is not None:
-                self._ar_thread.join()
-                self._ar_thread = None
+            if self._ar_cancel():
+                if gremlin.config.Configuration().verbose:
+                    log_info("autorepeat stop...")
 
             
             
@@ -408,15 +430,17 @@ class MapToKeyboardExFunctor(gremlin.base_profile.AbstractFunctor):
         return True
 
     def _ar_execute(self):
-        ''' autorepeat run thread '''
-        verbose = gremlin.config.Configuration().verbose
-        if verbose:
-            log_info("autorepeat start...")
-        while self._ar_running:
+        ''' sends one autorepeat pulse and schedules the next one '''
+        with self._ar_lock:
+            # autorepeat may have been cancelled while this call was pending
+            if not self._ar_active:
+                return
             gremlin.macro.MacroManager().queue_macro(self.delay_press_release)
-            time.sleep(self.delay + self.autorepeat_delay) # give time for the key pulse + our own delay
-        if verbose:
-            log_info("autorepeat stop...")
+            # give time for the key pulse + our own delay
+            self._ar_timer = gremlin.clock.call_later(
+                self.delay + self.autorepeat_delay,
+                self._ar_execute
+            )
         
 
             
@@ -17,11 +17,12 @@ from gremlin.profile import read_bool, safe_read, safe_format
 from gremlin.util import rad2deg
 import gremlin.ui.ui_common
 import gremlin.ui.input_item
+import gremlin.clock
 import gremlin.sendinput
 from gremlin import input_devices
 
 
-import enum, threading,time, random
+import enum, threading, random
 
 import gremlin.util
 
@@ -510,11 +511,10 @@ class MapToMouseExFunctor(gremlin.base_profile.AbstractFunctor):
     properly with a single input, at least partially.
     """
 
-    # shared wiggle thread
-    _wiggle_local_thread = None
-    _wiggle_remote_thread = None
-    _wiggle_local_stop_requested = False
-    _wiggle_remote_stop_requested = False
+    # shared wiggle timers
+    _wiggle_local_timer = None
+    _wiggle_remote_timer = None
+    _wiggle_lock = threading.Lock()
     _mouse_controller = None
 
 
@@ -708,83 +708,74 @@ class MapToMouseExFunctor(gremlin.base_profile.AbstractFunctor):
 
 
     def _wiggle_start(self, is_local = False, is_remote = False):
-        ''' starts the wiggle thread, local or remote '''
-
-        if is_local and not MapToMouseExFunctor._wiggle_local_thread:
-            syslog.debug("Wiggle start local requested...")
-            MapToMouseExFunctor._wiggle_local_stop_requested = False
-            MapToMouseExFunctor._wiggle_local_thread = threading.Thread(target=MapToMouseExFunctor._wiggle_local)
-            MapToMouseExFunctor._wiggle_local_thread.start()
+        ''' starts wiggling the mouse, local or remote '''
+        with MapToMouseExFunctor._wiggle_lock:
+            if is_local and not MapToMouseExFunctor._wiggle_local_timer:
+                syslog.debug("Wiggle start local requested...")
+                input_devices.remote_state.say("local wiggle mode on")
+                MapToMouseExFunctor._wiggle_local_timer = gremlin.clock.call_later(
+                    0.0, MapToMouseExFunctor._wiggle_step, True, 0
+                )
 
-        if is_remote and not MapToMouseExFunctor._wiggle_remote_thread:
-            syslog.debug("Wiggle start remote requested...")
-            MapToMouseExFunctor._wiggle_remote_stop_requested = False
-            MapToMouseExFunctor._wiggle_remote_thread = threading.Thread(target=MapToMouseExFunctor._wiggle_remote)
-            MapToMouseExFunctor._wiggle_remote_thread.start()
+            if is_remote and not MapToMouseExFunctor._wiggle_remote_timer:
+                syslog.debug("Wiggle start remote requested...")
+                input_devices.remote_state.say("remote wiggle mode on")
+                MapToMouseExFunctor._wiggle_remote_timer = gremlin.clock.call_later(
+                    0.0, MapToMouseExFunctor._wiggle_step, False, 0
+                )
 
     def _wiggle_stop(self, is_local = False, is_remote = False):
-        ''' stops the wiggle thread, local or remote '''
-
-        if is_local and MapToMouseExFunctor._wiggle_local_thread:
-            syslog.debug("Wiggle stop local requested...")
-            MapToMouseExFunctor._wiggle_local_stop_requested = True
-            MapToMouseExFunctor._wiggle_local_thread.join()
-            syslog.debug("Wiggle thread local exited...")
-            MapToMouseExFunctor._wiggle_local_thread = None
-
-        if is_remote and MapToMouseExFunctor._wiggle_remote_thread:
-            syslog.debug("Wiggle stop local requested...")
-            MapToMouseExFunctor._wiggle_remote_stop_requested = True
-            MapToMouseExFunctor._wiggle_remote_thread.join()
-            syslog.debug("Wiggle thread remote exited...")
-            MapToMouseExFunctor._wiggle_remote_thread = None
-
-    @staticmethod
-    def _wiggle_local():
-        ''' wiggles the mouse '''
-        syslog.debug("Wiggle local start...")
-        msg = "local wiggle mode on"
-        input_devices.remote_state.say(msg)
-
-        t_wait = time.time()
-        while not MapToMouseExFunctor._wiggle_local_stop_requested:
-            if time.time() >= t_wait:
-                syslog.debug("wiggling local...")
-                MapToMouseExFunctor._mouse_controller.set_absolute_motion(1, 1)
-                time.sleep(1)
-                MapToMouseExFunctor._mouse_controller.set_absolute_motion(-1, -1)
-                time.sleep(0.5)
+        ''' stops wiggling the mouse, local or remote '''
+        with MapToMouseExFunctor._wiggle_lock:
+            if is_local and MapToMouseExFunctor._wiggle_local_timer:
+                syslog.debug("Wiggle stop local requested...")
+                MapToMouseExFunctor._wiggle_local_timer.cancel()
+                MapToMouseExFunctor._wiggle_local_timer = None
                 MapToMouseExFunctor._mouse_controller.set_absolute_motion(0, 0)
-                t_wait = time.time() + random.uniform(10,40)
-            time.sleep(0.5)
-            
-        syslog.debug("Wiggle local stop...")
-        input_devices.remote_state.say("local wiggle mode off")
-
+                input_devices.remote_state.say("local wiggle mode off")
 
+            if is_remote and MapToMouseExFunctor._wiggle_remote_timer:
+                syslog.debug("Wiggle stop remote requested...")
+                MapToMouseExFunctor._wiggle_remote_timer.cancel()
+                MapToMouseExFunctor._wiggle_remote_timer = None
+                input_devices.remote_client.send_mouse_motion(0, 0)
+                input_devices.remote_state.say("remote wiggle mode off")
 
     @staticmethod
-    def _wiggle_remote():
-        ''' wiggles the mouse - remote clients'''
-        syslog.debug("Wiggle remote start...")
-
-        msg = "remote wiggle mode on"
-        input_devices.remote_state.say(msg)
-
-        t_wait = time.time()
-        while not MapToMouseExFunctor._wiggle_remote_stop_requested:
-            if time.time() >= t_wait:
-                syslog.debug("wiggling remote...")
-                input_devices.remote_client.send_mouse_motion(1, 1)
-                time.sleep(1)
-                input_devices.remote_client.send_mouse_motion(-1, -1)
-                time.sleep(0.5)
-                input_devices.remote_client.send_mouse_motion(0,0)
-                t_wait = time.time() + random.uniform(10,40)
-            time.sleep(0.5)
-            
-        syslog.debug("Wiggle remote stop...")
-        input_devices.remote_state.say("remote wiggle mode off")
+    def _wiggle_step(is_local, step):
+        ''' performs one step of the wiggle motion and schedules the next
+
+        :param is_local True to wiggle the local mouse, False for remote clients
+        :param step index of the step in the wiggle sequence
+        '''
+        with MapToMouseExFunctor._wiggle_lock:
+            if is_local:
+                if not MapToMouseExFunctor._wiggle_local_timer:
+                    return
+                move = MapToMouseExFunctor._mouse_controller.set_absolute_motion
+            else:
+                if not MapToMouseExFunctor._wiggle_remote_timer:
+                    return
+                move = input_devices.remote_client.send_mouse_motion
+
+            if step == 0:
+                syslog.debug(f"wiggling {'local' if is_local else 'remote'}...")
+                move(1, 1)
+                delay = 1.0
+            elif step == 1:
+                move(-1, -1)
+                delay = 0.5
+            else:
+                move(0, 0)
+                delay = random.uniform(10, 40)
+
+            timer = gremlin.clock.call_later(
+                delay, MapToMouseExFunctor._wiggle_step, is_local, (step + 1) % 3
+            )
+            if is_local:
+                MapToMouseExFunctor._wiggle_local_timer = timer
+            else:
+                MapToMouseExFunctor._wiggle_remote_timer = timer
         
 
 class MapToMouseEx(gremlin.base_profile.AbstractAction):
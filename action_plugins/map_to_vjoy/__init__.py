@@ -18,11 +18,12 @@
 from __future__ import annotations
 import logging
 import threading
-import time
 from lxml import etree as ElementTree
 
 from PySide6 import QtWidgets, QtCore, QtGui
 import gremlin.actions
+import gremlin.clock
+import gremlin.tick_engine
 import gremlin.event_handler
 import gremlin.input_types
 import gremlin.joystick_handling
@@ -2032,10 +2033,9 @@ class VJoyRemapFunctor(gremlin.base_classes.AbstractFunctor):
         self.paired = action_data.paired
 
         self.needs_auto_release = self._check_for_auto_release(action_data)
-        self.thread_running = False
-        self.should_stop_thread = False
-        self.thread_last_update = time.time()
-        self.thread = None
+        self.relative_running = False
+        self.should_stop_relative = False
+        self.relative_last_update = gremlin.clock.now()
         self.axis_delta_value = 0.0
         self.axis_value = 0.0
         self.axis_start_value = action_data.axis_start_value
@@ -2093,7 +2093,9 @@ class VJoyRemapFunctor(gremlin.base_classes.AbstractFunctor):
     # async routine to pulse a button
     def _fire_pulse(self, *args):
 
-        self.lock.acquire()
+        if not self.lock.acquire(blocking=False):
+            # a pulse is already in progress
+            return
         vjoy_device_id, vjoy_input_id, duration = args
         # vjoy_device_id = args]
         # vjoy_input_id = args[2]
@@ -2102,7 +2104,11 @@ class VJoyRemapFunctor(gremlin.base_classes.AbstractFunctor):
         button = joystick_handling.VJoyProxy()[vjoy_device_id].button(vjoy_input_id)
         button.is_pressed = True
         self.remote_client.send_button(vjoy_device_id, vjoy_input_id, True)
-        time.sleep(duration)
+        # release without blocking, the lock is held until the pulse ends
+        gremlin.clock.call_later(duration, self._end_pulse, button, vjoy_device_id, vjoy_input_id)
+
+    def _end_pulse(self, button, vjoy_device_id, vjoy_input_id):
+        ''' releases the button pressed by _fire_pulse '''
         button.is_pressed = False
         self.remote_client.send_button(vjoy_device_id, vjoy_input_id, False)
         self.lock.release()
@@ -2196,15 +2202,12 @@ class VJoyRemapFunctor(gremlin.base_classes.AbstractFunctor):
                     self.remote_client.send_axis(self.vjoy_device_id, self.vjoy_input_id, value)
             else:
                 value = -target if self.reverse else target
-                self.should_stop_thread = abs(event.value) < 0.05
+                self.should_stop_relative = abs(event.value) < 0.05
                 self.axis_delta_value = \
                     value * (self.axis_scaling / 1000.0)
-                self.thread_last_update = time.time()
-                if self.thread_running is False:
-                    if isinstance(self.thread, threading.Thread):
-                        self.thread.join()
-                    self.thread = threading.Thread(target=self.relative_axis_thread)
-                    self.thread.start()
+                self.relative_last_update = gremlin.clock.now()
+                if self.relative_running is False:
+                    self._start_relative_axis()
 
         elif self.input_type in VJoyWidget.input_type_buttons:
 
@@ -2271,7 +2274,7 @@ class VJoyRemapFunctor(gremlin.base_classes.AbstractFunctor):
                 # pulse action
                 if fire_event:
                     if not self.lock.locked():
-                        threading.Timer(0.01, self._fire_pulse, [self.vjoy_device_id, self.vjoy_input_id, self.pulse_delay/1000]).start()
+                        gremlin.clock.call_later(0.01, self._fire_pulse, self.vjoy_device_id, self.vjoy_input_id, self.pulse_delay/1000)
             elif self.action_mode == VjoyAction.VJoyInvertAxis:
                 # invert the specified axis
                 if fire_event:
@@ -2315,37 +2318,52 @@ class VJoyRemapFunctor(gremlin.base_classes.AbstractFunctor):
 
         return True
 
-    def relative_axis_thread(self):
-        self.thread_running = True
-        vjoy_dev = joystick_handling.VJoyProxy()[self.vjoy_device_id]
-        self.axis_value = vjoy_dev.axis(self.vjoy_input_id).value
-        (is_local, is_remote) = input_devices.remote_state.state
-        while self.thread_running:
-            try:
-                # If the vjoy value has was changed from what we set it to
-                # in the last iteration, terminate the thread
-                change = vjoy_dev.axis(self.vjoy_input_id).value - self.axis_value
-                if abs(change) > 0.0001:
-                    self.thread_running = False
-                    self.should_stop_thread = True
-                    return
+    def _start_relative_axis(self):
+        ''' starts moving the relative axis on every runtime tick '''
+        self.relative_running = True
+        self._relative_state = input_devices.remote_state.state
+        try:
+            vjoy_dev = joystick_handling.VJoyProxy()[self.vjoy_device_id]
+            self.axis_value = vjoy_dev.axis(self.vjoy_input_id).value
+        except gremlin.error.VJoyError:
+            self.relative_running = False
+            return
+        gremlin.tick_engine.TickEngine().add(self._relative_axis_tick)
+
+    def _relative_axis_tick(self, delta_t):
+        ''' moves the relative axis by one tick, returns False once done '''
+        (is_local, is_remote) = self._relative_state
+        try:
+            # If the vjoy value has was changed from what we set it to
+            # in the last iteration, stop moving the axis
+            vjoy_dev = joystick_handling.VJoyProxy()[self.vjoy_device_id]
+            change = vjoy_dev.axis(self.vjoy_input_id).value - self.axis_value
+            if abs(change) > 0.0001:
+                self.relative_running = False
+                self.should_stop_relative = True
+                return False
+
+            # axis scaling is expressed per 10ms
+            self.axis_value = max(
+                -1.0,
+                min(1.0, self.axis_value + self.axis_delta_value * delta_t / 0.01)
+            )
 
-                self.axis_value = max(
-                    -1.0,
-                    min(1.0, self.axis_value + self.axis_delta_value)
+            if is_local:
+                gremlin.tick_engine.TickEngine().set_vjoy_axis(
+                    self.vjoy_device_id, self.vjoy_input_id, self.axis_value
                 )
-                
-                if is_local:
-                    vjoy_dev.axis(self.vjoy_input_id).value = self.axis_value
-                if is_remote:
-                    self.remote_client.send_axis(self.vjoy_device_id, self.vjoy_input_id, self.axis_value)
-
-                if self.should_stop_thread and \
-                        self.thread_last_update + 1.0 < time.time():
-                    self.thread_running = False
-                time.sleep(0.01)
-            except gremlin.error.VJoyError:
-                self.thread_running = False
+            if is_remote:
+                self.remote_client.send_axis(self.vjoy_device_id, self.vjoy_input_id, self.axis_value)
+
+            if self.should_stop_relative and \
+                    self.relative_last_update + 1.0 < gremlin.clock.now():
+                self.relative_running = False
+                return False
+        except gremlin.error.VJoyError:
+            self.relative_running = False
+            return False
+        return True
 
     def _check_for_auto_release(self, action):
         activation_condition = None
@@ -28,8 +28,10 @@ import gremlin.shared_state
 from gremlin.ui import ui_common
 import gremlin.types
 import logging
-from gremlin.util import safe_format, safe_read, scale_to_range, clamp
+from gremlin.util import safe_format, safe_read, scale_to_range
 import gremlin.event_handler
+import gremlin.input_router
+import gremlin.merge_engine
 import gremlin.joystick_handling
 from dinput import GUID
 import qtawesome as qta
@@ -88,6 +90,8 @@ class MergeAxisEntryWidget(QtWidgets.QDockWidget):
         # tracking variables for output computations
        
         self.action_data = action_data
+        self._route_keys = [] # inputs subscribed to while the profile is not running
+        self._engine : gremlin.merge_engine.MergeEngine = None # merges the previewed axes
 
         # Setup the dock widget in which the entire dialog will sit
         self.main_widget = QtWidgets.QWidget()
@@ -242,48 +246,48 @@ class MergeAxisEntryWidget(QtWidgets.QDockWidget):
 
         self.action_data.operation = self.operation_selector.currentData()
 
-        self._joy1_value = gremlin.joystick_handling.get_curved_axis(self.action_data.joy1_guid, self.action_data.joy1_input_id)
-        self._joy2_value = gremlin.joystick_handling.get_curved_axis(self.action_data.joy2_guid, self.action_data.joy2_input_id)
+        self._build_engine()
+
+        if not gremlin.shared_state.is_running:
+            # follow the newly selected axes
+            self._subscribe()
 
 
     def _event_handler(self, event):
         ''' called when a joystick input is detected '''
-        if gremlin.shared_state.is_running or not event.is_axis:
+        if gremlin.shared_state.is_running or not event.is_axis or self._engine is None:
             return
         
         device_guid = event.device_guid
         input_id = event.identifier
 
-        update = False
         if device_guid == self.action_data.joy1_guid and input_id == self.action_data.joy1_input_id:
-            joy1_value = scale_to_range(event.raw_value, source_min = -32767, source_max = 32767, target_min = -1, target_max = 1)
-            self._joy1_value = joy1_value
-            joy2_value = self._joy2_value
-            update = True
+            index = 0
         elif device_guid == self.action_data.joy2_guid and input_id == self.action_data.joy2_input_id:
-            joy2_value = scale_to_range(event.raw_value, source_min = -32767, source_max = 32767, target_min = -1, target_max = 1) 
-            self._joy2_value = joy2_value
-            joy1_value = self._joy1_value
-            update = True
-
-
-        if update:
-            self._update_axis(joy1_value, joy2_value)
-          
-
-    def _update_axis(self, joy1_value, joy2_value):
-        operation = self.action_data.operation
-        if operation == gremlin.types.MergeAxisOperation.Sum:
-            value =  clamp(joy1_value + joy2_value,-1.0,1.0)
-        elif operation == gremlin.types.MergeAxisOperation.Maximum:
-            value = max(joy1_value, joy2_value)
-        elif operation == gremlin.types.MergeAxisOperation.Minimum:
-            value = min(joy1_value, joy2_value)
-        elif operation == gremlin.types.MergeAxisOperation.Average:
-            value = (joy1_value - joy2_value) / 2.0
+            index = 1
         else:
             return
-        
+
+        input_value = scale_to_range(event.raw_value, source_min = -32767, source_max = 32767, target_min = -1, target_max = 1)
+        value = self._engine.update(index, input_value)
+        if value is not None:
+            self._update_axis(value)
+
+    def _build_engine(self):
+        ''' compiles the merge operation of the preview from the current axis values '''
+        initial = (
+            gremlin.joystick_handling.get_curved_axis(self.action_data.joy1_guid, self.action_data.joy1_input_id),
+            gremlin.joystick_handling.get_curved_axis(self.action_data.joy2_guid, self.action_data.joy2_input_id),
+        )
+        try:
+            self._engine = gremlin.merge_engine.two_axis_engine(self.action_data.operation, initial)
+        except gremlin.error.GremlinError:
+            self._engine = None
+            return
+        self._update_axis(self._engine.compute(self._engine.values))
+
+    def _update_axis(self, value):
+        ''' displays the merged value '''
         if self.action_data.invert_output:
             r_min = -1.0
             r_max = 1.0
@@ -291,17 +295,33 @@ class MergeAxisEntryWidget(QtWidgets.QDockWidget):
             value = r_min + (target + 1.0)*((r_max - r_min)/2.0)
         self.output_widget.setValue(value)
 
+    def _subscribe(self):
+        ''' receives the events of the currently selected merged axes '''
+        self._unsubscribe()
+        # only receive the events of the two merged axes
+        self._route_keys = [
+            (self.action_data.joy1_guid, InputType.JoystickAxis, self.action_data.joy1_input_id),
+            (self.action_data.joy2_guid, InputType.JoystickAxis, self.action_data.joy2_input_id),
+        ]
+        for key in self._route_keys:
+            gremlin.input_router.subscribe(*key, self._event_handler)
+
+    def _unsubscribe(self):
+        ''' stops receiving the events of the merged axes '''
+        for key in self._route_keys:
+            gremlin.input_router.unsubscribe(*key, self._event_handler)
+        self._route_keys = []
+
     @QtCore.Slot()
     def profile_start(self):
         ''' stop processing joystick events when profile is running '''
-        el = gremlin.event_handler.EventListener()
-        el.joystick_event.disconnect(self._event_handler)
+        self._unsubscribe()
 
     @QtCore.Slot()
     def profile_stop(self):
         ''' process joystick events when profile is not running '''
-        el = gremlin.event_handler.EventListener()
-        el.joystick_event.connect(self._event_handler)
+        self._build_engine()
+        self._subscribe()
 
     def sync(self):
         ''' syncs the control to the data '''
@@ -315,10 +335,7 @@ class MergeAxisEntryWidget(QtWidgets.QDockWidget):
         index = self.operation_selector.findData(action_data.operation)
         self.operation_selector.setCurrentIndex(index)
 
-        
-        self._joy1_value = gremlin.joystick_handling.get_curved_axis(action_data.joy1_guid, action_data.joy1_input_id)
-        self._joy2_value = gremlin.joystick_handling.get_curved_axis(action_data.joy2_guid, action_data.joy2_input_id)
-        self._update_axis(self._joy1_value, self._joy2_value)
+        self._build_engine()
 
 
 class MergedAxisWidget(gremlin.ui.input_item.AbstractActionWidget):
@@ -382,9 +399,10 @@ class MergedAxisFunctor(gremlin.base_profile.AbstractContainerActionFunctor):
     def __init__(self, action):
         super().__init__(action)
         self.action_data = action
-        self._joy1_value = 0
-        self._joy2_value = 0
+        self._engine : gremlin.merge_engine.MergeEngine = None
+        self._input_index = {} # index of the engine input by (device_guid, input_id)
         self._callbacks = {}
+        self._route_keys = [] # inputs subscribed to while the profile runs
 
 
     def process_event(self, event, value):
@@ -394,54 +412,31 @@ class MergedAxisFunctor(gremlin.base_profile.AbstractContainerActionFunctor):
     def _event_handler(self, event):
         ''' internal event on axis input - determine if we should fire an update or not '''
 
-        if not event.is_axis:
-            return 
+        index = self._input_index.get((event.device_guid, event.identifier))
+        if index is None:
+            return
 
-        device_guid = event.device_guid
-        input_id = event.identifier
+        input_value = scale_to_range(event.raw_value, source_min = -32767, source_max = 32767, target_min = -1, target_max = 1)
+        value = self._engine.update(index, input_value)
+        if value is None:
+            # merged value did not change
+            return
 
-        update = False
-        if device_guid == self.action_data.joy1_guid and input_id == self.action_data.joy1_input_id:
-            joy1_value = scale_to_range(event.raw_value, source_min = -32767, source_max = 32767, target_min = -1, target_max = 1)
-            self._joy1_value = joy1_value
-            joy2_value = self._joy2_value
-            update = True
-        elif device_guid == self.action_data.joy2_guid and input_id == self.action_data.joy2_input_id:
-            joy2_value = scale_to_range(event.raw_value, source_min = -32767, source_max = 32767, target_min = -1, target_max = 1) 
-            self._joy2_value = joy2_value
-            joy1_value = self._joy1_value
-            update = True
-        
         if self.action_data.invert_output:
-            r_min = -1.0
-            r_max = 1.0
-            target = -value
-            value = r_min + (target + 1.0)*((r_max - r_min)/2.0)            
-
-
-        if update:
-            operation = self.action_data.operation
-            if operation == gremlin.types.MergeAxisOperation.Sum:
-                value =  clamp(joy1_value + joy2_value,-1.0,1.0)
-            elif operation == gremlin.types.MergeAxisOperation.Maximum:
-                value = max(joy1_value, joy2_value)
-            elif operation == gremlin.types.MergeAxisOperation.Minimum:
-                value = min(joy1_value, joy2_value)
-            elif operation == gremlin.types.MergeAxisOperation.Average:
-                value = (joy1_value - joy2_value) / 2.0            
-
-            event.raw_value = value
-            shared_value = gremlin.actions.Value(value)
-
-            containers = self.action_data.item_data.containers
-            container: gremlin.base_profile.AbstractContainer
-            for container in containers:
-                if container in self._callbacks.keys():
-                    callbacks = self._callbacks[container]
-                    for cb in callbacks:
-                        for functor in cb.callback.execution_graph.functors:
-                            if functor.enabled:
-                                functor.process_event(event, shared_value)
+            value = -value
+
+        event.raw_value = value
+        shared_value = gremlin.actions.Value(value)
+
+        containers = self.action_data.item_data.containers
+        container: gremlin.base_profile.AbstractContainer
+        for container in containers:
+            if container in self._callbacks.keys():
+                callbacks = self._callbacks[container]
+                for cb in callbacks:
+                    for functor in cb.callback.execution_graph.functors:
+                        if functor.enabled:
+                            functor.process_event(event, shared_value)
 
     @QtCore.Slot()
     def profile_start(self):
@@ -454,11 +449,22 @@ class MergedAxisFunctor(gremlin.base_profile.AbstractContainerActionFunctor):
 
         self._callbacks = callbacks_map  
 
-        self._joy1_value = gremlin.joystick_handling.get_curved_axis(self.action_data.joy1_guid, self.action_data.joy1_input_id)
-        self._joy2_value = gremlin.joystick_handling.get_curved_axis(self.action_data.joy2_guid, self.action_data.joy2_input_id)
+        inputs = [
+            (self.action_data.joy1_guid, self.action_data.joy1_input_id),
+            (self.action_data.joy2_guid, self.action_data.joy2_input_id),
+        ]
+        self._input_index = {}
+        for index, key in enumerate(inputs):
+            self._input_index.setdefault(key, index)
+
+        # the merge operation is compiled once, partner axis values are cached by the engine
+        initial = [gremlin.joystick_handling.get_curved_axis(device_guid, input_id) for device_guid, input_id in inputs]
+        self._engine = gremlin.merge_engine.two_axis_engine(self.action_data.operation, initial)
 
-        el = gremlin.event_handler.EventListener()
-        el.joystick_event.connect(self._event_handler)
+        # only receive the events of the merged axes
+        self._route_keys = [(device_guid, InputType.JoystickAxis, input_id) for device_guid, input_id in inputs]
+        for key in self._route_keys:
+            gremlin.input_router.subscribe(*key, self._event_handler)
 
 
  
@@ -467,8 +473,9 @@ class MergedAxisFunctor(gremlin.base_profile.AbstractContainerActionFunctor):
         ''' profile stops - cleanup '''
 
 
-        el = gremlin.event_handler.EventListener()
-        el.joystick_event.disconnect(self._event_handler)
+        for key in self._route_keys:
+            gremlin.input_router.unsubscribe(*key, self._event_handler)
+        self._route_keys = []
 
         # clean up callback map
         self._callbacks.clear()
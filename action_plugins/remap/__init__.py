@@ -17,8 +17,6 @@
 
 
 import logging
-import threading
-import time
 from lxml import etree as ElementTree
 
 from gremlin.util import load_icon
@@ -28,7 +26,9 @@ from gremlin.base_classes import InputActionCondition
 from gremlin.input_types import InputType
 from gremlin import input_devices, joystick_handling, util
 from gremlin.error import ProfileError
+import gremlin.clock
 import gremlin.plugin_manager
+import gremlin.tick_engine
 from gremlin.profile import safe_format, safe_read
 from gremlin.ui import ui_common
 import gremlin.ui.input_item
@@ -243,10 +243,9 @@ class RemapFunctor(gremlin.base_classes.AbstractFunctor):
         self.is_axis = action.is_axis
 
         self.needs_auto_release = self._check_for_auto_release(action)
-        self.thread_running = False
-        self.should_stop_thread = False
-        self.thread_last_update = time.time()
-        self.thread = None
+        self.relative_running = False
+        self.should_stop_relative = False
+        self.relative_last_update = gremlin.clock.now()
         self.axis_delta_value = 0.0
         self.axis_value = 0.0
         self.test = False
@@ -257,17 +256,12 @@ class RemapFunctor(gremlin.base_classes.AbstractFunctor):
                 joystick_handling.VJoyProxy()[self.vjoy_device_id] \
                     .axis(self.vjoy_input_id).value = value.current
             else:
-                self.should_stop_thread = abs(event.value) < 0.05
+                self.should_stop_relative = abs(event.value) < 0.05
                 self.axis_delta_value = \
                     value.current * (self.axis_scaling / 1000.0)
-                self.thread_last_update = time.time()
-                if self.thread_running is False:
-                    if isinstance(self.thread, threading.Thread):
-                        self.thread.join()
-                    self.thread = threading.Thread(
-                        target=self.relative_axis_thread
-                    )
-                    self.thread.start()
+                self.relative_last_update = gremlin.clock.now()
+                if self.relative_running is False:
+                    self._start_relative_axis()
 
         elif self.input_type == InputType.JoystickButton:
             if event.event_type in [InputType.JoystickButton, InputType.Keyboard] \
@@ -297,32 +291,44 @@ class RemapFunctor(gremlin.base_classes.AbstractFunctor):
 
         return True
 
-    def relative_axis_thread(self):
-        self.thread_running = True
-        vjoy_dev = joystick_handling.VJoyProxy()[self.vjoy_device_id]
-        self.axis_value = vjoy_dev.axis(self.vjoy_input_id).value
-        while self.thread_running:
-            try:
-                # If the vjoy value has was changed from what we set it to
-                # in the last iteration, terminate the thread
-                change = vjoy_dev.axis(self.vjoy_input_id).value - self.axis_value
-                if abs(change) > 0.0001:
-                    self.thread_running = False
-                    self.should_stop_thread = True
-                    return
-
-                self.axis_value = max(
-                    -1.0,
-                    min(1.0, self.axis_value + self.axis_delta_value)
-                )
-                vjoy_dev.axis(self.vjoy_input_id).value = self.axis_value
-
-                if self.should_stop_thread and \
-                        self.thread_last_update + 1.0 < time.time():
-                    self.thread_running = False
-                time.sleep(0.01)
-            except gremlin.error.VJoyError:
-                self.thread_running = False
+    def _start_relative_axis(self):
+        self.relative_running = True
+        try:
+            vjoy_dev = joystick_handling.VJoyProxy()[self.vjoy_device_id]
+            self.axis_value = vjoy_dev.axis(self.vjoy_input_id).value
+        except gremlin.error.VJoyError:
+            self.relative_running = False
+            return
+        gremlin.tick_engine.TickEngine().add(self._relative_axis_tick)
+
+    def _relative_axis_tick(self, delta_t):
+        try:
+            # If the vjoy value has was changed from what we set it to
+            # in the last iteration, stop moving the axis
+            vjoy_dev = joystick_handling.VJoyProxy()[self.vjoy_device_id]
+            change = vjoy_dev.axis(self.vjoy_input_id).value - self.axis_value
+            if abs(change) > 0.0001:
+                self.relative_running = False
+                self.should_stop_relative = True
+                return False
+
+            # axis scaling is expressed per 10ms
+            self.axis_value = max(
+                -1.0,
+                min(1.0, self.axis_value + self.axis_delta_value * delta_t / 0.01)
+            )
+            gremlin.tick_engine.TickEngine().set_vjoy_axis(
+                self.vjoy_device_id, self.vjoy_input_id, self.axis_value
+            )
+
+            if self.should_stop_relative and \
+                    self.relative_last_update + 1.0 < gremlin.clock.now():
+                self.relative_running = False
+                return False
+        except gremlin.error.VJoyError:
+            self.relative_running = False
+            return False
+        return True
 
     def _check_for_auto_release(self, action):
         activation_condition = None
@@ -1409,13 +1409,6 @@ class ResponseCurveFunctor(gremlin.base_profile.AbstractFunctor):
 
     def __init__(self, action):
         super().__init__(action)
-        self.deadzone_fn = lambda value: gremlin.input_devices.deadzone(
-            value,
-            action.deadzone[0],
-            action.deadzone[1],
-            action.deadzone[2],
-            action.deadzone[3]
-        )
         if action.mapping_type == "cubic-spline":
             self.response_fn = gremlin.spline.CubicSpline(action.control_points)
         elif action.mapping_type == "cubic-bezier-spline":
@@ -1423,10 +1416,20 @@ class ResponseCurveFunctor(gremlin.base_profile.AbstractFunctor):
                 gremlin.spline.CubicBezierSpline(action.control_points)
         else:
             raise gremlin.error.GremlinError("Invalid curve type")
+        self.deadzone = list(action.deadzone)
+        self.lookup = None
+
+    def profile_start(self):
+        # bake the deadzone and the curve into lookup tables
+        self.lookup = gremlin.spline.DeadzoneLookupTable(
+            self.response_fn,
+            self.deadzone
+        )
 
     def process_event(self, event, value):
-        value.current = self.response_fn(self.deadzone_fn(value.current))
-        # print ("response curve")
+        if self.lookup is None:
+            self.profile_start()
+        value.current = self.lookup(value.current)
         return True
 
 
@@ -114,10 +114,21 @@ class ResponseCurveExFunctor(gremlin.base_profile.AbstractFunctor):
         super().__init__(action_data)
         self.curve_data = action_data.curve_data
         self.curve_data.curve_update()
+        self.lookup = None
+
+    def profile_start(self):
+        # bake the deadzone and the curve into lookup tables
+        self.curve_data.curve_update()
+        self.lookup = gremlin.spline.DeadzoneLookupTable(
+            self.curve_data.response_fn,
+            self.curve_data.deadzone
+        )
 
     def process_event(self, event, value):
         if event.is_axis:
-            value.current = self.curve_data.curve_value(value.current)
+            if self.lookup is None:
+                self.profile_start()
+            value.current = self.lookup(value.current)
         return True
 
 
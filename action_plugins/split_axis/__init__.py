@@ -163,35 +163,69 @@ class SplitAxisWidget(gremlin.ui.input_item.AbstractActionWidget):
         return lambda data: self.save_vjoy_selection(axis_id, data)
 
 
+def split_transform(center_point):
+    """Returns the function splitting an axis value at the center point.
+
+    Both halves are mapped linearly onto the full range of their output
+    axis: the low output moves from 1 to -1 as the input moves from -1 to the
+    center point, the high output moves from -1 to 1 as the input moves from
+    the center point to 1. The output of the inactive half is -1.
+
+    :param center_point input value at which the axis is split
+    :return function mapping an input value to the (low, high) outputs
+    """
+    # slopes of both halves, guarding against division by zero
+    low_scale = -2.0 / max(1.0 + center_point, 0.001)
+    high_scale = 2.0 / max(1.0 - center_point, 0.001)
+
+    def split(value):
+        if value < center_point:
+            return (value - center_point) * low_scale - 1.0, -1.0
+        return -1.0, (value - center_point) * high_scale - 1.0
+    return split
+
+
 class SplitAxisFunctor(gremlin.base_profile.AbstractFunctor):
 
     def __init__(self, action):
         super().__init__(action)
         self.action = action
         self.vjoy = gremlin.joystick_handling.VJoyProxy()
+        self.split = split_transform(action.center_point)
+        self._reset_outputs()
+
+    def _reset_outputs(self):
+        ''' forgets the vjoy axes and the values last written to them '''
+        self._low_axis = None
+        self._high_axis = None
+        self._low_value = None
+        self._high_value = None
+
+    def profile_start(self):
+        self._reset_outputs()
+
+    def profile_stop(self):
+        self._reset_outputs()
 
     def process_event(self, event, value):
-        if value.current < self.action.center_point:
-            value_range = -1.0 - self.action.center_point
+        low, high = self.split(value.current)
 
-            self.vjoy[self.action.device_low_vjoy_id].axis(
+        if self._low_axis is None:
+            # resolve the vjoy axes once
+            self._low_axis = self.vjoy[self.action.device_low_vjoy_id].axis(
                 self.action.device_low_axis
-            ).value = ((value.current - self.action.center_point) /
-                       value_range) * 2.0 - 1.0
-            self.vjoy[self.action.device_high_vjoy_id].axis(
+            )
+            self._high_axis = self.vjoy[self.action.device_high_vjoy_id].axis(
                 self.action.device_high_axis
-            ).value = -1.0
-        else:
-            # Compute value range guarding against division by zero
-            value_range = max(1.0 - self.action.center_point, 0.001)
+            )
 
-            self.vjoy[self.action.device_high_vjoy_id].axis(
-                self.action.device_high_axis
-            ).value = ((value.current - self.action.center_point) /
-                       value_range) * 2.0 - 1.0
-            self.vjoy[self.action.device_low_vjoy_id].axis(
-                self.action.device_low_axis
-            ).value = -1.0
+        # only write the outputs that changed
+        if low != self._low_value:
+            self._low_axis.value = low
+            self._low_value = low
+        if high != self._high_value:
+            self._high_axis.value = high
+            self._high_value = high
 
         return True
 
@@ -18,10 +18,10 @@
 from PySide6 import QtWidgets
 
 import logging
-import time
 from lxml import etree as ElementTree
 
 import gremlin
+import gremlin.clock
 import gremlin.ui.ui_common
 import gremlin.ui.input_item
 from gremlin.ui.input_item import AbstractContainerWidget, AbstractActionWidget
@@ -182,9 +182,10 @@ class ChainContainerFunctor(gremlin.base_classes.AbstractFunctor):
 
     def process_event(self, event, value):
         if self.timeout > 0.0:
-            if self.last_execution + self.timeout < time.time():
+            now = gremlin.clock.now()
+            if self.last_execution + self.timeout < now:
                 self.index = 0
-            self.last_execution = time.time()
+            self.last_execution = now
 
         result = self.action_sets[self.index].process_event(event, value)
 
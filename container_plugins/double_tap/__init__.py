@@ -15,15 +15,13 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-import copy
 import logging
-import threading
-import time
 from lxml import etree as ElementTree
 
 from PySide6 import QtWidgets
 
 import gremlin
+import gremlin.gesture
 import gremlin.ui.ui_common
 import gremlin.ui.input_item
 from gremlin.ui.input_item import AbstractContainerWidget
@@ -238,12 +236,18 @@ class DoubleTapContainerFunctor(gremlin.base_classes.AbstractFunctor):
         self.delay = container.delay
         self.activate_on = container.activate_on
 
-        self.start_time = 0
-        self.double_action_timer = None
-        self.tap_type = None
-        self.value_press = None
-        self.event_press = None
-        self.processed_single_tap = True
+        self.machine = gremlin.gesture.Gesture(
+            gremlin.gesture.double_tap_spec(self.activate_on),
+            {"delay": self.delay},
+            {"single": self.single_tap.process_event, "double": self.double_tap.process_event}
+        )
+
+    def profile_start(self):
+        # reset any prior state before start
+        self.machine.reset()
+
+    def profile_stop(self):
+        self.machine.reset()
 
     def process_event(self, event, value):
         # TODO: Currently this does not handle hat or axis events, however
@@ -254,61 +258,9 @@ class DoubleTapContainerFunctor(gremlin.base_classes.AbstractFunctor):
             )
             return False
 
-        if self.processed_single_tap:
-                
-                # Copy state when input is pressed
-                if value.current:
-                    self.value_press = copy.deepcopy(value)
-                    self.event_press = event.clone()
-
-                # Execute double tap logic
-                if value.current:
-                    # Second activation within the delay, i.e. second tap
-                    if (self.start_time + self.delay) > time.time():
-                        # Prevent repeated double taps from repeated button presses
-                        self.start_time = 0
-                        self.tap_type = "double"
-                        if self.activate_on == "exclusive":
-                            self.double_action_timer.cancel()
-                    # First acitvation within the delay, i.e. first tap
-                    else:
-                        self.start_time = time.time()
-                        self.tap_type = "single"
-                        if self.activate_on == "exclusive":
-                            self.double_action_timer = \
-                                threading.Timer(self.delay, self._single_tap)
-                            self.double_action_timer.start()
-
-                # Input is being released at this point
-                elif self.double_action_timer and self.double_action_timer.is_alive():
-                    # if releasing single tap before delay
-                    # we will want to send a short press and release
-                    self.double_action_timer.cancel()
-                    self.double_action_timer = threading.Timer(
-                        (self.start_time + self.delay) - time.time(),
-                        lambda: self._single_tap(event, value)
-                    )
-                    self.double_action_timer.start()
-
-                if self.tap_type == "double":
-                    self.double_tap.process_event(event, value)
-                    if self.activate_on == "combined":
-                        self.single_tap.process_event(event, value)
-                elif self.activate_on != "exclusive":
-                    self.single_tap.process_event(event, value)
-        
-        else:
-            self.single_tap.process_event(event, value)
-            self.processed_single_tap = True
-
-    def _single_tap(self, event_release=None, value_release=None):
-        """Callback executed, when the delay expires."""
-        self.processed_single_tap = False
-        self.single_tap.process_event(self.event_press, self.value_press)
-        if event_release:
-            time.sleep(0.05)
-            self.single_tap.process_event(event_release, value_release)
-            self.processed_single_tap = True
+        self.machine.process(event, value)
+        return True
+
 
 class DoubleTapContainer(AbstractContainer):
 
@@ -20,6 +20,7 @@ import logging
 from lxml import etree as ElementTree
 import gremlin.actions
 import gremlin.event_handler
+import gremlin.interval_index
 from gremlin.input_types import InputType
 from gremlin.util import rad2deg, get_guid
 from gremlin.profile import safe_format, safe_read
@@ -426,7 +427,6 @@ class RangeContainerFunctor(gremlin.base_classes.AbstractFunctor):
 
         self.action_data = action_data
         self.any_change_mode = action_data.any_change_mode
-        self.reset_range()
 
         self.any_change_delta =  action_data.any_change_delta / 200 # 2 * 100 because the range is -1 to +1, so 2 total, to actual range value
         self.range_min = action_data.range_min
@@ -437,16 +437,77 @@ class RangeContainerFunctor(gremlin.base_classes.AbstractFunctor):
             self.range_min = self.range_max
             self.range_max = tmp
 
-        # latch all the range containers
-        self.latched_functors = []
-        self.latched_loaded = False
-        self.last_target = -2.0
+        # ranges of this container, the symmetrical range is added if enabled
+        self.ranges = [(self.range_min, self.range_max)]
+        if action_data.symmetrical:
+            sym_min = -self.range_max
+            sym_max = -self.range_min
+            self.ranges.append((sym_min, sym_max))
 
+        # shared interval index of the axis this container is on
+        self._index_key = None
+        self._index : gremlin.interval_index.IntervalIndex = None
+        self.reset_range()
 
     def reset_range(self):
         ''' resets the range trigger '''
-        self.last_range_min = -2.0
-        self.last_range_max = -2.0
+        self.last_slot = None # slot of the interval index the last value was in
+        self.last_target = -2.0
+
+    def _register_index(self, key):
+        ''' registers the ranges of this container with the interval index of an axis '''
+        registry = gremlin.interval_index.IntervalIndexRegistry()
+        if self._index_key is not None:
+            registry.remove(self._index_key, self)
+        container : RangeContainer = self.action_data
+        self._index_key = key
+        self._index = registry.get(key)
+        self._index.add(self, [
+            (range_min, range_max, container.range_min_included, container.range_max_included)
+            for range_min, range_max in self.ranges
+        ])
+        self.reset_range()
+
+    def profile_start(self):
+        ''' builds the interval index of the axis before any input is received '''
+        self.action_data.exit_range_triggers.clear()
+        if not self.any_change_mode:
+            self._register_index((self.action_data.hardware_device_guid, self.action_data.hardware_input_id))
+
+    def profile_stop(self):
+        if self._index_key is not None:
+            gremlin.interval_index.IntervalIndexRegistry().remove(self._index_key, self)
+            self._index_key = None
+            self._index = None
+        self.reset_range()
+
+    def _press(self, event):
+        ''' executes the actions of the container as a button press and registers their release '''
+        event_clone = event.clone()
+        event_clone.event_type = InputType.JoystickButton
+        event_clone.identifier = 1 
+        event_clone.is_axis = False # make this a button event 
+        event_clone.is_pressed = True # button press is ON
+        event_clone.is_virtual_button = True # indicate this is a virtual button press
+        value_clone = gremlin.actions.Value(True, True)
+        for action in self.action_sets:
+            # execute the action
+            action.process_event(event_clone, value_clone)
+            # register a range exit trigger
+            exit_trigger = RangeReleaseTrigger(self.ranges, event_clone, action)
+            self.action_data.exit_range_triggers.append(exit_trigger)
+
+    def _release(self, value):
+        ''' releases the actions pressed when the range was entered '''
+        exit_triggers = self.action_data.exit_range_triggers
+        self.action_data.exit_range_triggers = []
+        for exit_trigger in exit_triggers:
+            # trigger the release
+            release_event = exit_trigger.event
+            release_event.is_pressed = False # trigger button based values OFF
+            release_event.value = value
+            release_value = gremlin.actions.Value(False,False)
+            exit_trigger.action.process_event(release_event, release_value)
 
     def process_event(self, event, value):
         """Executes the content with the provided data.
@@ -459,141 +520,35 @@ class RangeContainerFunctor(gremlin.base_classes.AbstractFunctor):
         if not event.is_axis: 
             return
         
-        # process release triggers
-        releases = set()
-        for exit_trigger in self.action_data.exit_range_triggers:
-            for range_min, range_max in exit_trigger.ranges:
-                if value.current < range_min or value.current > range_max:
-                    # value is out of a triggered range - process the release trigger for that range
-                    releases.add(exit_trigger)
-                elif value.current >= range_min and value.current <= range_max:
-                    # no further processing if the value is in range of a triggered range
-                    return True
-
-        for exit_trigger in releases:
-            self.action_data.exit_range_triggers.remove(exit_trigger)
-            #print (f"process release event: {exit_trigger.id}")
-
-            # trigger the release
-            release_event = exit_trigger.event
-            release_event.is_pressed = False # trigger button based values OFF
-            action = exit_trigger.action
-            release_event.value = value.current
-            
-            release_value = gremlin.actions.Value(False,False)
-            action.process_event(release_event, release_value)
-
-                
-            
-
-
-
-        trigger = False
-
-        # latch all other functors
-        if not self.latched_loaded:
-            container_plugins = gremlin.plugin_manager.ContainerPlugins()
-            for functor in container_plugins.functors:
-                if isinstance(functor, RangeContainerFunctor) and functor != self:
-                    self.latched_functors.append(functor)
-
-            self.latched_loaded = True
-
-
         target = value.current
-        in_range = False
 
         if self.any_change_mode:
             # trigger if change meets the deflection delta
-            trigger = abs(target - self.last_target) >= self.any_change_delta
-        else:
-
-            # verify the event is in the correct range
-            container : RangeContainer
-            container = self.action_data
-
-            range_min = self.range_min
-            range_max = self.range_max
-
-
-            #print (f"Add range: {range_min:0.4f} {range_max:0.4f}")
-            ranges = [(range_min, range_max)]
-
-            if container.symmetrical:
-                # duplicate the ranges for symmetrical
-                sym_min = -range_min
-                sym_max = -range_max
-                if sym_max < sym_min:
-                    sym_max, sym_min = sym_min, sym_max
-
-                #print (f"Add range: {sym_min:0.4f} {sym_max:0.4f}")
-                ranges.append((sym_min, sym_max))
-
-
-            
-            for (range_min, range_max) in ranges:
-                if target < range_min or target > range_max: 
-                    continue
-                if not container.range_min_included:
-                    if target == range_min:
-                        continue
-                if not container.range_max_included:
-                    if target == range_max:
-                        continue
-
-                #syslog.info(f"{target:0.3f} range {range_min:0.3f} {range_max:0.3f} bracket {self.last_range_min:0.3f} {self.last_range_max:0.3f}")    
-                #print (f"{target:0.4f} is in range")
-                in_range = True
-                break
-
-            if in_range:
-                # axis value is in a bracket range - make sure it hasn't been processed already
-                trigger = True # self.last_range_min != range_min and self.last_range_max != range_max
-
-                for exit_trigger in self.action_data.exit_range_triggers:
-                    for range_min, range_max in exit_trigger.ranges:
-                        if target < range_min or target > range_max: 
-                            continue
-                        if not container.range_min_included:
-                            if target == range_min:
-                                continue
-                        if not container.range_max_included:
-                            if target == range_max:
-                                continue
-                        trigger = False
-                        break
-            # else:
-            #     print (f"{target:0.4f} not in range")
-
-        if trigger:
-            #syslog.info("trigger!")
-            event_clone = event.clone()
-            event_clone.event_type = InputType.JoystickButton
-            event_clone.identifier = 1 
-            event_clone.is_axis = False # make this a button event 
-            event_clone.is_pressed = True # button press is ON
-            event_clone.is_virtual_button = True # indicate this is a virtual button press
-            value_clone = gremlin.actions.Value(True, True)
-            for action in self.action_sets:
-                # execute the action
-                action.process_event(event_clone, value_clone)
-                # register a range exit trigger
-                exit_trigger = RangeReleaseTrigger(ranges, event_clone, action)
-                self.action_data.exit_range_triggers.append(exit_trigger)
-                #print (f"process press event: {exit_trigger.id}")
-            if in_range:
-                self.last_range_min = range_min
-                self.last_range_max = range_max
-
-            if self.latched_functors:
-                # reset the other latched functors of their range trigger to indicate we got our own range
-                for functor in self.latched_functors:
-                    functor.reset_range()
-
-            self.last_target = target
-
-            
-            
+            if abs(target - self.last_target) >= self.any_change_delta:
+                self._release(target)
+                self._press(event)
+                self.last_target = target
+            return True
+
+        key = (event.device_guid, event.identifier)
+        if key != self._index_key:
+            # the axis differs from the one the container is mapped to (remapped input)
+            self._register_index(key)
+
+        # locate the value - nothing to do unless it moved to another slot of the index
+        slot, owners = self._index.lookup(target)
+        if slot == self.last_slot:
+            return True
+        self.last_slot = slot
+
+        in_range = self in owners
+        if self.action_data.exit_range_triggers:
+            if not in_range:
+                # the range was exited
+                self._release(target)
+        elif in_range:
+            # the range was entered
+            self._press(event)
 
         return True
 
@@ -18,14 +18,13 @@
 
 import copy
 import logging
-import threading
-import time
 from lxml import etree as ElementTree
 
 from PySide6 import QtWidgets
 
 
 import gremlin
+import gremlin.gesture
 import gremlin.ui.ui_common
 import gremlin.ui.input_item
 from gremlin.ui.input_item import AbstractContainerWidget
@@ -176,16 +175,24 @@ class SmartToggleContainerFunctor(gremlin.base_classes.AbstractFunctor):
             container.action_sets[0]
         )
         self.delay = container.delay
-        self.release_value = None
-        self.release_event = None
-        self.mode = None
-        self.activation_time = 0.0
+        self.machine = gremlin.gesture.Gesture(
+            gremlin.gesture.smart_toggle_spec(),
+            {"delay": self.delay},
+            {"output": self.action_set.process_event}
+        )
 
         # Disable the auto release feature which clashes with the toggle logic
         for functor in self.action_set.functors:
             if "needs_auto_release" in functor.__dict__:
                 functor.needs_auto_release = False
 
+    def profile_start(self):
+        # reset any prior state before start
+        self.machine.reset()
+
+    def profile_stop(self):
+        self.machine.reset()
+
     def process_event(self, event, value):
         # TODO: Currently this does not handle hat or axis events, however
         #       virtual buttons created on those inputs is supported
@@ -195,35 +202,7 @@ class SmartToggleContainerFunctor(gremlin.base_classes.AbstractFunctor):
             )
             return False
 
-        if value.current:
-            # Currently not in either toggle or hold mode
-            if self.mode is None:
-                self.action_set.process_event(event, value)
-                self.activation_time = time.time()
-
-            # Run release logic when the second press happens in toggle mode
-            elif self.mode == "toggle":
-                self.action_set.process_event(
-                    self.release_event,
-                    self.release_value
-                )
-                self.activation_time = 0.0
-                self.mode = None
-        else:
-            # If the input is release before the hold timeout occurs switch
-            # to toggle mode and store the event for artificial release on
-            # next input press
-            if self.activation_time + self.delay > time.time():
-                self.mode = "toggle"
-                self.release_event = event.clone()
-                self.release_value = value
-
-            # Run release logic when the release event occurs in hold mode
-            else:
-                self.action_set.process_event(event, value)
-                self.activation_time = 0.0
-                self.mode = None
-
+        self.machine.process(event, value)
         return True
 
 
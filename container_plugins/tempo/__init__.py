@@ -15,15 +15,13 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-import copy
 import logging
-import threading
-import time
 from lxml import etree as ElementTree
 
 from PySide6 import QtWidgets
 
 import gremlin
+import gremlin.gesture
 import gremlin.ui.ui_common
 from gremlin.ui.input_item import AbstractContainerWidget
 from gremlin.base_profile import AbstractContainer
@@ -232,22 +230,18 @@ class TempoContainerFunctor(gremlin.base_classes.AbstractFunctor):
         )
         self.delay = container.delay
         self.activate_on = container.activate_on
+        self.machine = gremlin.gesture.Gesture(
+            gremlin.gesture.tempo_spec(self.activate_on),
+            {"delay": self.delay},
+            {"short": self.short_set.process_event, "long": self.long_set.process_event}
+        )
 
-        self.start_time = 0
-        self.timer = None
-        self.value_press = None
-        self.event_press = None
-
-        el = gremlin.event_handler.EventListener()
-        el.profile_start.connect(self._profile_start)
-
-    def _profile_start(self):
-        # reset any prior values before start
-        self.start_time = 0
-        self.timer = None
-        self.value_press = None
-        self.event_press = None
+    def profile_start(self):
+        # reset any prior state before start
+        self.machine.reset()
 
+    def profile_stop(self):
+        self.machine.reset()
 
     def process_event(self, event, value):
         # TODO: Currently this does not handle hat or axis events, however
@@ -258,60 +252,9 @@ class TempoContainerFunctor(gremlin.base_classes.AbstractFunctor):
             )
             return False
 
-        # Copy state when input is pressed
-        if value.current:
-            self.value_press = copy.deepcopy(value)
-            self.event_press = event.clone()
-
-        # Execute tempo logic
-        if value.current:
-            self.start_time = time.time()
-            self.timer = threading.Timer(self.delay, self._long_press)
-            self.timer.start()
-
-            if self.activate_on == "press":
-                self.short_set.process_event(self.event_press, self.value_press)
-        else:
-            # Short press
-            if (self.start_time + self.delay) > time.time():
-                if self.timer:
-                    self.timer.cancel()
-
-                if self.activate_on == "release":
-                    threading.Thread(target=lambda: self._short_press(
-                        self.event_press,
-                        self.value_press,
-                        event,
-                        value
-                    )).start()
-                else:
-                    self.short_set.process_event(event, value)
-            # Long press
-            else:
-                self.long_set.process_event(event, value)
-                if self.activate_on == "press":
-                    self.short_set.process_event(event, value)
-
-            self.timer = None
-
+        self.machine.process(event, value)
         return True
 
-    def _short_press(self, event_p, value_p, event_r, value_r):
-        """Callback executed for a short press action.
-
-        :param event_p event to press the action
-        :param value_p value to press the action
-        :param event_r event to release the action
-        :param value_r value to release the action
-        """
-        self.short_set.process_event(event_p, value_p)
-        time.sleep(0.05)
-        self.short_set.process_event(event_r, value_r)
-
-    def _long_press(self):
-        """Callback executed, when the delay expires."""
-        self.long_set.process_event(self.event_press, self.value_press)
-
 
 class TempoContainer(AbstractContainer):
 
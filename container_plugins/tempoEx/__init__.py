@@ -15,10 +15,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-import copy
 import logging
-import threading
-import time
 from lxml import etree as ElementTree
 
 from PySide6 import QtWidgets
@@ -28,7 +25,9 @@ import gremlin.base_conditions
 from  gremlin.clipboard import Clipboard
 import gremlin
 import gremlin.base_classes
+import gremlin.clock
 import gremlin.plugin_manager
+import gremlin.gesture
 import gremlin.ui.ui_common
 import gremlin.ui.input_item
 from gremlin.profile import safe_format, safe_read
@@ -376,10 +375,6 @@ class TempoExContainerFunctor(gremlin.base_classes.AbstractFunctor):
         self.delay = container.delay
         self.activate_on = container.activate_on
 
-        self.start_time = 0
-        self.timer = None
-        self.value_press = None
-        self.event_press = None
         self.chain_short = True # chain by default
         self.chain_long = True # chain by default
         self.short_index = 0
@@ -389,6 +384,11 @@ class TempoExContainerFunctor(gremlin.base_classes.AbstractFunctor):
         self.last_short_value = None
         self.short_timeout = container.timeout
         self.long_timeout = container.timeout
+        self.machine = gremlin.gesture.Gesture(
+            gremlin.gesture.tempo_spec(self.activate_on),
+            {"delay": self.delay},
+            {"short": self._trigger_short_press, "long": self._trigger_long_press}
+        )
 
         # Determine if we need to switch the action index after a press or
         # release event. Only for container conditions this is necessary to
@@ -404,10 +404,7 @@ class TempoExContainerFunctor(gremlin.base_classes.AbstractFunctor):
 
     def profile_start(self):
         # reset any prior values before start
-        self.start_time = 0
-        self.timer = None
-        self.value_press = None
-        self.event_press = None
+        self.machine.reset()
         self.chain_short = True # chain by default
         self.chain_long = True # chain by default
         self.short_index = 0
@@ -422,10 +419,11 @@ class TempoExContainerFunctor(gremlin.base_classes.AbstractFunctor):
         ''' triggers a short press '''
 
         if self.short_timeout > 0.0:
-            if self.last_short_execution + self.short_timeout < time.time():
+            now = gremlin.clock.now()
+            if self.last_short_execution + self.short_timeout < now:
                 # logging.getLogger("system").info(f"reset short index")
                 self.short_index = 0
-            self.last_short_execution = time.time()
+            self.last_short_execution = now
 
         if self.short_index < len(self.short_set):
             # logging.getLogger("system").info(f"execute short press {self.short_index}")
@@ -442,10 +440,11 @@ class TempoExContainerFunctor(gremlin.base_classes.AbstractFunctor):
         ''' triggers a long press '''
 
         if self.long_timeout > 0.0:
-            if self.last_long_execution + self.long_timeout < time.time():
+            now = gremlin.clock.now()
+            if self.last_long_execution + self.long_timeout < now:
                 # logging.getLogger("system").info(f"reset long index")
                 self.long_index = 0
-            self.last_long_execution = time.time()
+            self.last_long_execution = now
 
         if self.long_index < len(self.long_set):
             # logging.getLogger("system").info(f"execute long press {self.long_index}")
@@ -465,69 +464,11 @@ class TempoExContainerFunctor(gremlin.base_classes.AbstractFunctor):
             )
             return False
 
-        # Copy state when input is pressed
-        if value.current:
-            self.value_press = copy.deepcopy(value)
-            self.event_press = event.clone()
-
-        # Execute tempoEx logic
-        if value.current:
-            # raw button was pressed - start timer for long/short press
-            self.start_time = time.time()
-            self.timer = threading.Timer(self.delay, self._long_press)
-            self.timer.start()
-
-            if self.activate_on == "press":
-                # logging.getLogger("system").info(f"execute short press (activation mode = press)")
-                self._trigger_short_press(self.event_press, self.value_press)
-
-        else:
-            # raw button was released
-            # Short press (activate on button release)
-            if (self.start_time + self.delay) > time.time():
-                self.timer.cancel() # kill long press timer - use short press
-
-                if self.activate_on == "release":
-                    threading.Thread(target=lambda: self._short_press(
-                        self.short_index,                                            
-                        self.event_press,
-                        self.value_press,
-                        event,
-                        value
-                    )).start()
-                else:
-                    self._trigger_short_press(event, value)
-                
-            else:
-                # Long press
-                self._trigger_long_press(event, value)
-                if self.activate_on == "press":
-                    # logging.getLogger("system").info(f"execute short press (activation mode = press) in LONG PRESS")
-                    self._trigger_short_press(event, value)
-
-
-            self.timer = None
-
+        self.machine.process(event, value)
         return True
 
-    def _short_press(self, index, event_p, value_p, event_r, value_r):
-        """Callback executed for a short press action.
-
-        :param event_p event to press the action
-        :param value_p value to press the action
-        :param event_r event to release the action
-        :param value_r value to release the action
-        """
-
-        self._trigger_short_press(event_p, value_p)
-        time.sleep(0.05)
-        self._trigger_short_press(event_r, value_r)
-
-
-    def _long_press(self):
-        """Callback executed, when the delay expires."""
-
-        self._trigger_long_press(self.event_press, self.value_press)
+    def profile_stop(self):
+        self.machine.reset()
 
 class TempoExContainer(AbstractContainer):
 
@@ -542,8 +542,36 @@ class DILL:
 
             DILL.initalized = True
 
+    @staticmethod
+    def set_backend(backend):
+        """Replaces the DILL library with the provided backend.
+
+        The backend has to expose the same functions as the DILL dll, see
+        dinput.fake.FakeDILL. Once a backend is set init() does not attempt
+        to load the dll anymore.
+
+        Parameters
+        ==========
+        backend : object
+            Object implementing the DILL dll functions
+        """
+        DILL._dll = backend
+        DILL.version = getattr(backend, "version", None)
+        DILL.device_change_callback_fn = None
+        DILL.input_event_callback_fn = None
+        backend.init()
+        DILL.initalized = True
 
+    @staticmethod
+    def backend():
+        """Returns the object currently providing the DILL functions.
 
+        Return
+        ======
+        object
+            The loaded dll or the backend set via set_backend
+        """
+        return DILL._dll
 
     @staticmethod
     def set_input_event_callback(callback):
@@ -721,6 +749,9 @@ class DILL:
     @staticmethod
     def initialize_capi():
         """Initializes the functions as class methods."""
+        if not isinstance(DILL._dll, ctypes.CDLL):
+            # custom backends are plain python objects
+            return
         for fn_name, params in DILL.api_functions.items():
             dll_fn = getattr(DILL._dll, fn_name)
             if "arguments" in params:
@@ -0,0 +1,331 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Scriptable stand-in for the DILL library.
+
+The fake backend exposes the same functions as the DILL dll so it can be
+plugged into :class:`dinput.DILL` via :meth:`dinput.DILL.set_backend`. It
+manages a set of synthetic devices whose state is changed from Python and
+reports every change through the same callbacks DILL would invoke, using the
+same ctypes structures.
+"""
+
+import threading
+import time
+import uuid
+
+from dinput import _GUID, _JoystickInputData, _DeviceSummary, GUID, \
+    DeviceActionType, InputType, DILLError
+
+
+# DILL integer codes of the input types
+_input_type_codes = {
+    InputType.Axis: 1,
+    InputType.Button: 2,
+    InputType.Hat: 3
+}
+
+
+def guid_from_uuid(value):
+    """Returns the DILL GUID corresponding to a python UUID.
+
+    Parameters
+    ==========
+    value : uuid.UUID
+        the UUID to convert
+
+    Returns
+    =======
+    GUID
+        GUID with the same binary layout as the provided UUID
+    """
+    guid = _GUID()
+    guid.Data1 = value.time_low
+    guid.Data2 = value.time_mid
+    guid.Data3 = value.time_hi_version
+    for i, byte in enumerate(value.bytes[8:]):
+        guid.Data4[i] = byte
+    return GUID(guid)
+
+
+class FakeDevice:
+
+    """Describes a single synthetic input device."""
+
+    def __init__(
+            self,
+            name,
+            axis_count=8,
+            button_count=32,
+            hat_count=1,
+            device_guid=None,
+            vendor_id=0xF00D,
+            product_id=0x0001,
+            is_virtual=False
+    ):
+        """Creates a new instance.
+
+        Parameters
+        ==========
+        name : str
+            Name reported for the device
+        axis_count : int
+            Number of axes, at most 8
+        button_count : int
+            Number of buttons
+        hat_count : int
+            Number of hats
+        device_guid : uuid.UUID | GUID
+            GUID of the device, a random one is created if none is provided
+        vendor_id : int
+            USB vendor id reported for the device
+        product_id : int
+            USB product id reported for the device
+        is_virtual : bool
+            If True the device reports the vJoy vendor and product ids
+        """
+        if axis_count > 8:
+            raise DILLError(f"Fake device '{name}' has too many axes: {axis_count:d}")
+        if device_guid is None:
+            device_guid = uuid.uuid4()
+        if isinstance(device_guid, uuid.UUID):
+            device_guid = guid_from_uuid(device_guid)
+
+        self.name = name
+        self.device_guid = device_guid
+        self.axis_count = axis_count
+        self.button_count = button_count
+        self.hat_count = hat_count
+        if is_virtual:
+            vendor_id, product_id = 0x1234, 0xBEAD
+        self.vendor_id = vendor_id
+        self.product_id = product_id
+
+        # Current state, DirectInput axis, button, and hat indices are 1 based
+        self.axes = {i: 0 for i in range(1, axis_count + 1)}
+        self.buttons = {i: False for i in range(1, button_count + 1)}
+        self.hats = {i: -1 for i in range(1, hat_count + 1)}
+
+    def summary(self, joystick_id):
+        """Returns the DILL device summary structure of this device.
+
+        Parameters
+        ==========
+        joystick_id : int
+            Index of the device within the backend
+
+        Returns
+        =======
+        _DeviceSummary
+            ctypes structure as returned by DILL
+        """
+        data = _DeviceSummary()
+        data.device_guid = self.device_guid.ctypes
+        data.vendor_id = self.vendor_id
+        data.product_id = self.product_id
+        data.joystick_id = joystick_id
+        data.name = self.name.encode("utf-8")
+        data.axis_count = self.axis_count
+        data.button_count = self.button_count
+        data.hat_count = self.hat_count
+        for i in range(self.axis_count):
+            data.axis_map[i].linear_index = i + 1
+            data.axis_map[i].axis_index = i + 1
+        return data
+
+
+class FakeDILL:
+
+    """Backend emulating the DILL dll with synthetic devices.
+
+    All state changes are reported synchronously on the calling thread
+    through the callbacks registered by :class:`dinput.DILL`.
+    """
+
+    version = "fake"
+
+    def __init__(self, devices=None):
+        """Creates a new instance.
+
+        Parameters
+        ==========
+        devices : list
+            FakeDevice instances present when the backend is created
+        """
+        self._devices = []
+        self._lock = threading.RLock()
+        self._input_callback = None
+        self._device_callback = None
+        for device in devices or []:
+            self.add_device(device, notify=False)
+
+    # +-------------------------------------------------------------------
+    # | DILL dll interface
+
+    def init(self):
+        pass
+
+    def set_input_event_callback(self, callback):
+        self._input_callback = callback
+
+    def set_device_change_callback(self, callback):
+        self._device_callback = callback
+
+    def get_device_count(self):
+        return len(self._devices)
+
+    def get_device_information_by_index(self, index):
+        return self._devices[index].summary(index)
+
+    def get_device_information_by_guid(self, guid):
+        device = self._find(guid)
+        if device is None:
+            return _DeviceSummary()
+        return device.summary(self._devices.index(device))
+
+    def device_exists(self, guid):
+        return self._find(guid) is not None
+
+    def get_axis(self, guid, index):
+        device = self._find(guid)
+        return device.axes.get(index, 0) if device else 0
+
+    def get_button(self, guid, index):
+        device = self._find(guid)
+        return device.buttons.get(index, False) if device else False
+
+    def get_hat(self, guid, index):
+        device = self._find(guid)
+        return device.hats.get(index, -1) if device else -1
+
+    # +-------------------------------------------------------------------
+    # | Scripting interface
+
+    @property
+    def devices(self):
+        return list(self._devices)
+
+    def add_device(self, device, notify=True):
+        """Connects a synthetic device.
+
+        Parameters
+        ==========
+        device : FakeDevice
+            the device to add
+        notify : bool
+            if True the device change callback is invoked
+        """
+        with self._lock:
+            self._devices.append(device)
+        if notify and self._device_callback is not None:
+            self._device_callback(
+                device.summary(len(self._devices) - 1),
+                DeviceActionType.Connected.value
+            )
+        return device
+
+    def remove_device(self, device_guid, notify=True):
+        """Disconnects a synthetic device.
+
+        Parameters
+        ==========
+        device_guid : GUID
+            GUID of the device to remove
+        notify : bool
+            if True the device change callback is invoked
+        """
+        with self._lock:
+            device = self._find(device_guid)
+            if device is None:
+                raise DILLError(f"Unknown fake device {device_guid}")
+            index = self._devices.index(device)
+            self._devices.remove(device)
+        if notify and self._device_callback is not None:
+            self._device_callback(
+                device.summary(index),
+                DeviceActionType.Disconnected.value
+            )
+
+    def set_axis(self, device_guid, index, value):
+        """Sets an axis to the given raw value in [-32768, 32767]."""
+        device = self._get(device_guid)
+        value = max(-32768, min(32767, int(value)))
+        device.axes[index] = value
+        self._emit(device, InputType.Axis, index, value)
+
+    def set_button(self, device_guid, index, is_pressed):
+        """Presses or releases a button."""
+        device = self._get(device_guid)
+        device.buttons[index] = bool(is_pressed)
+        self._emit(device, InputType.Button, index, 1 if is_pressed else 0)
+
+    def set_hat(self, device_guid, index, value):
+        """Sets a hat to the given value in centi-degrees, -1 is centered."""
+        device = self._get(device_guid)
+        device.hats[index] = int(value)
+        self._emit(device, InputType.Hat, index, int(value))
+
+    def play(self, script, realtime=True):
+        """Executes a sequence of scripted input changes.
+
+        Each entry is a tuple of (delay, device_guid, input_type, index, value)
+        where delay is the time in seconds to wait before the change is
+        applied and input_type a dinput.InputType value.
+
+        Parameters
+        ==========
+        script : iterable
+            the sequence of changes to apply
+        realtime : bool
+            if False the delays are ignored and changes applied back to back
+        """
+        setters = {
+            InputType.Axis: self.set_axis,
+            InputType.Button: self.set_button,
+            InputType.Hat: self.set_hat
+        }
+        for delay, device_guid, input_type, index, value in script:
+            if realtime and delay > 0:
+                time.sleep(delay)
+            setters[input_type](device_guid, index, value)
+
+    # +-------------------------------------------------------------------
+    # | Internal helpers
+
+    def _find(self, guid):
+        if isinstance(guid, _GUID):
+            guid = GUID(guid)
+        for device in self._devices:
+            if device.device_guid == guid:
+                return device
+        return None
+
+    def _get(self, guid):
+        device = self._find(guid)
+        if device is None:
+            raise DILLError(f"Unknown fake device {guid}")
+        return device
+
+    def _emit(self, device, input_type, index, value):
+        if self._input_callback is None:
+            return
+        data = _JoystickInputData()
+        data.device_guid = device.device_guid.ctypes
+        data.input_type = _input_type_codes[input_type]
+        data.input_index = index
+        data.value = value
+        self._input_callback(data)
@@ -28,6 +28,7 @@ import gremlin.joystick_handling
 
 import gremlin.event_handler
 import gremlin.util
+import gremlin.axis_button
 import gremlin.fsm
 import gremlin.macro
 
@@ -373,6 +374,8 @@ class VirtualButton(metaclass=ABCMeta):
     def __init__(self):
         """Creates a new instance."""
         self._fsm = self._initialize_fsm()
+        self._press_action = self._fsm.action_id("press")
+        self._release_action = self._fsm.action_id("release")
         self._is_pressed = False
         self._identifier = VirtualButton.next_id
         VirtualButton.next_id += 1
@@ -391,7 +394,7 @@ class VirtualButton(metaclass=ABCMeta):
             ("down", "release"): gremlin.fsm.Transition(self._release, "up"),
             ("down", "press"): gremlin.fsm.Transition(self._noop, "down")
         }
-        return gremlin.fsm.FiniteStateMachine("up", states, actions, transitions)
+        return gremlin.fsm.CompiledStateMachine("up", states, actions, transitions)
 
     def process_event(self, event):
         """Process the input event and updates the value as needed.
@@ -458,15 +461,21 @@ class AxisButton(VirtualButton):
 
     """Virtual button based around an axis."""
 
-    def __init__(self, lower_limit, upper_limit, direction):
+    def __init__(self, lower_limit, upper_limit, direction, hysteresis=0.0):
         """Creates a new instance.
 
         :param lower_limit lower axis value where the button range starts
         :param upper_limit upper axis value where the button range stops
+        :param direction direction in which the range has to be entered
+        :param hysteresis distance by which the axis has to leave the range
+            before the button is released
         """
         super().__init__()
-        self._lower_limit = min(lower_limit, upper_limit)
-        self._upper_limit = max(lower_limit, upper_limit)
+        self._converter = gremlin.axis_button.AxisButtonConverter(
+            lower_limit, upper_limit, hysteresis
+        )
+        self._lower_limit = self._converter.lower_limit
+        self._upper_limit = self._converter.upper_limit
         self._direction = direction
         self._last_value = None
         self.forced_activation = False
@@ -478,55 +487,42 @@ class AxisButton(VirtualButton):
         :return True if a state transition occurred, False otherwise
         """
         from gremlin.types import AxisButtonDirection
+        value = event.value
+        last_value = self._last_value
+        self._last_value = value
         self.forced_activation = False
-        direction = AxisButtonDirection.Anywhere
-        if self._last_value is None:
-            self._last_value = event.value
-        else:
-            # Check if we moved over the activation region between two
-            # consecutive measurements
-            if self._last_value < self._lower_limit and \
-                    event.value > self._upper_limit:
-                self.forced_activation = True
-            elif self._last_value > self._upper_limit and \
-                    event.value < self._lower_limit:
-                self.forced_activation = True
-
-            # Determine direction in which the axis is moving
-            if self._last_value < event.value:
-                direction = AxisButtonDirection.Below
-            elif self._last_value > event.value:
-                direction = AxisButtonDirection.Above
-
-        inside_range = self._lower_limit <= event.value <= self._upper_limit
-        self._last_value = event.value
-
-        # If the determined direction is Anywhere this corresponds to an
-        # event that's processed again due to too fast axis motion which
-        # cause the execution of the axis button being skipped. This should
-        # be processed, however, needs to bypass the direction determination
-        # part of the code.
 
-        # Terminate early if the travel direction is incompatible with the
-        # one required by this instance
-        from gremlin.types import AxisButtonDirection
-        if direction != AxisButtonDirection.Anywhere and \
-                self._direction != AxisButtonDirection.Anywhere:
-            # Ensure we can only press a button by moving in the desired
-            # direction, however, allow releasing in any direction
-            if inside_range and direction != self._direction:
+        converter = self._converter
+        if not converter.changes(value):
+            # The button state does not change unless the axis moved over
+            # the activation region between two consecutive measurements
+            if converter.pressed or last_value is None \
+                    or not converter.jumped(last_value, value):
                 return False
-            if self.forced_activation and direction != self._direction:
+            self.forced_activation = True
+
+        # A repeated value corresponds to an event that's processed again due
+        # to too fast axis motion which caused the execution of the axis
+        # button being skipped, this bypasses the direction determination.
+        # Otherwise ensure we can only press a button by moving in the
+        # desired direction, however, allow releasing in any direction.
+        if self._direction != AxisButtonDirection.Anywhere \
+                and last_value is not None and last_value != value \
+                and not converter.pressed:
+            if last_value < value:
+                direction = AxisButtonDirection.Below
+            else:
+                direction = AxisButtonDirection.Above
+            if direction != self._direction:
                 return False
 
-        # Execute FSM transitions as required
-        if not self.forced_activation:
-            if inside_range:
-                return self._fsm.perform("press")
-            else:
-                return self._fsm.perform("release")
-        else:
-            return self._fsm.perform("press")
+        # Execute FSM transitions as required, a forced press ignores the
+        # hysteresis so processing the value again releases the button
+        if converter.pressed:
+            converter.set_pressed(False)
+            return self._fsm.perform_id(self._release_action)
+        converter.set_pressed(True, hysteresis=not self.forced_activation)
+        return self._fsm.perform_id(self._press_action)
 
 
 class HatButton(VirtualButton):
@@ -548,6 +544,6 @@ class HatButton(VirtualButton):
         :return True if a state transition occurred, False otherwise
         """
         if gremlin.util.hat_tuple_to_direction(event.value) in self._directions:
-            return self._fsm.perform("press")
+            return self._fsm.perform_id(self._press_action)
         else:
-            return self._fsm.perform("release")
+            return self._fsm.perform_id(self._release_action)
@@ -0,0 +1,195 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Batch transforms of the samples of a single axis.
+
+When many samples of one axis are pending, for example when analysing a
+recorded input log, transforming them one event at a time is dominated by
+the per call overhead. The functions in this module apply the calibration,
+deadzone, response curve, and range mapping stages to a whole sequence of
+samples at once.
+
+Numpy is optional. Numpy arrays are transformed vectorized and returned as
+arrays, any other sequence is transformed value by value and returned as a
+list. Both produce the same values as the scalar functions used for
+individual events.
+"""
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def is_vectorized(values):
+    """Returns whether the values are transformed vectorized.
+
+    :param values sequence of samples
+    :return True if the values are a numpy array, False otherwise
+    """
+    return numpy is not None and isinstance(values, numpy.ndarray)
+
+
+def as_samples(values):
+    """Returns the values in the preferred batch representation.
+
+    :param values sequence of samples
+    :return numpy array of floats if numpy is available, list otherwise
+    """
+    if numpy is not None:
+        return numpy.asarray(values, dtype=float)
+    return list(values)
+
+
+def calibrate(values, minimum, center, maximum):
+    """Returns the calibrated values of raw axis samples.
+
+    Matches gremlin.util.create_calibration_function, i.e. axes without
+    a distinct center are calibrated as sliders.
+
+    :param values the raw samples to process
+    :param minimum the minimal value ever reported
+    :param center the value in the neutral position
+    :param maximum the maximal value ever reported
+    :return calibrated samples in [-1, 1]
+    """
+    is_slider = minimum == center or maximum == center
+    if is_vectorized(values):
+        values = numpy.clip(values.astype(float, copy=False), minimum, maximum)
+        if is_slider:
+            return (values - minimum) / float(maximum - minimum) * 2.0 - 1.0
+        return numpy.where(
+            values < center,
+            (values - center) / float(center - minimum),
+            (values - center) / float(maximum - center)
+        )
+
+    low, high = min(minimum, maximum), max(minimum, maximum)
+    if is_slider:
+        scale = float(maximum - minimum)
+        return [
+            (min(high, max(low, value)) - minimum) / scale * 2.0 - 1.0
+            for value in values
+        ]
+    low_scale = float(center - minimum)
+    high_scale = float(maximum - center)
+    result = []
+    for value in values:
+        value = min(high, max(low, value))
+        if value < center:
+            result.append((value - center) / low_scale)
+        else:
+            result.append((value - center) / high_scale)
+    return result
+
+
+def deadzone(values, low, low_center, high_center, high):
+    """Returns the samples with the deadzone applied.
+
+    Matches gremlin.input_devices.deadzone.
+
+    :param values the samples to process
+    :param low low deadzone limit
+    :param low_center lower center deadzone limit
+    :param high_center upper center deadzone limit
+    :param high high deadzone limit
+    :return corrected samples
+    """
+    low_range = abs(low - low_center)
+    high_range = abs(high - high_center)
+    if is_vectorized(values):
+        values = values.astype(float, copy=False)
+        return numpy.where(
+            values >= 0,
+            numpy.clip((values - high_center) / high_range, 0, 1),
+            numpy.clip((values - low_center) / low_range, -1, 0)
+        )
+
+    result = []
+    for value in values:
+        if value >= 0:
+            result.append(min(1, max(0, (value - high_center) / high_range)))
+        else:
+            result.append(max(-1, min(0, (value - low_center) / low_range)))
+    return result
+
+
+def curve(function, values):
+    """Returns the samples mapped through a response curve.
+
+    Curves providing an evaluate_batch method, such as the splines of
+    gremlin.spline, evaluate the whole batch at once, any other callable is
+    evaluated one sample at a time.
+
+    :param function the response curve
+    :param values the samples to process
+    :return curved samples
+    """
+    if hasattr(function, "evaluate_batch"):
+        return function.evaluate_batch(values)
+    if is_vectorized(values):
+        return numpy.fromiter(
+            (function(value) for value in values.tolist()),
+            dtype=float,
+            count=len(values)
+        )
+    return [function(value) for value in values]
+
+
+def scale_to_range(
+        values,
+        source_min=-1.0,
+        source_max=1.0,
+        target_min=-1.0,
+        target_max=1.0,
+        invert=False
+):
+    """Returns the samples scaled from the source to the target range.
+
+    Matches gremlin.util.scale_to_range, samples outside of the source range
+    are clamped to it.
+
+    :param values the samples to scale
+    :param source_min the minimum of the source range
+    :param source_max the maximum of the source range
+    :param target_min the minimum of the target range
+    :param target_max the maximum of the target range
+    :param invert True if the samples are to be reversed
+    :return scaled samples
+    """
+    assert source_min != source_max, "Invalid source range - cannot be the same"
+    scale = target_max - target_min
+    source_range = source_max - source_min
+    if is_vectorized(values):
+        values = numpy.clip(
+            values.astype(float, copy=False), source_min, source_max
+        )
+        if invert:
+            return ((source_max - values) * scale) / source_range + target_min
+        return ((values - source_min) * scale) / source_range + target_min
+
+    result = []
+    for value in values:
+        if value < source_min:
+            value = source_min
+        elif value > source_max:
+            value = source_max
+        if invert:
+            result.append(((source_max - value) * scale) / source_range + target_min)
+        else:
+            result.append(((value - source_min) * scale) / source_range + target_min)
+    return result
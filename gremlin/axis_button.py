@@ -0,0 +1,98 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+"""Conversion of an axis range into a button state with hysteresis.
+
+A released button is pressed once the axis value enters the range, a pressed
+button is only released once the value leaves the range widened by the
+hysteresis on both sides, so noise around a boundary does not make the
+button chatter. The bounds of the current state are kept precomputed, so
+processing a value that does not change the state costs a pair of float
+comparisons.
+"""
+
+
+class AxisButtonConverter:
+
+    """Turns axis values into press and release transitions."""
+
+    def __init__(self, lower_limit, upper_limit, hysteresis=0.0):
+        """Creates a new instance.
+
+        :param lower_limit lower axis value where the button range starts
+        :param upper_limit upper axis value where the button range stops
+        :param hysteresis distance by which the value has to leave the range
+            before a pressed button is released
+        """
+        self.lower_limit = min(lower_limit, upper_limit)
+        self.upper_limit = max(lower_limit, upper_limit)
+        self.hysteresis = max(0.0, hysteresis)
+        self.pressed = False
+        self._set_bounds()
+
+    def _set_bounds(self, hysteresis=True):
+        ''' sets the bounds in which the value keeps the current state '''
+        if self.pressed and hysteresis:
+            self._low = self.lower_limit - self.hysteresis
+            self._high = self.upper_limit + self.hysteresis
+        else:
+            self._low = self.lower_limit
+            self._high = self.upper_limit
+
+    def changes(self, value):
+        """Returns whether a value changes the button state.
+
+        :param value the axis value
+        :return True if processing the value presses or releases the button
+        """
+        return (self._low <= value <= self._high) != self.pressed
+
+    def update(self, value):
+        """Processes an axis value.
+
+        :param value the axis value
+        :return True if the button got pressed, False if it got released,
+            None if the state did not change
+        """
+        if (self._low <= value <= self._high) == self.pressed:
+            return None
+        self.set_pressed(not self.pressed)
+        return self.pressed
+
+    def set_pressed(self, pressed, hysteresis=True):
+        """Forces the button state.
+
+        :param pressed True to press the button, False to release it
+        :param hysteresis False to keep a pressed button only within the
+            range itself rather than the range widened by the hysteresis
+        """
+        self.pressed = pressed
+        self._set_bounds(hysteresis)
+
+    def jumped(self, last_value, value):
+        """Returns whether the axis moved over the whole range between two values.
+
+        :param last_value the previous axis value
+        :param value the current axis value
+        :return True if the two values are on opposite sides of the range
+        """
+        return (last_value < self.lower_limit and value > self.upper_limit) or \
+            (last_value > self.upper_limit and value < self.lower_limit)
+
+    def reset(self):
+        """Releases the button without sending a transition."""
+        self.set_pressed(False)
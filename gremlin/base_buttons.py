@@ -48,6 +48,7 @@ class VirtualAxisButton(AbstractVirtualButton):
         self.lower_limit = lower_limit
         self.upper_limit = upper_limit
         self.direction = AxisButtonDirection.Anywhere
+        self.hysteresis = 0.0
 
     def from_xml(self, node):
         """Populates the virtual button based on the node's data.
@@ -60,6 +61,7 @@ class VirtualAxisButton(AbstractVirtualButton):
         self.direction = AxisButtonDirection.to_enum(
             safe_read(node, "direction", default_value="anywhere")
         )
+        self.hysteresis = safe_read(node, "hysteresis", float, 0.0)
 
     def to_xml(self):
         """Returns an XML node representing the data of this instance.
@@ -74,6 +76,8 @@ class VirtualAxisButton(AbstractVirtualButton):
             "direction",
             AxisButtonDirection.to_string(self.direction)
         )
+        if self.hysteresis > 0.0:
+            node.set("hysteresis", str(self.hysteresis))
         return node
 
 
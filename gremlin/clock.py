@@ -0,0 +1,385 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Clock service used by all time based runtime behaviour.
+
+Runtime code obtains the current time, sleeps, and schedules delayed calls
+through the module level now(), sleep(), and call_later() functions instead
+of using the time and threading modules directly. By default these use real
+time. Installing a VirtualClock via set_clock() makes time only advance when
+requested, which allows testing timing sensitive behaviour deterministically
+and without waiting.
+
+Real time delayed calls are all run by the TimerService on a single thread
+rather than creating a thread per delayed call. Delayed calls therefore must
+not block: a call that sleeps or waits delays every other timed behaviour.
+Work that can take long has to be handed off to another thread.
+"""
+
+import ctypes
+import heapq
+import itertools
+import logging
+import sys
+import threading
+import time
+
+import gremlin.perf_stats
+from gremlin.singleton_decorator import SingletonDecorator
+
+
+class TimerHandle:
+
+    """Handle of a delayed call which allows cancelling it."""
+
+    def __init__(self, deadline, callback, args):
+        """Creates a new handle.
+
+        :param deadline clock time at which the callback is due
+        :param callback the function to call
+        :param args positional arguments passed to the callback
+        """
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+        self.done = False
+
+    @property
+    def active(self):
+        ''' true while the callback is still due to run '''
+        return not (self.cancelled or self.done)
+
+    def cancel(self):
+        """Prevents the callback from running if it has not run yet."""
+        self.cancelled = True
+
+    def _run(self):
+        if self.cancelled:
+            return
+        self.done = True
+        try:
+            self.callback(*self.args)
+        except Exception as err:
+            logging.getLogger("system").error(f"Clock: error in delayed call {self.callback}: {err}")
+
+
+@SingletonDecorator
+class TimerService:
+
+    """Runs delayed calls on a single thread.
+
+    Pending calls are kept in a heap ordered by deadline. Cancelled calls are
+    discarded once they reach the top of the heap. The delay between the
+    deadline of a call and the moment it actually runs is recorded as the
+    scheduling jitter.
+
+    As all calls share the thread a call must not block. Calls running for
+    longer than slow_threshold are counted and logged once per callback so
+    the one holding up the service can be found.
+    """
+
+    def __init__(self):
+        self._queue = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._running = False
+        self.slow_threshold = 0.005 # seconds a delayed call may run before it is reported
+        self._slow_callbacks = set() # callbacks already reported as slow
+        self.jitter = gremlin.perf_stats.SampleStats()
+        self.reset_statistics()
+
+    def reset_statistics(self):
+        """Resets the scheduling statistics."""
+        self.scheduled = 0
+        self.fired = 0
+        self.cancelled = 0
+        self.slow = 0
+        self.max_pending = 0
+        self.jitter.reset()
+        self._slow_callbacks.clear()
+
+    @property
+    def pending(self):
+        ''' number of delayed calls not yet run or cancelled '''
+        with self._condition:
+            return len([entry for entry in self._queue if not entry[2].cancelled])
+
+    def schedule(self, handle):
+        """Adds a delayed call.
+
+        :param handle TimerHandle of the call, its deadline is a perf_counter
+            time stamp
+        """
+        with self._condition:
+            heapq.heappush(self._queue, (handle.deadline, next(self._counter), handle))
+            self.scheduled += 1
+            if len(self._queue) > self.max_pending:
+                self.max_pending = len(self._queue)
+            if self._thread is None:
+                self._running = True
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="TimerService",
+                    daemon=True
+                )
+                self._thread.start()
+            elif self._queue[0][2] is handle:
+                # new earliest deadline, wake the thread up
+                self._condition.notify()
+
+    def stop(self):
+        """Stops the service thread, pending calls are discarded."""
+        with self._condition:
+            thread = self._thread
+            self._running = False
+            self._queue = []
+            self._condition.notify()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        with self._condition:
+            self._thread = None
+
+    def report(self):
+        """Returns the timer statistics, jitter in milliseconds."""
+        jitter = self.jitter.summary()
+        return {
+            "scheduled": self.scheduled,
+            "fired": self.fired,
+            "cancelled": self.cancelled,
+            "slow": self.slow,
+            "pending": self.pending,
+            "max_pending": self.max_pending,
+            "jitter_ms": {key: value * 1000.0 if key != "count" else value
+                          for key, value in jitter.items()}
+        }
+
+    def _run(self):
+        ''' service thread '''
+        # request 1ms scheduler granularity, the default on Windows is ~15ms
+        if sys.platform == "win32":
+            ctypes.windll.winmm.timeBeginPeriod(1)
+        import gremlin.thread_registry
+        worker = gremlin.thread_registry.register("TimerService", persistent=True)
+        try:
+            while True:
+                with self._condition:
+                    handle = None
+                    worker.idle()
+                    while self._running:
+                        if not self._queue:
+                            self._condition.wait()
+                            continue
+                        deadline, _, handle = self._queue[0]
+                        if handle.cancelled:
+                            heapq.heappop(self._queue)
+                            self.cancelled += 1
+                            handle = None
+                            continue
+                        delay = deadline - time.perf_counter()
+                        if delay <= 0:
+                            heapq.heappop(self._queue)
+                            break
+                        handle = None
+                        self._condition.wait(delay)
+                    if handle is None:
+                        return
+
+                worker.beat()
+                started = time.perf_counter()
+                self.jitter.add(started - handle.deadline)
+                self.fired += 1
+                handle._run()
+                duration = time.perf_counter() - started
+                if duration > self.slow_threshold:
+                    self._report_slow(handle.callback, duration)
+        finally:
+            worker.unregister()
+            if sys.platform == "win32":
+                ctypes.windll.winmm.timeEndPeriod(1)
+
+
+    def _report_slow(self, callback, duration):
+        ''' records a delayed call that blocked the service thread '''
+        self.slow += 1
+        name = getattr(callback, "__qualname__", repr(callback))
+        if name in self._slow_callbacks:
+            return
+        self._slow_callbacks.add(name)
+        logging.getLogger("system").warning(
+            f"Clock: delayed call {name} blocked the timer service for {duration * 1000.0:.1f}ms"
+        )
+
+
+class RealClock:
+
+    """Clock operating in real time."""
+
+    def now(self):
+        """Returns the current time in seconds."""
+        return time.perf_counter()
+
+    def sleep(self, seconds):
+        """Blocks the calling thread for the given duration."""
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def call_later(self, delay, callback, *args):
+        """Calls the callback once the delay has elapsed.
+
+        :param delay time in seconds to wait before calling the callback
+        :param callback the function to call
+        :param args positional arguments passed to the callback
+        :return TimerHandle of the delayed call
+        """
+        handle = TimerHandle(self.now() + max(0.0, delay), callback, args)
+        TimerService().schedule(handle)
+        return handle
+
+
+class VirtualClock:
+
+    """Clock whose time only advances when explicitly requested.
+
+    Delayed calls run on the thread advancing the clock, in deadline order.
+    Threads calling sleep() block until the clock has been advanced past
+    their wake up time unless auto_advance is set, in which case sleep()
+    advances the clock itself which suits single threaded tests.
+    """
+
+    def __init__(self, start=1000.0, auto_advance=False):
+        """Creates a new virtual clock.
+
+        :param start initial time of the clock, non zero by default as
+            runtime code commonly uses 0 as "never happened" timestamp
+        :param auto_advance if True sleep() advances the clock
+        """
+        self._now = start
+        self.auto_advance = auto_advance
+        self._queue = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+
+    def now(self):
+        return self._now
+
+    def sleep(self, seconds):
+        if seconds <= 0:
+            return
+        if self.auto_advance:
+            self.advance(seconds)
+            return
+        with self._condition:
+            deadline = self._now + seconds
+            while self._now < deadline:
+                self._condition.wait()
+
+    def call_later(self, delay, callback, *args):
+        handle = TimerHandle(self._now + max(0.0, delay), callback, args)
+        with self._condition:
+            heapq.heappush(self._queue, (handle.deadline, next(self._counter), handle))
+        return handle
+
+    @property
+    def pending(self):
+        ''' number of delayed calls not yet run or cancelled '''
+        with self._condition:
+            return len([entry for entry in self._queue if not entry[2].cancelled])
+
+    def advance(self, seconds):
+        """Advances the time, running every delayed call that becomes due.
+
+        :param seconds amount of time to advance the clock by
+        """
+        self.advance_to(self._now + seconds)
+
+    def advance_to(self, target):
+        """Advances the time to the given value.
+
+        :param target the time to advance the clock to
+        """
+        while True:
+            with self._condition:
+                if not self._queue or self._queue[0][0] > target:
+                    break
+                deadline, _, handle = heapq.heappop(self._queue)
+                if deadline > self._now:
+                    self._now = deadline
+                    self._condition.notify_all()
+            handle._run()
+
+        with self._condition:
+            if target > self._now:
+                self._now = target
+            self._condition.notify_all()
+
+    def run_until_idle(self, limit=3600.0):
+        """Advances the clock until no delayed calls are left.
+
+        :param limit maximum amount of time to advance by
+        """
+        end = self._now + limit
+        while True:
+            with self._condition:
+                pending = [entry[0] for entry in self._queue if not entry[2].cancelled]
+            if not pending or min(pending) > end:
+                break
+            self.advance_to(min(pending))
+
+
+_clock = RealClock()
+
+
+def get_clock():
+    """Returns the active clock."""
+    return _clock
+
+
+def set_clock(clock):
+    """Replaces the active clock.
+
+    :param clock the clock to use, None restores the real time clock
+    :return the previously active clock
+    """
+    global _clock
+    previous = _clock
+    _clock = clock if clock is not None else RealClock()
+    return previous
+
+
+def now():
+    """Returns the current time in seconds according to the active clock."""
+    return _clock.now()
+
+
+def sleep(seconds):
+    """Blocks for the given duration according to the active clock."""
+    _clock.sleep(seconds)
+
+
+def call_later(delay, callback, *args):
+    """Schedules a delayed call on the active clock.
+
+    The callback runs on the timer service thread and must not block.
+
+    :param delay time in seconds to wait before calling the callback
+    :param callback the function to call
+    :param args positional arguments passed to the callback
+    :return TimerHandle of the delayed call
+    """
+    return _clock.call_later(delay, callback, *args)
@@ -26,6 +26,7 @@ import time
 import dinput
 
 import gremlin
+import gremlin.clock
 # from gremlin import event_handler, input_devices, \
 #     joystick_handling, macro, sendinput, user_plugin, util
 
@@ -41,9 +42,13 @@ import gremlin.event_handler
 import gremlin.util
 import gremlin.joystick_handling
 import gremlin.macro
+import gremlin.merge_engine
 import gremlin.input_devices
+import gremlin.input_router
 import gremlin.user_plugin
 import gremlin.sendinput as sendinput
+import gremlin.thread_registry
+import gremlin.tick_engine
 
 
 syslog = logging.getLogger("system")
@@ -85,6 +90,9 @@ class CodeRunner:
     
 
     def setUIState(self, enabled):
+        if gremlin.shared_state.ui is None:
+            # headless - no UI to update
+            return
         ui = gremlin.shared_state.ui.ui
         ui.devices.setEnabled(enabled)
         ui.actionNewProfile.setEnabled(enabled)
@@ -128,6 +136,12 @@ class CodeRunner:
 
         self.disableUi()
 
+        # threads alive at this point are not owned by the profile run
+        thread_registry = gremlin.thread_registry.ThreadRegistry()
+        thread_registry.set_baseline()
+        thread_registry.start_watchdog()
+        gremlin.input_router.InputRouter().reset_statistics()
+        gremlin.clock.TimerService().reset_statistics()
 
         # indicate we're in run mode
         gremlin.shared_state.is_running = True
@@ -458,6 +472,8 @@ class CodeRunner:
                         mode = start_mode
 
 
+            gremlin.tick_engine.TickEngine().rate = config.tick_rate
+            gremlin.tick_engine.TickEngine().start()
             sendinput.MouseController().start()
 
 
@@ -549,6 +565,10 @@ class CodeRunner:
 
         # Stop periodic events and clear registry
         gremlin.input_devices.periodic_registry.stop()
+        if gremlin.config.Configuration().verbose:
+            logging.getLogger("system").info(
+                f"Periodic functions: {gremlin.input_devices.periodic_registry.report()}"
+            )
         gremlin.input_devices.periodic_registry.clear()
 
         # stop
@@ -556,8 +576,42 @@ class CodeRunner:
         gremlin.input_devices.start_registry.clear()
 
 
+        # release gate crossing short presses still held down
+        from gremlin.gated_handler import ShortPressScheduler
+        ShortPressScheduler().flush()
+
         gremlin.macro.MacroManager().stop()
+        if gremlin.config.Configuration().verbose:
+            logging.getLogger("system").info(
+                f"Macro scheduler: {gremlin.macro.MacroManager().report()}"
+            )
         sendinput.MouseController().stop()
+        gremlin.tick_engine.TickEngine().stop()
+        if gremlin.config.Configuration().verbose:
+            logging.getLogger("system").info(
+                f"Tick engine: {gremlin.tick_engine.TickEngine().report()}"
+            )
+
+        if gremlin.config.Configuration().verbose:
+            logging.getLogger("system").info(
+                f"Timer service: {gremlin.clock.TimerService().report()}"
+            )
+            logging.getLogger("system").info(
+                f"Input router: {gremlin.input_router.InputRouter().report()}"
+            )
+
+        # report worker threads that outlived the profile
+        thread_registry = gremlin.thread_registry.ThreadRegistry()
+        thread_registry.stop_watchdog()
+        if gremlin.config.Configuration().verbose:
+            logging.getLogger("system").info(
+                f"Threads: {thread_registry.report()}"
+            )
+        leaked = thread_registry.leaked_threads()
+        if leaked:
+            logging.getLogger("system").warning(
+                f"Threads still running after profile stop: {', '.join(leaked)}"
+            )
 
         # Remove all claims on VJoy devices
         gremlin.joystick_handling.VJoyProxy.reset()
@@ -634,46 +688,37 @@ class MergeAxis:
             input_id: int,
             operation: gremlin.types.MergeAxisOperation
     ):
-        self.axis_values = [0.0, 0.0]
         self.vjoy_id = vjoy_id
         self.input_id = input_id
         self.operation = operation
+        self.engine = gremlin.merge_engine.two_axis_engine(operation)
 
-    def _update(self):
-        """Updates the merged axis value."""
-        value = 0.0
-        if self.operation == gremlin.types.MergeAxisOperation.Average:
-            value = (self.axis_values[0] - self.axis_values[1]) / 2.0
-        elif self.operation == gremlin.types.MergeAxisOperation.Minimum:
-            value = min(self.axis_values[0], self.axis_values[1])
-        elif self.operation == gremlin.types.MergeAxisOperation.Maximum:
-            value = max(self.axis_values[0], self.axis_values[1])
-        elif self.operation == gremlin.types.MergeAxisOperation.Sum:
-            value = gremlin.util.clamp(
-                self.axis_values[0] + self.axis_values[1],
-                -1.0,
-                1.0
-            )
-        else:
-            raise gremlin.error.GremlinError(
-                f"Invalid merge axis operation detected, \"{str(self.operation)}\""
-            )
+    @property
+    def axis_values(self):
+        """Returns the latest value of both axes."""
+        return self.engine.values
+
+    def _update(self, index: int, value: float):
+        """Updates the merged axis value.
 
-        gremlin.joystick_handling.VJoyProxy()[self.vjoy_id]\
-            .axis(self.input_id).value = value
+        :param index index of the axis whose value changed
+        :param value new value of the axis
+        """
+        value = self.engine.update(index, value)
+        if value is not None:
+            gremlin.joystick_handling.VJoyProxy()[self.vjoy_id]\
+                .axis(self.input_id).value = value
 
     def update_axis1(self, event: gremlin.event_handler.Event):
         """Updates information for the first axis.
 
         :param event data event for the first axis
         """
-        self.axis_values[0] = event.value
-        self._update()
+        self._update(0, event.value)
 
     def update_axis2(self, event: gremlin.event_handler.Event):
         """Updates information for the second axis.
 
         :param event data event for the second axis
         """
-        self.axis_values[1] = event.value
-        self._update()
\ No newline at end of file
+        self._update(1, event.value)
\ No newline at end of file
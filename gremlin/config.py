@@ -872,6 +872,20 @@ class Configuration:
         self._data["macro_axis_minimum_change_rate"] = value
         self.save()
 
+    @property
+    def tick_rate(self):
+        """Returns the rate of the runtime tick engine.
+
+        :return updates per second of continuous outputs such as mouse motion
+        """
+        return self._data.get("tick_rate", 100)
+
+    @tick_rate.setter
+    def tick_rate(self, value):
+        value = min(1000, max(10, int(value)))
+        self._data["tick_rate"] = value
+        self.save()
+
     @property
     def macro_record_axis(self):
         return self._data.get("macro_record_axis", False)
@@ -22,6 +22,7 @@ import os
 from lxml import etree as ElementTree
 from PySide6 import QtWidgets, QtCore, QtGui #QtWebEngineWidgets
 
+import gremlin.axis_batch
 import gremlin.base_profile
 import gremlin.config
 import gremlin.config
@@ -2375,6 +2376,13 @@ class AxisCurveData():
             value = self.response_fn(value)
         
         return value
+
+    def curve_values(self, values, update : bool = False):
+        ''' processes a batch of input values -1 to +1 of one axis and outputs the curved values, see gremlin.axis_batch '''
+        if update or self.deadzone_fn is None or self.response_fn is None:
+            self.curve_update()
+        values = gremlin.axis_batch.deadzone(values, *self.deadzone)
+        return gremlin.axis_batch.curve(self.response_fn, values)
         
 
 
@@ -20,13 +20,15 @@ import inspect
 import logging
 import time
 import queue
-from threading import Thread, Timer
+from threading import Thread, current_thread
 from typing import Callable
 
 
 
 
+import gremlin.clock
 import gremlin.joystick_handling
+import gremlin.thread_registry
 import gremlin.threading
 
 from PySide6 import QtCore, QtWidgets
@@ -34,6 +36,7 @@ from PySide6 import QtCore, QtWidgets
 import dinput
 import gremlin.config
 from gremlin.input_types import InputType
+from gremlin.types import RawInputSource
 import gremlin.shared_state
 
 
@@ -304,6 +307,12 @@ class EventListener(QtCore.QObject):
 
 		self._joystick_suspend_count = 0 # stack count for suspend joystick
 
+		# callables receiving raw input data before it is processed (recording)
+		self._input_taps = []
+
+		# watchdog registration of the thread delivering joystick events
+		self._joystick_worker = None
+
 
 		# keyboard input handling buffer
 		self._keyboard_state = {}
@@ -318,7 +327,7 @@ class EventListener(QtCore.QObject):
 		# internal event on process change
 		self._process_device_change.connect(self._process_device_change_cb)
 
-		Thread(target=self._run).start()
+		Thread(target=self._run, name="DILL listener").start()
 
 	def registerInput(self, item):
 		''' registers an input item '''
@@ -327,6 +336,21 @@ class EventListener(QtCore.QObject):
 			self._joystick_input_item_map[key] = item
 		
 
+	def add_input_tap(self, tap):
+		''' registers a callable invoked with (RawInputSource, *raw data) for every raw input received '''
+		if tap not in self._input_taps:
+			self._input_taps.append(tap)
+
+	def remove_input_tap(self, tap):
+		''' removes a previously registered input tap '''
+		if tap in self._input_taps:
+			self._input_taps.remove(tap)
+
+	def notify_input_tap(self, source, *args):
+		''' forwards raw input data to the registered taps '''
+		for tap in self._input_taps:
+			tap(source, *args)
+
 	def push_joystick(self):
 		self._joystick_suspend_count += 1
 
@@ -406,11 +430,14 @@ class EventListener(QtCore.QObject):
 		logging.getLogger("system").info("KBD: processing start")
 		self._keyboard_buffer = {}
 		self._key_listener_started = True
+		worker = gremlin.thread_registry.register("Keyboard processor")
 		while not self._keyboard_thread.stopped():
+			worker.beat()
 			if self._keyboard_queue.empty():
 				time.sleep(0.01)
 				continue
 			self._process_queue()
+		worker.unregister()
 
 
 		# done
@@ -426,7 +453,7 @@ class EventListener(QtCore.QObject):
 		if not self._key_listener_started:
 			self._keyboard_queue = queue.Queue()
 			
-			self._keyboard_thread = gremlin.threading.AbortableThread(target = self._keyboard_processor)
+			self._keyboard_thread = gremlin.threading.AbortableThread(target = self._keyboard_processor, name = "Keyboard processor")
 			self._keyboard_thread.start()
 
 	def stop_key_listener(self):
@@ -485,19 +512,53 @@ class EventListener(QtCore.QObject):
 		logging.getLogger("system").info("DILL: input start listen")
 		dinput.DILL.set_device_change_callback(self._joystick_device_handler)
 		dinput.DILL.set_input_event_callback(self._joystick_event_handler)
+		# only keeps the listener alive, the event dispatch is monitored by
+		# the worker registered in _joystick_event_handler
+		worker = gremlin.thread_registry.register(
+			"DILL keep-alive",
+			stall_timeout=None,
+			persistent=True
+		)
 		while self._running:
 			# Keep this thread alive until we are done
+			worker.beat()
 			time.sleep(0.1)
+		worker.unregister()
 		logging.getLogger("system").info("DILL: input stop listen")
 
 	def _joystick_event_handler(self, data):
 		"""Callback for joystick events.
 
 		The handler converts the event data into a signal which is then
-		emitted.
+		emitted. The thread delivering the events is registered with the
+		watchdog, which reports a dispatch taking longer than its stall
+		timeout.
 
 		:param data the joystick event
 		"""
+		worker = self._joystick_worker
+		if worker is None or worker.thread is not current_thread():
+			worker = self._register_joystick_worker()
+		worker.beat()
+		try:
+			self._dispatch_joystick_event(data)
+		finally:
+			worker.idle()
+
+	def _register_joystick_worker(self):
+		''' registers the thread delivering joystick events with the watchdog '''
+		if self._joystick_worker is not None:
+			self._joystick_worker.unregister()
+		self._joystick_worker = gremlin.thread_registry.register(
+			"DILL dispatch",
+			persistent=True
+		)
+		return self._joystick_worker
+
+	def _dispatch_joystick_event(self, data):
+		''' converts a joystick event into a signal and emits it '''
+		if self._input_taps:
+			self.notify_input_tap(RawInputSource.Joystick, data)
 
 		if self._joystick_suspend_count > 0:
 			# ignore if joystick input is suspended
@@ -567,8 +628,7 @@ class EventListener(QtCore.QObject):
 
 		if self._device_update_timer is not None:
 			self._device_update_timer.cancel()
-		self._device_update_timer = Timer(0.5, self._run_device_list_update)
-		self._device_update_timer.start()
+		self._device_update_timer = gremlin.clock.call_later(0.5, self._run_device_list_update)
 
 	def _run_device_list_update(self):
 		"""Performs the update of the devices connected."""
@@ -613,6 +673,9 @@ class EventListener(QtCore.QObject):
 
 		:param event the keyboard event
 		"""
+		if self._input_taps:
+			self.notify_input_tap(RawInputSource.Keyboard, event)
+
 		verbose = gremlin.config.Configuration().verbose_mode_keyboard
 
 		# verbose = True
@@ -757,6 +820,29 @@ class EventListener(QtCore.QObject):
 		#print(f"Raw value: {raw_value:0.4f} filtered: {calib_value:0.4f} Curved value: {curved_value:0.4f}")
 		return curved_value
 
+	def apply_transforms_batch(self, device_guid, input_id, raw_values):
+		''' applies raw transforms to a batch of samples of one axis - see apply_transforms and gremlin.axis_batch
+
+		:param device_guid the device the samples originate from
+		:param input_id the axis the samples originate from
+		:param raw_values sequence of samples in dinput range, numpy arrays are transformed vectorized
+		:return tuple of the calibrated and the curved samples
+		'''
+		import gremlin.axis_batch
+		key = (device_guid, input_id)
+		if key in self._calibrations:
+			limits = config.Configuration().get_calibration(device_guid, input_id)
+		else:
+			limits = (-32768, 0, 32767)
+		calib_values = gremlin.axis_batch.calibrate(raw_values, *limits[:3])
+
+		curved_values = calib_values
+		if key in self._joystick_input_item_map:
+			item = self._joystick_input_item_map[key]
+			if item.curve_data is not None:
+				curved_values = item.curve_data.curve_values(calib_values)
+		return calib_values, curved_values
+
 	def _init_joysticks(self):
 		"""Initializes joystick devices."""
 		for dev_info in joystick_handling.joystick_devices():
@@ -19,11 +19,11 @@ from abc import abstractmethod, ABCMeta
 from collections import namedtuple
 import copy
 import logging
-import time
 
 import gremlin.base_buttons
 import gremlin.base_classes
 import gremlin.base_profile
+import gremlin.clock
 import gremlin.config
 import gremlin.event_handler
 from gremlin.input_types import InputType
@@ -127,7 +127,8 @@ class VirtualButtonProcess:
             self.virtual_button = gremlin.actions.AxisButton(
                 data.lower_limit,
                 data.upper_limit,
-                data.direction
+                data.direction,
+                data.hysteresis
             )
         elif isinstance(data, gremlin.base_buttons.VirtualHatButton):
             self.virtual_button = gremlin.actions.HatButton(
@@ -143,6 +144,15 @@ class VirtualButtonProcess:
         """
         self.virtual_button.process_event(event)
 
+        # Processing an event twice is needed when a virtual axis button has
+        # "jumped" over it's activation region without triggering it. Once
+        # this is detected the "press" event is sent and the second run ensures
+        # a "release" event is sent.
+        if isinstance(self.virtual_button, gremlin.actions.AxisButton) \
+                and self.virtual_button.forced_activation:
+            gremlin.clock.sleep(0.05)
+            self.virtual_button.process_event(event)
+
 
 class AbstractExecutionGraph(metaclass=ABCMeta):
 
@@ -175,13 +185,6 @@ class AbstractExecutionGraph(metaclass=ABCMeta):
         :param value the possibly modified value extracted from the event
         """
         
-
-        # Processing an event twice is needed when a virtual axis button has
-        # "jumped" over it's activation region without triggering it. Once
-        # this is detected the "press" event is sent and the second run ensures
-        # a "release" event is sent.
-        process_again = False
-
         while self.current_index is not None and len(self.functors) > 0:
             functor = self.functors[self.current_index]
         
@@ -189,15 +192,8 @@ class AbstractExecutionGraph(metaclass=ABCMeta):
             if result is None or not result and not isinstance(functor, gremlin.actions.ActivationCondition):
                 logging.getLogger("system").warning(f"Process event returned no data or FALSE - functor: {type(functor).__name__}")
 
-            if isinstance(functor, gremlin.actions.AxisButton):
-                process_again = functor.forced_activation
-
             self.current_index = self.transitions.get((self.current_index, result),None)
         self.current_index = 0
-
-        if process_again:
-            time.sleep(0.05)
-            self.process_event(event, value)
         return True
 
     @abstractmethod
@@ -0,0 +1,162 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Stand-in for the Windows keyboard API outside of Windows.
+
+The keyboard modules take the constants and functions they use from
+win32con, win32api and user32. When these are unavailable, for example when
+running the headless runtime on a CI machine, this module is used in their
+place. It provides the same names with the virtual key codes defined by
+Windows, a US layout limited to the letter and digit keys, no pressed keys,
+and key output that goes nowhere.
+"""
+
+# keybd_event flags
+KEYEVENTF_EXTENDEDKEY = 0x0001
+KEYEVENTF_KEYUP = 0x0002
+
+# virtual key codes
+VK_BACK = 0x08
+VK_TAB = 0x09
+VK_RETURN = 0x0D
+VK_PAUSE = 0x13
+VK_CAPITAL = 0x14
+VK_ESCAPE = 0x1B
+VK_SPACE = 0x20
+VK_PRIOR = 0x21
+VK_NEXT = 0x22
+VK_END = 0x23
+VK_HOME = 0x24
+VK_LEFT = 0x25
+VK_UP = 0x26
+VK_RIGHT = 0x27
+VK_DOWN = 0x28
+VK_PRINT = 0x2A
+VK_INSERT = 0x2D
+VK_DELETE = 0x2E
+VK_LWIN = 0x5B
+VK_RWIN = 0x5C
+VK_APPS = 0x5D
+VK_NUMPAD0 = 0x60
+VK_NUMPAD1 = 0x61
+VK_NUMPAD2 = 0x62
+VK_NUMPAD3 = 0x63
+VK_NUMPAD4 = 0x64
+VK_NUMPAD5 = 0x65
+VK_NUMPAD6 = 0x66
+VK_NUMPAD7 = 0x67
+VK_NUMPAD8 = 0x68
+VK_NUMPAD9 = 0x69
+VK_MULTIPLY = 0x6A
+VK_ADD = 0x6B
+VK_SEPARATOR = 0x6C
+VK_SUBTRACT = 0x6D
+VK_DECIMAL = 0x6E
+VK_DIVIDE = 0x6F
+VK_F1 = 0x70
+VK_F2 = 0x71
+VK_F3 = 0x72
+VK_F4 = 0x73
+VK_F5 = 0x74
+VK_F6 = 0x75
+VK_F7 = 0x76
+VK_F8 = 0x77
+VK_F9 = 0x78
+VK_F10 = 0x79
+VK_F11 = 0x7A
+VK_F12 = 0x7B
+VK_F13 = 0x7C
+VK_F14 = 0x7D
+VK_F15 = 0x7E
+VK_F16 = 0x7F
+VK_F17 = 0x80
+VK_F18 = 0x81
+VK_F19 = 0x82
+VK_F20 = 0x83
+VK_F21 = 0x84
+VK_F22 = 0x85
+VK_F23 = 0x86
+VK_F24 = 0x87
+VK_NUMLOCK = 0x90
+VK_SCROLL = 0x91
+VK_LSHIFT = 0xA0
+VK_RSHIFT = 0xA1
+VK_LCONTROL = 0xA2
+VK_RCONTROL = 0xA3
+VK_LMENU = 0xA4
+VK_RMENU = 0xA5
+
+# MapVirtualKeyEx translation types
+MAPVK_VSC_TO_VK_EX = 3
+MAPVK_VK_TO_VSC_EX = 4
+
+# scan code -> character of the letter and digit keys of a US layout, the
+# virtual key code of these keys is the character code
+_layout = dict(zip(range(0x02, 0x0C), "1234567890"))
+_layout.update(zip(range(0x10, 0x1A), "QWERTYUIOP"))
+_layout.update(zip(range(0x1E, 0x27), "ASDFGHJKL"))
+_layout.update(zip(range(0x2C, 0x33), "ZXCVBNM"))
+_virtual_to_scan_code = {ord(character): scan_code for scan_code, character in _layout.items()}
+
+
+def keybd_event(virtual_code, scan_code, flags, extra_info):
+    """Discards a key event."""
+    pass
+
+
+def GetLastError():
+    return 0
+
+
+def GetAsyncKeyState(virtual_code):
+    """Returns the state of a key, keys are never pressed."""
+    return 0
+
+
+def GetKeyboardLayout(thread_id):
+    return 0
+
+
+def GetKeyboardState(state_buffer):
+    return False
+
+
+def MapVirtualKeyExW(code, map_type, layout):
+    """Returns the translation of a key code, 0 if there is none."""
+    if map_type == MAPVK_VSC_TO_VK_EX:
+        character = _layout.get(code)
+        return ord(character) if character else 0
+    if map_type == MAPVK_VK_TO_VSC_EX:
+        return _virtual_to_scan_code.get(code, 0)
+    return 0
+
+
+def ToUnicodeEx(virtual_code, scan_code, state_buffer, output_buffer,
+                buffer_size, flags, layout):
+    """Writes the character of a key and returns the number of characters."""
+    if virtual_code not in _virtual_to_scan_code:
+        return 0
+    output_buffer.value = chr(virtual_code).lower()
+    return 1
+
+
+def VkKeyScanExW(character, layout):
+    """Returns the virtual key of a character, -1 if no key produces it."""
+    virtual_code = ord(character.upper())
+    if virtual_code not in _virtual_to_scan_code:
+        return -1
+    return virtual_code
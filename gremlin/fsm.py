@@ -18,6 +18,10 @@
 """Implementation of a very simple finite state machine."""
 
 import logging
+import threading
+
+import gremlin.clock
+import gremlin.error
 
 
 class Transition:
@@ -71,3 +75,221 @@ class FiniteStateMachine:
             logging.getLogger("system").debug(f"FSM: {self.current_state} -> {self.transitions[key].new_state} ({action})")
         self.current_state = self.transitions[key].new_state
         return value
+
+
+class CompiledStateMachine:
+
+    """Finite state machine compiled into a dense transition table.
+
+    States and actions are coded as integers and the transitions stored in
+    a flat table indexed by state * number of actions + action. The table is
+    validated once when the machine is created so performing an action is a
+    single list lookup followed by the transition callback. In debug mode
+    every action is validated and every transition logged.
+    """
+
+    def __init__(self, start_state, states, actions, transitions, debug=False):
+        """Creates a new compiled finite state machine object.
+
+        :param start_state the state in which the FSM starts in
+        :param states the set of states
+        :param actions the possible actions of the FSM
+        :param transitions the states x actions transition matrix, every
+            combination of state and action has to be present
+        :param debug validate and log every transition if True
+        """
+        self.states = list(states)
+        self.actions = list(actions)
+        self._state_ids = {state: i for i, state in enumerate(self.states)}
+        self._action_ids = {action: i for i, action in enumerate(self.actions)}
+        if start_state not in self._state_ids:
+            raise gremlin.error.GremlinError(f"FSM: invalid start state {start_state}")
+
+        action_count = len(self.actions)
+        self._action_count = action_count
+        self._callbacks = [None] * (len(self.states) * action_count)
+        self._targets = [0] * (len(self.states) * action_count)
+        for state, state_id in self._state_ids.items():
+            for action, action_id in self._action_ids.items():
+                transition = transitions.get((state, action))
+                if transition is None:
+                    raise gremlin.error.GremlinError(
+                        f"FSM: missing transition for ({state}, {action})"
+                    )
+                if transition.new_state not in self._state_ids:
+                    raise gremlin.error.GremlinError(
+                        f"FSM: invalid target state {transition.new_state} for ({state}, {action})"
+                    )
+                index = state_id * action_count + action_id
+                self._callbacks[index] = transition.callback
+                self._targets[index] = self._state_ids[transition.new_state]
+
+        self.start_state = self._state_ids[start_state]
+        self.state = self.start_state
+        self.debug = debug
+        if debug:
+            self.perform_id = self._perform_debug
+
+    @property
+    def current_state(self):
+        """Returns the name of the current state."""
+        return self.states[self.state]
+
+    def state_id(self, state):
+        """Returns the integer code of a state.
+
+        :param state name of the state
+        :return integer code of the state
+        """
+        return self._state_ids[state]
+
+    def action_id(self, action):
+        """Returns the integer code of an action.
+
+        :param action name of the action
+        :return integer code to use with perform_id
+        """
+        return self._action_ids[action]
+
+    def perform(self, action):
+        """Performs a state transition on the FSM.
+
+        :param action name of the action to perform
+        :return returns the state transition function's return value
+        """
+        return self.perform_id(self._action_ids[action])
+
+    def perform_id(self, action_id):
+        """Performs a state transition on the FSM.
+
+        :param action_id integer code of the action to perform
+        :return returns the state transition function's return value
+        """
+        index = self.state * self._action_count + action_id
+        value = self._callbacks[index]()
+        self.state = self._targets[index]
+        return value
+
+    def perform_batch(self, action_ids):
+        """Performs the transitions of a sequence of actions.
+
+        :param action_ids integer codes of the actions to perform in order
+        :return list of the return values of the transition functions
+        """
+        if self.debug:
+            return [self._perform_debug(action_id) for action_id in action_ids]
+        callbacks = self._callbacks
+        targets = self._targets
+        action_count = self._action_count
+        results = []
+        for action_id in action_ids:
+            index = self.state * action_count + action_id
+            results.append(callbacks[index]())
+            self.state = targets[index]
+        return results
+
+    def reset(self):
+        """Returns to the start state."""
+        self.state = self.start_state
+
+    def _perform_debug(self, action_id):
+        ''' validating and tracing version of perform_id '''
+        if not 0 <= action_id < self._action_count:
+            raise gremlin.error.GremlinError(f"FSM: invalid action {action_id}")
+        index = self.state * self._action_count + action_id
+        value = self._callbacks[index]()
+        logging.getLogger("system").debug(
+            f"FSM: {self.states[self.state]} -> {self.states[self._targets[index]]} ({self.actions[action_id]})"
+        )
+        self.state = self._targets[index]
+        return value
+
+
+class TimedFiniteStateMachine(CompiledStateMachine):
+
+    """Compiled finite state machine with a single cancelable deadline.
+
+    Transition callbacks arm the deadline which performs the timeout action
+    once it expires. Actions and timeouts are serialized by a lock and a
+    deadline replaced or cancelled before it fired is discarded, so a timeout
+    is never processed after the action that made it obsolete.
+    """
+
+    timeout = "timeout"
+
+    def __init__(self, start_state, states, actions, transitions, debug=False):
+        """Creates a new timed finite state machine object.
+
+        :param start_state the state in which the FSM starts in
+        :param states the set of states
+        :param actions the possible actions of the FSM, the timeout action
+            is added if missing
+        :param transitions the states x actions transition matrix, every
+            combination of state and action has to be present
+        :param debug validate and log every transition if True
+        """
+        if TimedFiniteStateMachine.timeout not in actions:
+            actions = list(actions) + [TimedFiniteStateMachine.timeout]
+        super().__init__(start_state, states, actions, transitions, debug)
+        self.lock = threading.RLock()
+        self._timeout_id = self.action_id(TimedFiniteStateMachine.timeout)
+        self._deadline = None
+        self._deadline_id = 0
+        # plain or debug version selected by the compiled state machine
+        self._perform_unlocked = self.perform_id
+        self.perform_id = self._perform_locked
+
+    @property
+    def deadline_pending(self):
+        """Returns True if a deadline is armed."""
+        return self._deadline is not None
+
+    def perform_batch(self, action_ids):
+        """Performs the transitions of a sequence of actions.
+
+        :param action_ids integer codes of the actions to perform in order
+        :return list of the return values of the transition functions
+        """
+        with self.lock:
+            return [self._perform_unlocked(action_id) for action_id in action_ids]
+
+    def set_deadline(self, delay):
+        """Arms the deadline, replacing a pending one.
+
+        :param delay time in seconds until the timeout action is performed
+        """
+        with self.lock:
+            self.cancel_deadline()
+            self._deadline = gremlin.clock.call_later(
+                delay, self._expire, self._deadline_id
+            )
+
+    def cancel_deadline(self):
+        """Cancels the pending deadline, if any."""
+        with self.lock:
+            self._deadline_id += 1
+            if self._deadline is not None:
+                self._deadline.cancel()
+                self._deadline = None
+
+    def reset(self):
+        """Cancels the deadline and returns to the start state."""
+        with self.lock:
+            self.cancel_deadline()
+            super().reset()
+
+    def _perform_locked(self, action_id):
+        ''' performs an action while holding the lock '''
+        with self.lock:
+            return self._perform_unlocked(action_id)
+
+    def _expire(self, deadline_id):
+        """Performs the timeout action unless the deadline is stale.
+
+        :param deadline_id the id of the deadline that expired
+        """
+        with self.lock:
+            if deadline_id != self._deadline_id:
+                return
+            self._deadline = None
+            self._perform_unlocked(self._timeout_id)
@@ -18,15 +18,19 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from __future__ import annotations
+import bisect
+import itertools
 import os
 from lxml import etree as ElementTree
 from PySide6 import QtWidgets, QtCore, QtGui #QtWebEngineWidgets
 
 import gremlin.base_profile
+import gremlin.clock
 import gremlin.config
 import gremlin.config
 import gremlin.event_handler
 import gremlin.execution_graph
+import gremlin.input_router
 from gremlin.input_types import InputType
 import gremlin.joystick_handling
 import gremlin.shared_state
@@ -932,6 +936,181 @@ class GateEventHandler(QtCore.QObject):
         super().__init__()
 
 
+class _PendingRelease():
+    ''' release of a short press waiting for its deadline '''
+
+    def __init__(self, functor, event, value):
+        self.functor = functor
+        self.event = event
+        self.value = value
+        self.timer = None
+
+
+@gremlin.singleton_decorator.SingletonDecorator
+class ShortPressScheduler():
+    ''' schedules the press/release pairs of short presses triggered by gate crossings
+
+    Releases are delayed on the shared timer service rather than a thread per
+    press. Each functor has at most one pending release: a new short press
+    while the previous one is still held extends the pending release instead
+    of pressing again, which keeps press and release strictly alternating.
+    '''
+
+    # maximum number of releases waiting at any time, the oldest release is
+    # sent early when exceeded
+    max_pending = 64
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = {} # functor -> _PendingRelease, oldest first
+        self.presses = 0
+        self.extended = 0
+        self.evicted = 0
+
+    @property
+    def pending(self):
+        ''' number of releases waiting for their deadline '''
+        return len(self._pending)
+
+    def press(self, functor, event, value, delay):
+        ''' presses the functor and schedules its release
+
+        :param functor: functor to send the press and release to
+        :param event: event triggering the press
+        :param value: value triggering the press
+        :param delay: time in milliseconds until the release
+        '''
+        if not hasattr(functor, "process_event"):
+            return
+
+        delay = delay / 1000 # ms to seconds
+        evicted = None
+        with self._lock:
+            pending = self._pending.pop(functor, None)
+            if pending is not None:
+                # still held down: move the release out instead of pressing again
+                self._pending[functor] = pending
+                self.extended += 1
+                if pending.timer is not None:
+                    pending.timer.cancel()
+                    pending.timer = gremlin.clock.call_later(delay, self._release, pending)
+                return
+
+            if len(self._pending) >= self.max_pending:
+                evicted = self._pending.pop(next(iter(self._pending)))
+                if evicted.timer is not None:
+                    evicted.timer.cancel()
+                self.evicted += 1
+            pending = _PendingRelease(
+                functor,
+                event.clone(),
+                gremlin.actions.Value(value.raw, value.is_pressed)
+            )
+            pending.value.current = False
+            self._pending[functor] = pending
+            self.presses += 1
+
+        if evicted is not None:
+            evicted.functor.process_event(evicted.event, evicted.value)
+
+        press_value = gremlin.actions.Value(value.raw, value.is_pressed)
+        press_value.current = True
+        functor.process_event(pending.event.clone(), press_value)
+
+        # the release is only scheduled once the press has been sent
+        with self._lock:
+            if self._pending.get(functor) is pending and pending.timer is None:
+                pending.timer = gremlin.clock.call_later(delay, self._release, pending)
+
+    def flush(self):
+        ''' sends all pending releases immediately '''
+        with self._lock:
+            pending_list = list(self._pending.values())
+            self._pending = {}
+        for pending in pending_list:
+            if pending.timer is not None:
+                pending.timer.cancel()
+            pending.functor.process_event(pending.event, pending.value)
+
+    def report(self):
+        ''' returns the short press statistics '''
+        with self._lock:
+            return {
+                "presses": self.presses,
+                "extended": self.extended,
+                "evicted": self.evicted,
+                "pending": len(self._pending)
+            }
+
+    def _release(self, pending):
+        ''' timer callback releasing a short press '''
+        with self._lock:
+            if self._pending.get(pending.functor) is not pending:
+                # superseded or already released
+                return
+            del self._pending[pending.functor]
+        pending.functor.process_event(pending.event, pending.value)
+
+
+class _TriggerIndex():
+    ''' sorted gate positions and range boundaries of a gated axis
+
+    Built whenever the gate configuration changes so that processing an axis
+    value only needs a few bisections instead of scanning and sorting the
+    gates and ranges.
+    '''
+
+    tolerance = 0.0001 # boundary tolerance of RangeInfo.inrange()
+
+    def __init__(self, ranges : list[RangeInfo], gates : list[GateInfo]):
+        '''
+        :param ranges: ranges to index, on a shared boundary the range listed first wins
+        :param gates: gates to index
+        '''
+        self.ranges = ranges
+
+        ordered = sorted(enumerate(ranges), key = lambda x: (x[1].v1, x[0]))
+        self.range_list = [rng for _, rng in ordered]
+        self.range_order = [index for index, _ in ordered]
+        self.range_min = [rng.v1 for rng in self.range_list]
+        self.range_max = [rng.v2 for rng in self.range_list]
+        # running maximum of the upper bounds, ends the backward scan of
+        # find_range() once no earlier range can reach the value
+        self.range_reach = list(itertools.accumulate(self.range_max, max))
+
+        self.gate_list = sorted((gate for gate in gates if gate.value is not None), key = lambda x: x.value)
+        self.gate_values = [gate.value for gate in self.gate_list]
+
+        self.outside_ranges = [rng for rng in ranges if rng.hasContainers(GateCondition.OutsideRange)]
+
+    def find_range(self, value : float) -> RangeInfo:
+        ''' gets the range containing the value, None if the value is outside of all ranges '''
+        tolerance = _TriggerIndex.tolerance
+        index = bisect.bisect_right(self.range_min, value + tolerance) - 1
+        selected = None
+        selected_order = None
+        while index >= 0 and self.range_reach[index] >= value - tolerance:
+            if self.range_max[index] >= value - tolerance:
+                order = self.range_order[index]
+                if selected is None or order < selected_order:
+                    selected = self.range_list[index]
+                    selected_order = order
+            index -= 1
+        return selected
+
+    def crossed_gates(self, last_value : float, value : float) -> list[GateInfo]:
+        ''' gets the gates between two values (inclusive) in the order they were crossed '''
+        if last_value is None or value is None:
+            return []
+        if last_value <= value:
+            low = bisect.bisect_left(self.gate_values, last_value)
+            high = bisect.bisect_right(self.gate_values, value)
+            return self.gate_list[low:high]
+        low = bisect.bisect_left(self.gate_values, value)
+        high = bisect.bisect_right(self.gate_values, last_value)
+        return self.gate_list[low:high][::-1]
+
+
 class GateData():
     ''' holds gated information for an axis
     
@@ -988,6 +1167,7 @@ class GateData():
         self._trigger_callbacks = [] # list of registered trigger callbacks
 
         self._active_ranges = []
+        self._trigger_index : _TriggerIndex = None # sorted gates and ranges, rebuilt on change
 
         # create the gate cache - only the first two gates are marked used and not default
         max_gates = GateData.max_gates
@@ -1030,22 +1210,38 @@ class GateData():
         eh = GateEventHandler()
         eh.gate_order_changed.connect(self._update_default_range)
 
+        # rebuild the trigger index when gates or their mappings change
+        eh.gate_used_changed.connect(self._invalidate_trigger_index)
+        eh.gate_value_changed.connect(self._invalidate_trigger_index)
+        el.mapping_changed.connect(self._invalidate_trigger_index)
+
         self._hooked = False
+        self._route_key = None # input this gated axis is subscribed to
 
     def hook(self):
         ''' hook events '''
         if not self._hooked:
             self._hooked = True
-            el = gremlin.event_handler.EventListener()
-            el.joystick_event.connect(self._joystick_event_handler)
+            self._subscribe()
 
     def unhook(self):
         ''' unhook events '''
         if self._hooked:
-            el = gremlin.event_handler.EventListener()
-            el.joystick_event.disconnect(self._joystick_event_handler)
+            self._unsubscribe()
             self._hooked = False
 
+    def _subscribe(self):
+        ''' subscribes to the events of the hardware axis of this gated axis '''
+        if self._route_key is None:
+            self._route_key = (self._action_data.hardware_device_guid, InputType.JoystickAxis, self._action_data.hardware_input_id)
+            gremlin.input_router.subscribe(*self._route_key, self._joystick_event_handler)
+
+    def _unsubscribe(self):
+        ''' removes the hardware axis subscription '''
+        if self._route_key is not None:
+            gremlin.input_router.unsubscribe(*self._route_key, self._joystick_event_handler)
+            self._route_key = None
+
     @property
     def hooked(self) -> bool:
         ''' true if hooks are in place '''
@@ -1120,8 +1316,7 @@ class GateData():
 
         if not self.hooked:        
             # listen to hardware events
-            el = gremlin.event_handler.EventListener()
-            el.joystick_event.connect(self._joystick_event_handler)
+            self._subscribe()
 
 
         item_data: gremlin.ui.device_tab.InputItemConfiguration
@@ -1164,8 +1359,7 @@ class GateData():
 
         if not self.hooked:        
             # stop listening to hardware events
-            el = gremlin.event_handler.EventListener()
-            el.joystick_event.disconnect(self._joystick_event_handler)
+            self._unsubscribe()
 
         # clean up callback map
         self._callbacks.clear()
@@ -1190,17 +1384,7 @@ class GateData():
         
         '''
 
-        if not event.is_axis:
-            # ignore if not an axis event
-            return
-
-        if self._action_data.hardware_device_guid != event.device_guid:
-            # ignore if a different input device
-            return
-            
-        if self._action_data.hardware_input_id != event.identifier:
-            # ignore if a different input axis on the input device
-            return
+        # the input router only calls this for the hardware axis of this gated axis
 
         raw_value = event.raw_value
         input_value = gremlin.joystick_handling.scale_to_range(raw_value, source_min = -32767, source_max = 32767, target_min = -1, target_max = 1)
@@ -1308,8 +1492,7 @@ class GateData():
                         for functor in cb.callback.execution_graph.functors:
                             if functor.enabled:
                                 if short_press:
-                                    thread = threading.Thread(target=lambda: self._short_press(functor, event, value, delay))
-                                    thread.start()
+                                    self._short_press(functor, event, value, delay)
                                 else:
                                     # not a momentary trigger
                                     #print (f"trigger mode: {trigger.mode} sending event value: {value.current}")
@@ -1319,8 +1502,7 @@ class GateData():
                 # process user provided functor callback if set (this is used by actions that must act on the modified output of the gated axis rather than the raw hardware input - example: simconnect action)
                 if self._process_callback is not None:
                     if short_press:
-                        thread = threading.Thread(target=lambda: self._short_press(self._process_callback, event, value, delay))
-                        thread.start()
+                        self._short_press(self._process_callback, event, value, delay)
                     else:
                         self._process_callback(event, value)
 
@@ -1329,15 +1511,8 @@ class GateData():
         #     syslog.info("Trigger: end")
 
     def _short_press(self, functor, event, value, delay = 250):
-        ''' triggers a short press of a trigger (gate crossing)'''
-        if not hasattr(functor, "process_event"):
-            return
-        # print ("short press ")
-        value.current = True
-        functor.process_event(event, value)
-        time.sleep(delay/1000) # ms to seconds
-        value.current = False
-        functor.process_event(event, value)
+        ''' triggers a short press of a trigger (gate crossing), delay in milliseconds'''
+        ShortPressScheduler().press(functor, event, value, delay)
 
     @property
     def trigger_range_text(self):
@@ -1583,6 +1758,7 @@ class GateData():
 
 
         self._active_ranges = range_info_list
+        self._trigger_index = None
 
 
         # return the list of ranges 
@@ -1859,6 +2035,7 @@ class GateData():
                 
 
         self._range_list = ranges
+        self._trigger_index = None
 
         # update the default range
         self._update_default_range()
@@ -1897,30 +2074,21 @@ class GateData():
         return [info for info in self._gate_item_map.values() if info.used and info.value is not None and not info.is_default]
     
     def _get_gates_for_values(self, old_value, new_value):
-        ''' gets the list of sorted list of gates between two values '''
-        v1, v2 = old_value, new_value
-        if v1 is None or v2 is None:
-            return []
-        if v1 > v2:
-            # swap
-            v1, v2 = v2, v1
+        ''' gets the list of gates between two values in the order they are crossed '''
+        return self._get_trigger_index(self._active_ranges).crossed_gates(old_value, new_value)
+
+    def _get_trigger_index(self, ranges : list[RangeInfo]) -> _TriggerIndex:
+        ''' gets the trigger index for the given ranges, rebuilt if the gate configuration changed '''
+        index = self._trigger_index
+        if index is None or index.ranges is not ranges:
+            index = _TriggerIndex(ranges, self._get_used_gates())
+            self._trigger_index = index
+        return index
+
+    def _invalidate_trigger_index(self, *args):
+        ''' gate usage or mappings changed - the trigger index is rebuilt on next use '''
+        self._trigger_index = None
 
-        gates = self._get_used_gates()
-        result = set()
-        # get the low gate
-        for gate in gates:
-            v = gate.value
-            if v >= v1 and v < v2:
-                # v1 is on the gate or below a the gate
-                result.add(gate)
-            if v == v2:
-                # v2 is on the gate
-                result.add(gate)
-            if v > v2:
-                # gate is outside the range - stop processing gates
-                break
-        return list(result)
-    
     def _get_ranges_for_values(self, old_value, new_value):
         ''' gets the list of sorted list of gates between two values '''
         v1, v2 = old_value, new_value
@@ -1953,6 +2121,8 @@ class GateData():
     def _update_gate_index(self) -> list[GateInfo]:
         ''' updates gate indices so they are in sorted index '''
 
+        self._trigger_index = None
+
         # index non default gates
         gates = [info for info in self._gates if info.used and not info.is_default]
         gates.sort(key = lambda x: x.value) # sort gate ascending
@@ -2020,10 +2190,8 @@ class GateData():
     def _get_range_for_value(self, value : float, include_default : bool = False, used_only : bool = True):
         ''' returns (v1,v2,idx1,idx12) where v1 = lower range, v2 = higher range, idx1 = gate index for v1, idx2 = gate index for v2 '''
         range_info : RangeInfo
-        #print ("------")
         selected = None
         for range_info in self._get_ranges(include_default = include_default, used_only = used_only):
-            print (f"{value:0.4f} - range: {range_info.range_display()} {range_info.range_gate_display()} in range: {range_info.inrange(value)}")
             if range_info.inrange(value):
                 selected = range_info
         return selected
@@ -2115,6 +2283,7 @@ class GateData():
         self._last_range_exit_trigger = None # range that triggered the last exit
         self._range_list = self._get_ranges()
         self._gate_list = self._get_used_items() # ordered list of gates by index and value
+        self._trigger_index = None
 
     def _trim_list(self, data, count_max):
         count = len(data)
@@ -2151,10 +2320,12 @@ class GateData():
 
             value_changed = last_value is None or last_value != current_value
             if not value_changed:
-                return # nothing to do if the axix didn't move
-            
+                return triggers # nothing to do if the axix didn't move
+
+            index = self._get_trigger_index(ranges)
+
             range_info: RangeInfo
-            range_info = self._get_range_for_value_from_list(current_value, ranges)
+            range_info = index.find_range(current_value)
             
             # the last range we saw            
             last_range = self._last_range
@@ -2236,8 +2407,9 @@ class GateData():
                 
 
             # process outside range condition ranges - those trigger if the value is outside the range
-            outside_trigger_ranges = [rng for rng in self._active_ranges if rng != range_info and rng.hasContainers(GateCondition.OutsideRange)]
-            for outside_range in outside_trigger_ranges:
+            for outside_range in index.outside_ranges:
+                if outside_range == range_info:
+                    continue
                 td = TriggerData()
                 td.mode = TriggerMode.ValueOutOfRange
                 td.value = current_value
@@ -2261,8 +2433,8 @@ class GateData():
                 triggers.append(td)
             
 
-            # get the list of crossed gates since last check
-            crossed_gates = self._get_gates_for_values(last_value, current_value)
+            # get the list of crossed gates since last check in crossing order
+            crossed_gates = index.crossed_gates(last_value, current_value)
 
 
             # process any the gate triggers
@@ -0,0 +1,442 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Declarative recognition of timed press patterns.
+
+A gesture is declared as a GestureSpec: a table mapping a (state, input)
+pair to the operations to run and the state to move to, the inputs being
+"press", "release" and "timeout". The operations are
+
+    store(snapshot)         stores a copy of the current event as the
+                            "press" or "release" snapshot
+    arm(param)              arms the deadline of the gesture with the delay
+                            given by a parameter, replacing a pending one
+    cancel()                cancels the pending deadline
+    emit(output, source)    sends the "press" or "release" snapshot, or the
+                            "current" event, to an output
+
+A spec is compiled into a TimedFiniteStateMachine, whose transitions are a
+dense table indexed by integer state and input codes, when a Gesture is
+created from it, so processing an input is a single table lookup followed by
+the precompiled operations. Deadlines of all gestures run on the shared
+timer service. Outputs are callbacks receiving an event and a value.
+
+The spec library provides the patterns used by the containers: short / long
+press, single / double tap, multi taps, hold to repeat, press and release
+within a window and smart toggle.
+"""
+
+import copy
+
+import gremlin.error
+import gremlin.fsm
+
+
+# Time in seconds a synthesized press is held before it is released
+pulse_duration = 0.05
+
+# Inputs of every gesture
+inputs = ("press", "release", gremlin.fsm.TimedFiniteStateMachine.timeout)
+
+
+def store(snapshot):
+    """Stores a copy of the current event as a snapshot.
+
+    :param snapshot "press" or "release"
+    """
+    return ("store", snapshot)
+
+
+def arm(param):
+    """Arms the deadline with the delay given by a parameter.
+
+    :param param name of the parameter holding the delay in seconds
+    """
+    return ("arm", param)
+
+
+def cancel():
+    """Cancels the pending deadline."""
+    return ("cancel",)
+
+
+def emit(output, source):
+    """Sends an event to an output.
+
+    :param output name of the output
+    :param source "press" or "release" for a snapshot, "current" for the
+        event being processed
+    """
+    return ("emit", output, source)
+
+
+class GestureSpec:
+
+    """Declaration of a gesture as a state machine table."""
+
+    def __init__(self, name, states, outputs, params, rules, start="idle"):
+        """Creates a new spec.
+
+        :param name name of the gesture
+        :param states the states of the gesture
+        :param outputs the names of the outputs
+        :param params the names of the parameters, "pulse" is always
+            available and defaults to the pulse duration
+        :param rules (state, input) -> (list of operations, new state),
+            missing entries leave the state unchanged without doing anything
+        :param start the state the gesture starts in
+        """
+        self.name = name
+        self.states = list(states)
+        self.outputs = list(outputs)
+        self.params = list(params) + ["pulse"]
+        self.rules = rules
+        self.start = start
+        self._validate()
+
+    def _validate(self):
+        ''' verifies the rules only reference declared states, outputs and parameters '''
+        def fail(message):
+            raise gremlin.error.GremlinError(f"Gesture {self.name}: {message}")
+
+        if self.start not in self.states:
+            fail(f"unknown start state {self.start}")
+        for (state, input), (operations, new_state) in self.rules.items():
+            if state not in self.states or new_state not in self.states:
+                fail(f"unknown state in rule ({state}, {input}) -> {new_state}")
+            if input not in inputs:
+                fail(f"unknown input {input}")
+            for operation in operations:
+                kind = operation[0]
+                if kind == "store" and operation[1] not in ("press", "release"):
+                    fail(f"invalid snapshot {operation[1]}")
+                elif kind == "arm" and operation[1] not in self.params:
+                    fail(f"unknown parameter {operation[1]}")
+                elif kind == "emit":
+                    if operation[1] not in self.outputs:
+                        fail(f"unknown output {operation[1]}")
+                    if operation[2] not in ("press", "release", "current"):
+                        fail(f"invalid source {operation[2]}")
+                elif kind not in ("store", "arm", "cancel", "emit"):
+                    fail(f"unknown operation {kind}")
+
+
+class Gesture:
+
+    """Runs a gesture spec on the input of a button."""
+
+    def __init__(self, spec, params, outputs):
+        """Compiles the spec into a state machine.
+
+        :param spec the GestureSpec to run
+        :param params parameter name -> value
+        :param outputs output name -> callback receiving (event, value)
+        """
+        self.spec = spec
+        self.params = {"pulse": pulse_duration}
+        self.params.update(params)
+        missing = [name for name in spec.params if name not in self.params]
+        missing += [name for name in spec.outputs if name not in outputs]
+        if missing:
+            raise gremlin.error.GremlinError(
+                f"Gesture {spec.name}: missing {', '.join(missing)}"
+            )
+        self.outputs = outputs
+
+        self.event = None
+        self.value = None
+        self.snapshots = {"press": (None, None), "release": (None, None)}
+
+        transitions = {}
+        for state in spec.states:
+            for input in inputs:
+                operations, new_state = spec.rules.get((state, input), ((), state))
+                transitions[(state, input)] = gremlin.fsm.Transition(
+                    self._compile(operations), new_state
+                )
+        self._fsm = gremlin.fsm.TimedFiniteStateMachine(
+            spec.start, spec.states, list(inputs), transitions
+        )
+        self._press_id = self._fsm.action_id("press")
+        self._release_id = self._fsm.action_id("release")
+
+    @property
+    def state(self):
+        """Returns the current state of the gesture."""
+        return self._fsm.current_state
+
+    def process(self, event, value):
+        """Processes a press or release of the input.
+
+        :param event the input event
+        :param value the value of the event, value.current is True on press
+        """
+        with self._fsm.lock:
+            self.event = event
+            self.value = value
+            self._fsm.perform_id(self._press_id if value.current else self._release_id)
+
+    def reset(self):
+        """Cancels the pending deadline and returns to the start state."""
+        self._fsm.reset()
+
+    def _compile(self, operations):
+        ''' returns a function running the operations of a rule '''
+        steps = tuple(self._compile_operation(operation) for operation in operations)
+        if not steps:
+            return _noop
+        if len(steps) == 1:
+            return steps[0]
+
+        def run():
+            for step in steps:
+                step()
+        return run
+
+    def _compile_operation(self, operation):
+        ''' returns a function running a single operation '''
+        kind = operation[0]
+        if kind == "store":
+            snapshot = operation[1]
+
+            def run():
+                self.snapshots[snapshot] = (self.event.clone(), copy.deepcopy(self.value))
+            return run
+        elif kind == "arm":
+            delay = self.params[operation[1]]
+            return lambda: self._fsm.set_deadline(delay)
+        elif kind == "cancel":
+            return lambda: self._fsm.cancel_deadline()
+        elif kind == "emit":
+            callback = self.outputs[operation[1]]
+            source = operation[2]
+            if source == "current":
+                return lambda: callback(self.event, self.value)
+
+            def run():
+                callback(*self.snapshots[source])
+            return run
+
+
+def _noop():
+    pass
+
+
+def tempo_spec(activate_on):
+    """Short and long press.
+
+    States:
+        idle: input released
+        short: input pressed, long press delay not expired yet
+        long: input held past the long press delay
+        pulse: short press sent on release, waiting to send its release
+
+    Parameters: delay, the time after which a press is a long press.
+    Outputs: short, long.
+
+    :param activate_on "press" to activate the short press output right away,
+        "release" to only activate it once a short press completed
+    """
+    on_press = activate_on == "press"
+    press = [store("press"), arm("delay")] + ([emit("short", "press")] if on_press else [])
+    if on_press:
+        short_release = ([cancel(), emit("short", "current")], "idle")
+    else:
+        short_release = ([cancel(), store("release"), emit("short", "press"), arm("pulse")], "pulse")
+    return GestureSpec(
+        "tempo",
+        ["idle", "short", "long", "pulse"],
+        ["short", "long"],
+        ["delay"],
+        {
+            ("idle", "press"): (press, "short"),
+            ("short", "release"): short_release,
+            ("short", "timeout"): ([emit("long", "press")], "long"),
+            ("long", "release"): (
+                [emit("long", "current")] + ([emit("short", "current")] if on_press else []),
+                "idle"
+            ),
+            # complete the previous short press before starting the next one
+            ("pulse", "press"): ([cancel(), emit("short", "release")] + press, "short"),
+            ("pulse", "timeout"): ([emit("short", "release")], "idle"),
+        }
+    )
+
+
+def multi_tap_spec(count):
+    """Exclusive recognition of up to count taps.
+
+    Every press has to occur within the delay of the previous press. Only the
+    output of the number of taps performed is activated: the last tap of the
+    sequence activates its output right away, fewer taps are sent once no
+    further tap can follow or, if the last tap is held past the delay, for as
+    long as it is held.
+
+    States:
+        idle: waiting for a first tap
+        down_<n>: n-th tap pressed
+        up_<n>: n-th tap released, waiting for the next tap
+        held_<n>: n-th tap held past the delay
+        pulse_<n>: delayed output of n taps sent, waiting to send its release
+
+    Parameters: delay, the time within which the next tap has to be pressed.
+    Outputs: tap_1 to tap_<count>.
+
+    :param count number of taps of the longest sequence, at least 2
+    """
+    if count < 2:
+        raise gremlin.error.GremlinError("A multi tap requires at least two taps")
+
+    states = ["idle"]
+    for n in range(1, count):
+        states += [f"down_{n}", f"up_{n}", f"held_{n}", f"pulse_{n}"]
+    states.append(f"down_{count}")
+
+    first_press = [store("press"), arm("delay")]
+    rules = {("idle", "press"): (first_press, "down_1")}
+    for n in range(1, count):
+        output = f"tap_{n}"
+        rules[(f"down_{n}", "release")] = ([store("release")], f"up_{n}")
+        rules[(f"down_{n}", "timeout")] = ([emit(output, "press")], f"held_{n}")
+        rules[(f"held_{n}", "release")] = ([emit(output, "current")], "idle")
+        rules[(f"up_{n}", "timeout")] = ([emit(output, "press"), arm("pulse")], f"pulse_{n}")
+        if n + 1 < count:
+            rules[(f"up_{n}", "press")] = ([store("press"), arm("delay")], f"down_{n + 1}")
+        else:
+            rules[(f"up_{n}", "press")] = ([cancel(), emit(f"tap_{count}", "current")], f"down_{count}")
+        # complete the delayed output before starting the next sequence
+        rules[(f"pulse_{n}", "press")] = ([cancel(), emit(output, "release")] + first_press, "down_1")
+        rules[(f"pulse_{n}", "timeout")] = ([emit(output, "release")], "idle")
+    rules[(f"down_{count}", "release")] = ([emit(f"tap_{count}", "current")], "idle")
+
+    return GestureSpec(
+        f"{count} taps", states, [f"tap_{n}" for n in range(1, count + 1)], ["delay"], rules
+    )
+
+
+def double_tap_spec(activate_on):
+    """Single and double tap.
+
+    In exclusive mode only one of the two outputs is activated, the single
+    tap output being delayed until no second tap can follow. In combined mode
+    the single tap output follows the input and a second tap additionally
+    activates the double tap output.
+
+    Parameters: delay, the time from the first press within which the second
+    press has to occur.
+    Outputs: single, double.
+
+    :param activate_on "exclusive" or "combined"
+    """
+    if activate_on == "exclusive":
+        spec = multi_tap_spec(2)
+        rename = {"tap_1": "single", "tap_2": "double"}
+        rules = {
+            key: ([op if op[0] != "emit" else emit(rename[op[1]], op[2]) for op in operations], new_state)
+            for key, (operations, new_state) in spec.rules.items()
+        }
+        return GestureSpec("double tap", spec.states, ["single", "double"], ["delay"], rules)
+
+    return GestureSpec(
+        "double tap",
+        ["idle", "first_down", "first_up", "held", "double_down"],
+        ["single", "double"],
+        ["delay"],
+        {
+            ("idle", "press"): ([store("press"), arm("delay"), emit("single", "current")], "first_down"),
+            ("first_down", "release"): ([emit("single", "current")], "first_up"),
+            ("first_down", "timeout"): ([], "held"),
+            ("held", "release"): ([emit("single", "current")], "idle"),
+            ("first_up", "press"): ([cancel(), emit("double", "current"), emit("single", "current")], "double_down"),
+            ("first_up", "timeout"): ([], "idle"),
+            ("double_down", "release"): ([emit("double", "current"), emit("single", "current")], "idle"),
+        }
+    )
+
+
+def hold_repeat_spec():
+    """Press repeated while the input is held.
+
+    The press is sent right away, repeated every interval once the input was
+    held for the delay, and released with the input.
+
+    Parameters: delay, interval.
+    Outputs: repeat.
+    """
+    return GestureSpec(
+        "hold repeat",
+        ["idle", "down", "repeat"],
+        ["repeat"],
+        ["delay", "interval"],
+        {
+            ("idle", "press"): ([store("press"), emit("repeat", "current"), arm("delay")], "down"),
+            ("down", "release"): ([cancel(), emit("repeat", "current")], "idle"),
+            ("down", "timeout"): ([emit("repeat", "press"), arm("interval")], "repeat"),
+            ("repeat", "timeout"): ([emit("repeat", "press"), arm("interval")], "repeat"),
+            ("repeat", "release"): ([cancel(), emit("repeat", "current")], "idle"),
+        }
+    )
+
+
+def click_spec():
+    """Press and release within a window.
+
+    The output is pulsed when the input is released within the window after
+    its press, presses held for longer are ignored.
+
+    Parameters: window.
+    Outputs: click.
+    """
+    return GestureSpec(
+        "click",
+        ["idle", "down", "expired", "pulse"],
+        ["click"],
+        ["window"],
+        {
+            ("idle", "press"): ([store("press"), arm("window")], "down"),
+            ("down", "release"): ([cancel(), store("release"), emit("click", "press"), arm("pulse")], "pulse"),
+            ("down", "timeout"): ([], "expired"),
+            ("expired", "release"): ([], "idle"),
+            ("pulse", "press"): ([cancel(), emit("click", "release"), store("press"), arm("window")], "down"),
+            ("pulse", "timeout"): ([emit("click", "release")], "idle"),
+        }
+    )
+
+
+def smart_toggle_spec():
+    """Toggle on short presses, hold on long presses.
+
+    A press released within the delay latches the output, the next press
+    releases it. A press held for longer than the delay is passed through.
+
+    Parameters: delay.
+    Outputs: output.
+    """
+    return GestureSpec(
+        "smart toggle",
+        ["idle", "pending", "held", "toggled", "untoggle"],
+        ["output"],
+        ["delay"],
+        {
+            ("idle", "press"): ([emit("output", "current"), arm("delay")], "pending"),
+            ("pending", "release"): ([cancel(), store("release")], "toggled"),
+            ("pending", "timeout"): ([], "held"),
+            ("held", "release"): ([emit("output", "current")], "idle"),
+            ("toggled", "press"): ([emit("output", "release")], "untoggle"),
+            ("untoggle", "release"): ([], "idle"),
+        }
+    )
@@ -0,0 +1,269 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Runs a profile without the main window.
+
+The headless runtime loads a profile, starts the code runner and pumps the Qt
+event loop so events emitted by the input backend get dispatched. Combined
+with the fake DILL backend this allows executing profiles without any
+hardware attached, for example to measure event dispatch throughput:
+
+    python -m gremlin.headless --profile my_profile.xml --fake --duration 10
+
+Adding --load DEVICESxAXES drives the profile with the synthetic load
+generator and prints the measured dispatch statistics on exit.
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+from lxml import etree as ElementTree
+
+from PySide6 import QtCore, QtWidgets
+
+import dinput
+import dinput.fake
+import gremlin.clock
+import gremlin.shared_state
+import gremlin.tick_engine
+from gremlin.input_types import InputType
+
+
+def fake_devices_from_profile(fname):
+    """Creates fake devices matching the joystick devices of a profile.
+
+    Each device gets the GUID and name stored in the profile and enough
+    axes, buttons, and hats to cover every input the profile maps.
+
+    :param fname path to the profile XML file
+    :return list of FakeDevice instances
+    """
+    import gremlin.util
+
+    devices = []
+    root = ElementTree.parse(fname).getroot()
+    for node in root.iter("device"):
+        if node.get("type", "joystick") != "joystick":
+            continue
+        counts = {
+            InputType.JoystickAxis: 0,
+            InputType.JoystickButton: 0,
+            InputType.JoystickHat: 0
+        }
+        for item in node.iterfind("mode/*"):
+            try:
+                input_type = InputType.to_enum(item.tag)
+            except ValueError:
+                continue
+            if input_type in counts:
+                counts[input_type] = max(counts[input_type], int(item.get("id", 0)))
+
+        devices.append(dinput.fake.FakeDevice(
+            node.get("name", "Fake device"),
+            axis_count=min(8, counts[InputType.JoystickAxis]),
+            button_count=counts[InputType.JoystickButton],
+            hat_count=counts[InputType.JoystickHat],
+            device_guid=gremlin.util.parse_guid(node.get("device-guid"))
+        ))
+    return devices
+
+
+class HeadlessRuntime:
+
+    """Loads and executes a profile without creating the main window."""
+
+    def __init__(self, backend=None):
+        """Creates a new headless runtime.
+
+        :param backend DILL backend to use, if None the DILL dll is used
+        """
+        self.backend = backend
+        self.profile = None
+        self.runner = None
+
+        gremlin.shared_state.is_headless = True
+
+        self._app = QtWidgets.QApplication.instance()
+        if self._app is None:
+            # no display required
+            os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+            self._app = QtWidgets.QApplication(sys.argv[:1])
+
+        if backend is not None:
+            dinput.DILL.set_backend(backend)
+        else:
+            from vjoy.vjoy_interface import VJoyInterface
+            VJoyInterface.initialize()
+            dinput.DILL.init()
+            dinput.DILL.initialize_capi()
+
+    def load_profile(self, fname):
+        """Loads the given profile.
+
+        :param fname path to the profile XML file
+        :return the loaded profile
+        """
+        import gremlin.base_profile
+        import gremlin.code_runner
+        import gremlin.event_handler
+        import gremlin.joystick_handling
+        import gremlin.plugin_manager
+
+        gremlin.joystick_handling.joystick_devices_initialization()
+        gremlin.plugin_manager.ActionPlugins()
+        gremlin.plugin_manager.ContainerPlugins()
+
+        self.runner = gremlin.code_runner.CodeRunner()
+
+        profile = gremlin.base_profile.Profile()
+        gremlin.shared_state.current_profile = profile
+        profile.from_xml(fname)
+
+        eh = gremlin.event_handler.EventHandler()
+        mode = profile.get_start_mode() or profile.get_root_mode()
+        eh.set_runtime_mode(mode)
+        eh.set_edit_mode(mode)
+
+        self.profile = profile
+        return profile
+
+    def start(self):
+        """Starts executing the loaded profile."""
+        self.runner.start(
+            self.profile.build_inheritance_tree(),
+            self.profile.settings,
+            gremlin.shared_state.runtime_mode,
+            self.profile
+        )
+        self.process_events()
+
+    def stop(self):
+        """Stops executing the profile."""
+        if self.runner is not None:
+            self.runner.stop()
+        self.process_events()
+
+    def terminate(self):
+        """Stops the profile and the input listener."""
+        import gremlin.event_handler
+        self.stop()
+        gremlin.event_handler.EventListener().terminate()
+
+    def process_events(self):
+        """Dispatches all pending events."""
+        self._app.processEvents(QtCore.QEventLoop.ProcessEventsFlag.AllEvents)
+
+    def run(self, duration=None):
+        """Dispatches events until the duration expires.
+
+        :param duration time in seconds to run for, None runs until interrupted
+        """
+        end_time = None if duration is None else time.time() + duration
+        try:
+            while end_time is None or time.time() < end_time:
+                self._app.processEvents(
+                    QtCore.QEventLoop.ProcessEventsFlag.AllEvents,
+                    10
+                )
+        except KeyboardInterrupt:
+            pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Runs a GremlinEx profile without UI")
+    parser.add_argument(
+        "--profile",
+        help="Path to the profile to execute",
+        required=True
+    )
+    parser.add_argument(
+        "--fake",
+        help="Use synthetic devices matching the profile instead of DirectInput",
+        action="store_true"
+    )
+    parser.add_argument(
+        "--duration",
+        help="Time in seconds to run the profile for",
+        type=float,
+        default=None
+    )
+    parser.add_argument(
+        "--load",
+        help="Generate synthetic load, e.g. 8x8 for 8 devices with 8 axes each",
+        default=None
+    )
+    parser.add_argument(
+        "--load-rate",
+        help="Samples per second and axis generated by the load generator",
+        type=float,
+        default=1000.0
+    )
+    parser.add_argument(
+        "--button-rate",
+        help="Button toggles per second and device generated by the load generator",
+        type=float,
+        default=0.0
+    )
+    parser.add_argument(
+        "--hat-rate",
+        help="Hat steps per second and device generated by the load generator",
+        type=float,
+        default=0.0
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+
+    backend = None
+    if args.fake:
+        backend = dinput.fake.FakeDILL(fake_devices_from_profile(args.profile))
+
+    runtime = HeadlessRuntime(backend)
+    runtime.load_profile(args.profile)
+    runtime.start()
+
+    generator = None
+    if args.load:
+        import gremlin.load_generator
+        device_count, axis_count = (int(v) for v in args.load.lower().split("x"))
+        generator = gremlin.load_generator.LoadGenerator(
+            device_count,
+            axis_count,
+            rate=args.load_rate,
+            button_rate=args.button_rate,
+            hat_rate=args.hat_rate
+        )
+        generator.start()
+
+    runtime.run(args.duration)
+
+    if generator is not None:
+        generator.stop()
+        runtime.process_events()
+        report = generator.report()
+        report["timers"] = gremlin.clock.TimerService().report()
+        report["ticks"] = gremlin.tick_engine.TickEngine().report()
+        print(json.dumps(report, indent=2))
+    runtime.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -20,7 +20,9 @@ import collections
 import functools
 import heapq
 import inspect
+import itertools
 import logging
+import sys
 import time
 import threading
 from typing import Callable
@@ -28,12 +30,15 @@ from typing import Callable
 from PySide6 import QtCore
 
 
+import gremlin.clock
 import gremlin.config
 import gremlin.gamepad_handling
+import gremlin.perf_stats
 from gremlin.types import GamePadOutput
 
 import gremlin.keyboard
 import gremlin.shared_state
+import gremlin.thread_registry
 import gremlin.types
 from dinput import DILL, GUID, GUID_Invalid
 import gremlin.util
@@ -43,7 +48,10 @@ import gremlin.input_types
 from . import error
 import gremlin.joystick_handling
 
-import win32api
+if sys.platform == "win32":
+    import win32api
+else:
+    from gremlin import fake_keyboard as win32api
 import gremlin.sendinput, gremlin.tts
 
 import socketserver, socket, msgpack
@@ -425,48 +433,139 @@ class CallbackRegistry:
         self._registry = {}
 
 
+class _PeriodicEntry:
+
+    """Scheduling state of a periodically executed function."""
+
+    def __init__(self, callback, interval, skip_missed):
+        self.callback = callback
+        self.interval = interval
+        self.skip_missed = skip_missed
+        self.plugin_callback = None
+        self.active = True
+        self.runs = 0
+        self.missed = 0
+        self.overrun = gremlin.perf_stats.SampleStats(history=1000)
+
+
 class PeriodicRegistry:
 
-    """Registry for periodically executed functions."""
+    """Registry for periodically executed functions.
+
+    Functions are executed on a dedicated thread which sleeps on a condition
+    variable until the next deadline and is woken up immediately when
+    functions are added or removed or the registry is stopped. Deadlines
+    advance by the function's interval from the previous deadline so that
+    execution does not drift over time.
+    """
 
     def __init__(self):
         """Creates a new instance."""
         self._registry = {}
         self._running = False
-        self._thread = threading.Thread(target=self._thread_loop)
+        self._thread = None
+        self._condition = threading.Condition()
         self._queue = []
+        self._counter = itertools.count()
         self._plugins = []
 
     def start(self):
         """Starts the event loop."""
-        # Only proceed if we have functions to call
-        if len(self._registry) == 0:
-            return
-
-        # Only create a new thread and start it if the thread is not
-        # currently running
-        self._running = True
-        if not self._thread.is_alive():
-            self._thread = threading.Thread(target=self._thread_loop)
+        with self._condition:
+            # Only proceed if we have functions to call
+            if len(self._registry) == 0:
+                return
+
+            # Only create a new thread and start it if the thread is not
+            # currently running
+            if self._thread is not None and self._thread.is_alive():
+                self._running = True
+                return
+
+            self._plugins = [
+                JoystickPlugin(),
+                VJoyPlugin(),
+                KeyboardPlugin()
+            ]
+            self._queue = []
+            now = gremlin.clock.now()
+            for entry in self._registry.values():
+                self._schedule(entry, now + entry.interval)
+            self._running = True
+            self._thread = threading.Thread(target=self._thread_loop, name="PeriodicRegistry", daemon=True)
             self._thread.start()
 
     def stop(self):
         """Stops the event loop."""
-        self._running = False
-        if self._thread.is_alive():
-            self._thread.join()
-
-    def add(self, callback, interval):
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+            thread = self._thread
+        if thread is not None and thread.is_alive() and \
+                thread is not threading.current_thread():
+            thread.join()
+
+    def add(self, callback, interval, skip_missed=False):
         """Adds a function to execute periodically.
 
         :param callback the function to execute
         :param interval the time between executions
+        :param skip_missed if True executions missed because the system was
+            busy are skipped, otherwise they are caught up on
         """
-        self._registry[callback] = (interval, callback)
+        with self._condition:
+            self._remove(callback)
+            entry = _PeriodicEntry(callback, interval, skip_missed)
+            self._registry[callback] = entry
+            if self._running:
+                self._schedule(entry, gremlin.clock.now() + interval)
+                self._condition.notify()
+
+    def remove(self, callback):
+        """Removes a periodically executed function.
+
+        :param callback the function to remove
+        """
+        with self._condition:
+            self._remove(callback)
+            self._condition.notify()
 
     def clear(self):
         """Clears the registry."""
-        self._registry = {}
+        with self._condition:
+            for entry in self._registry.values():
+                entry.active = False
+            self._registry = {}
+            self._queue = []
+            self._condition.notify()
+
+    def report(self):
+        """Returns execution statistics of every registered function.
+
+        :return dictionary indexed by function name, overruns in milliseconds
+        """
+        with self._condition:
+            entries = list(self._registry.values())
+        report = {}
+        for entry in entries:
+            overrun = entry.overrun.summary()
+            report[getattr(entry.callback, "__name__", str(entry.callback))] = {
+                "interval": entry.interval,
+                "runs": entry.runs,
+                "missed": entry.missed,
+                "overrun_ms": {key: value * 1000.0 if key != "count" else value
+                               for key, value in overrun.items()}
+            }
+        return report
+
+    def _remove(self, callback):
+        ''' removes a function, queued executions are discarded when due '''
+        entry = self._registry.pop(callback, None)
+        if entry is not None:
+            entry.active = False
+
+    def _schedule(self, entry, deadline):
+        heapq.heappush(self._queue, (deadline, next(self._counter), entry))
 
     def _install_plugins(self, callback):
         """Installs the current plugins into the given callback.
@@ -484,47 +583,60 @@ class PeriodicRegistry:
                 callback = plugin.install(callback, partial_fn)
         return callback
 
+    def _next_entry(self):
+        ''' waits for the next due function, None once stopped '''
+        with self._condition:
+            while self._running:
+                if not self._queue:
+                    self._condition.wait()
+                    continue
+                deadline, _, entry = self._queue[0]
+                if not entry.active:
+                    heapq.heappop(self._queue)
+                    continue
+                delay = deadline - gremlin.clock.now()
+                if delay <= 0:
+                    heapq.heappop(self._queue)
+                    return deadline, entry
+                self._condition.wait(delay)
+        return None
 
     def _thread_loop(self):
         """Main execution loop run in a separate thread."""
-        import uuid
-        # Setup plugins to use
-        self._plugins = [
-            JoystickPlugin(),
-            VJoyPlugin(),
-            KeyboardPlugin()
-        ]
-        callback_map = {}
-        period_map = {}
-        # Populate the queue
-        self._queue = []
-        for item in self._registry.values():
-            plugin_cb = self._install_plugins(item[1])
-            node_id = str(uuid.uuid1())
-            callback_map[node_id] = plugin_cb
-            period_map[node_id] = item[0]
-            value = time.time() + period_map[node_id]
-            heapq.heappush(self._queue, (value, node_id))
-
-
-        # Main thread loop
-        while self._running:
-            # Process all events that require running
-            if self._queue:
-                while self._queue[0][0] < time.time():
-                    value, node_id = heapq.heappop(self._queue)
-                    callback_map[node_id]()
-
-                    heapq.heappush(
-                        self._queue,
-                        (time.time() + period_map[node_id], node_id)
-                    )
-
-            # Sleep until either the next function needs to be run or
-            # our timeout expires
-            time.sleep(min(self._queue[0][0] - time.time(), 1.0))
+        syslog = logging.getLogger("system")
+        worker = gremlin.thread_registry.register("PeriodicRegistry")
+        while True:
+            worker.idle()
+            item = self._next_entry()
+            if item is None:
+                worker.unregister()
+                return
+            worker.beat()
+            deadline, entry = item
+
+            if entry.plugin_callback is None:
+                entry.plugin_callback = self._install_plugins(entry.callback)
+            try:
+                entry.plugin_callback()
+            except Exception as err:
+                syslog.error(f"Periodic function {entry.callback}: {err}")
+            entry.runs += 1
+
+            # Schedule relative to the previous deadline to avoid drift,
+            # the function overran if the next deadline already passed
+            next_deadline = deadline + entry.interval
+            finished = gremlin.clock.now()
+            if finished > next_deadline:
+                entry.overrun.add(finished - next_deadline)
+                if entry.skip_missed:
+                    missed = int((finished - next_deadline) / entry.interval) + 1
+                    entry.missed += missed
+                    next_deadline += missed * entry.interval
+
+            with self._condition:
+                if entry.active:
+                    self._schedule(entry, next_deadline)
 
-            
 
 class SimpleRegistry:
 
@@ -845,9 +957,13 @@ class RPCGremlin():
     def _run(self):
         import struct
         syslog.debug("Starting gremlin listener...")
+        worker = gremlin.thread_registry.register("RPCGremlin", stall_timeout=None)
         self._server = GremlinServer(('', self._port),GremlinSocketHandler)
-        self._server_thread = threading.Thread(target=self._server.serve_forever)
+        self._server_thread = threading.Thread(target=self._server.serve_forever, name="RPCGremlin server")
         self._server_thread.daemon = True
+        gremlin.thread_registry.ThreadRegistry().register(
+            "RPCGremlin server", stall_timeout=None, thread=self._server_thread
+        )
         try:
             self._server_thread.start()
             # enable listen to multicast UDP
@@ -869,6 +985,7 @@ class RPCGremlin():
         proxy = gremlin.joystick_handling.VJoyProxy()
         # release any locks on devices
         proxy.reset()
+        worker.unregister()
 
         
     @property
@@ -1023,8 +1140,10 @@ class RemoteClient(QtCore.QObject):
     def _alive_ticker(self):
         ''' sends an alive packet to keep the remote alive '''
 
+        worker = gremlin.thread_registry.register("remote_alive", stall_timeout=5.0)
         notify_time = time.time()
         while not self._alive_thread_stop_requested:
+            worker.beat()
             if time.time() >= notify_time:
                 data = {}
                 data["sender"] = self._id
@@ -1034,6 +1153,7 @@ class RemoteClient(QtCore.QObject):
                 syslog.debug("Alive heartbeat")
                 notify_time = time.time() + 30
             time.sleep(1)
+        worker.unregister()
         
 
     def _send(self, data = None):
@@ -1272,6 +1392,9 @@ class OscClient(QtCore.QObject):
         ''' called when an OSC message is received '''
         from gremlin.ui.osc_device import OscInputItem, OscDeviceTabWidget
         from gremlin.input_types import InputType
+        from gremlin.types import RawInputSource
+        if self._event_listener._input_taps:
+            self._event_listener.notify_input_tap(RawInputSource.Osc, message, args)
         # get the input items behind this message
         input_item = OscInputItem()
         input_item.message = message # this decodes the data
@@ -1377,6 +1500,9 @@ class MidiClient(QtCore.QObject):
         ''' called when a midi messages is provided by the listener  '''
         from gremlin.ui.midi_device import MidiInputItem, MidiDeviceTabWidget, MidiCommandType
         from gremlin.input_types import InputType
+        from gremlin.types import RawInputSource
+        if self._event_listener._input_taps:
+            self._event_listener.notify_input_tap(RawInputSource.Midi, port_name, port_index, message)
         #self._callback(port_name, port_index, message)
 
         # get the input items behind this message
@@ -2192,10 +2318,12 @@ def keyboard(key_name, mode, always_execute=False):
 
 
 ''' PERIODIC DECORATOR '''
-def periodic(interval):
+def periodic(interval, skip_missed=False):
     """Decorator for periodic function callbacks.
 
     :param interval the duration between executions of the function
+    :param skip_missed if True executions missed because the system was busy
+        are skipped instead of being caught up on
     """
 
     def wrap(callback):
@@ -2204,7 +2332,7 @@ def periodic(interval):
         def wrapper_fn(*args, **kwargs):
             callback(*args, **kwargs)
 
-        periodic_registry.add(wrapper_fn, interval)
+        periodic_registry.add(wrapper_fn, interval, skip_missed)
 
         return wrapper_fn
 
@@ -0,0 +1,463 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Recording and deterministic replay of the raw input stream.
+
+The recorder taps the raw input entry points of the EventListener and writes
+every joystick, keyboard, MIDI, and OSC input into a compact binary log. The
+replayer feeds such a log back into the same entry points, either in real
+time or as fast as possible, so the complete processing pipeline runs again.
+
+Log layout (little endian):
+
+    header: b"GREC" + uint16 version
+    record: float64 timestamp, uint8 RawInputSource, uint16 size, payload
+
+Payloads:
+
+    Joystick: GUID (uint32, uint16, uint16, 8 bytes), uint8 input type,
+              uint8 input index, int32 value
+    Keyboard: uint16 virtual code, uint16 scan code, bool extended, bool pressed
+    Midi:     uint16 port index, string port name, raw MIDI message bytes
+    Osc:      string address, uint8 argument count, tagged arguments
+
+Strings are stored as uint16 length followed by utf-8 data.
+"""
+
+import logging
+import struct
+import threading
+import time
+
+import dinput
+import gremlin.axis_batch
+import gremlin.error
+from gremlin.types import RawInputSource
+
+
+_magic = b"GREC"
+_version = 1
+
+_header = struct.Struct("<4sH")
+_record = struct.Struct("<dBH")
+_joystick = struct.Struct("<IHH8sBBi")
+_keyboard = struct.Struct("<HH??")
+_uint16 = struct.Struct("<H")
+_uint8 = struct.Struct("<B")
+_float64 = struct.Struct("<d")
+_int64 = struct.Struct("<q")
+
+# DILL input type value of axis events
+_dill_axis = 1
+
+
+def _pack_string(value):
+    data = value.encode("utf-8")
+    return _uint16.pack(len(data)) + data
+
+
+def _unpack_string(buffer, offset):
+    size, = _uint16.unpack_from(buffer, offset)
+    offset += _uint16.size
+    return buffer[offset:offset + size].decode("utf-8"), offset + size
+
+
+def _pack_osc_args(args):
+    data = [_uint8.pack(len(args))]
+    for arg in args:
+        if isinstance(arg, bool):
+            data.append(b"T" if arg else b"F")
+        elif isinstance(arg, int):
+            data.append(b"i" + _int64.pack(arg))
+        elif isinstance(arg, float):
+            data.append(b"f" + _float64.pack(arg))
+        else:
+            data.append(b"s" + _pack_string(str(arg)))
+    return b"".join(data)
+
+
+def _unpack_osc_args(buffer, offset):
+    count, = _uint8.unpack_from(buffer, offset)
+    offset += _uint8.size
+    args = []
+    for _ in range(count):
+        tag = buffer[offset:offset + 1]
+        offset += 1
+        if tag == b"T":
+            args.append(True)
+        elif tag == b"F":
+            args.append(False)
+        elif tag == b"i":
+            args.append(_int64.unpack_from(buffer, offset)[0])
+            offset += _int64.size
+        elif tag == b"f":
+            args.append(_float64.unpack_from(buffer, offset)[0])
+            offset += _float64.size
+        else:
+            value, offset = _unpack_string(buffer, offset)
+            args.append(value)
+    return args, offset
+
+
+def encode_payload(source, *args):
+    """Encodes raw input data into its binary representation.
+
+    :param source the RawInputSource the data originates from
+    :param args the raw data as provided to the input tap
+    :return bytes representing the data
+    """
+    if source == RawInputSource.Joystick:
+        data, = args
+        guid = data.device_guid
+        return _joystick.pack(
+            guid.Data1,
+            guid.Data2,
+            guid.Data3,
+            bytes(guid.Data4),
+            data.input_type,
+            data.input_index,
+            data.value
+        )
+    elif source == RawInputSource.Keyboard:
+        event, = args
+        return _keyboard.pack(
+            event.virtual_code,
+            event.scan_code,
+            event.is_extended,
+            event.is_pressed
+        )
+    elif source == RawInputSource.Midi:
+        port_name, port_index, message = args
+        return _uint16.pack(port_index) + _pack_string(port_name) + \
+            bytes(message.bytes())
+    elif source == RawInputSource.Osc:
+        message, osc_args = args
+        return _pack_string(message) + _pack_osc_args(list(osc_args))
+    raise ValueError(f"Unknown raw input source: {source}")
+
+
+def decode_payload(source, payload):
+    """Decodes a binary payload into the values needed to replay it.
+
+    Joystick data is returned as a dinput._JoystickInputData structure, keyboard
+    data as (virtual code, scan code, extended, pressed), MIDI data as
+    (port name, port index, message bytes), and OSC data as (address, args).
+
+    :param source the RawInputSource of the payload
+    :param payload the bytes to decode
+    :return tuple of decoded values
+    """
+    if source == RawInputSource.Joystick:
+        data1, data2, data3, data4, input_type, input_index, value = \
+            _joystick.unpack(payload)
+        data = dinput._JoystickInputData()
+        data.device_guid.Data1 = data1
+        data.device_guid.Data2 = data2
+        data.device_guid.Data3 = data3
+        for i, byte in enumerate(data4):
+            data.device_guid.Data4[i] = byte
+        data.input_type = input_type
+        data.input_index = input_index
+        data.value = value
+        return (data,)
+    elif source == RawInputSource.Keyboard:
+        return _keyboard.unpack(payload)
+    elif source == RawInputSource.Midi:
+        port_index, = _uint16.unpack_from(payload, 0)
+        port_name, offset = _unpack_string(payload, _uint16.size)
+        return (port_name, port_index, payload[offset:])
+    elif source == RawInputSource.Osc:
+        message, offset = _unpack_string(payload, 0)
+        args, _ = _unpack_osc_args(payload, offset)
+        return (message, args)
+    raise ValueError(f"Unknown raw input source: {source}")
+
+
+def read_log(fname):
+    """Reads all records of an input log.
+
+    :param fname path of the log file
+    :return list of (timestamp, RawInputSource, payload bytes) tuples
+    """
+    with open(fname, "rb") as fh:
+        buffer = fh.read()
+
+    magic, version = _header.unpack_from(buffer, 0)
+    if magic != _magic:
+        raise gremlin.error.GremlinError(f"Not an input log: {fname}")
+    if version != _version:
+        raise gremlin.error.GremlinError(f"Unsupported input log version {version} in {fname}")
+
+    records = []
+    offset = _header.size
+    while offset < len(buffer):
+        timestamp, source, size = _record.unpack_from(buffer, offset)
+        offset += _record.size
+        records.append((timestamp, RawInputSource(source), buffer[offset:offset + size]))
+        offset += size
+    return records
+
+
+class InputLogWriter:
+
+    """Writes raw input records to a binary log file."""
+
+    def __init__(self, fname):
+        """Creates a new writer.
+
+        :param fname path of the file to write
+        """
+        self._file = open(fname, "wb")
+        self._file.write(_header.pack(_magic, _version))
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def write(self, timestamp, source, payload):
+        """Appends a record to the log.
+
+        :param timestamp time of the input in seconds since the recording start
+        :param source the RawInputSource of the record
+        :param payload the encoded input data
+        """
+        with self._lock:
+            self._file.write(_record.pack(timestamp, int(source), len(payload)))
+            self._file.write(payload)
+            self.count += 1
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+class InputRecorder:
+
+    """Records the raw input received by the EventListener."""
+
+    def __init__(self, fname):
+        """Creates a new recorder.
+
+        :param fname path of the log file to create
+        """
+        self.fname = fname
+        self._writer = None
+        self._start_time = 0
+
+    @property
+    def is_recording(self):
+        return self._writer is not None
+
+    @property
+    def count(self):
+        ''' number of records written so far '''
+        return self._writer.count if self._writer else 0
+
+    def start(self):
+        """Starts recording."""
+        import gremlin.event_handler
+        if self._writer is not None:
+            return
+        self._writer = InputLogWriter(self.fname)
+        self._start_time = time.perf_counter()
+        gremlin.event_handler.EventListener().add_input_tap(self._tap)
+        logging.getLogger("system").info(f"Input recording started: {self.fname}")
+
+    def stop(self):
+        """Stops recording and closes the log."""
+        import gremlin.event_handler
+        if self._writer is None:
+            return
+        gremlin.event_handler.EventListener().remove_input_tap(self._tap)
+        self._writer.close()
+        logging.getLogger("system").info(f"Input recording stopped: {self._writer.count} events written")
+        self._writer = None
+
+    def _tap(self, source, *args):
+        writer = self._writer
+        if writer is None:
+            return
+        try:
+            writer.write(
+                time.perf_counter() - self._start_time,
+                source,
+                encode_payload(source, *args)
+            )
+        except Exception as err:
+            logging.getLogger("system").error(f"Input recording: unable to record {source.name} input: {err}")
+
+
+class InputReplayer:
+
+    """Replays a recorded input log through the EventListener."""
+
+    def __init__(self, fname):
+        """Creates a new replayer.
+
+        :param fname path of the log file to replay
+        """
+        self.fname = fname
+        self.records = read_log(fname)
+        self._stop_requested = False
+
+    def stop(self):
+        """Requests an ongoing replay to stop."""
+        self._stop_requested = True
+
+    def play(self, realtime=True, speed=1.0):
+        """Feeds all recorded inputs back into the processing pipeline.
+
+        :param realtime if True the recorded timing is reproduced, otherwise
+            inputs are replayed as fast as possible
+        :param speed time scaling applied in realtime mode
+        :return dictionary with the replay statistics
+        """
+        import gremlin.event_handler
+        el = gremlin.event_handler.EventListener()
+        # joystick input is dispatched without the DILL callback, which would
+        # register the replaying thread as the DILL dispatch thread
+        handlers = {
+            RawInputSource.Joystick: el._dispatch_joystick_event,
+            RawInputSource.Keyboard: self._replay_keyboard,
+            RawInputSource.Midi: self._replay_midi,
+            RawInputSource.Osc: self._replay_osc
+        }
+
+        self._stop_requested = False
+        count = 0
+        start_time = time.perf_counter()
+        for timestamp, source, payload in self.records:
+            if self._stop_requested:
+                break
+            if realtime:
+                delay = timestamp / speed - (time.perf_counter() - start_time)
+                if delay > 0:
+                    time.sleep(delay)
+            handlers[source](*decode_payload(source, payload))
+            count += 1
+
+        elapsed = time.perf_counter() - start_time
+        return {
+            "events": count,
+            "elapsed": elapsed,
+            "events_per_second": count / elapsed if elapsed > 0 else 0.0
+        }
+
+    def axis_streams(self):
+        """Returns the recorded samples of every joystick axis.
+
+        The samples are returned in the batch representation of
+        gremlin.axis_batch, i.e. as numpy arrays if numpy is available.
+
+        :return dictionary mapping (device guid, axis index) to a tuple of
+            the timestamps and the raw values of the axis samples
+        """
+        streams = {}
+        for timestamp, source, payload in self.records:
+            if source != RawInputSource.Joystick:
+                continue
+            data, = decode_payload(source, payload)
+            if data.input_type != _dill_axis:
+                continue
+            key = (dinput.GUID(data.device_guid), int(data.input_index))
+            timestamps, values = streams.setdefault(key, ([], []))
+            timestamps.append(timestamp)
+            values.append(int(data.value))
+
+        return {
+            key: (
+                gremlin.axis_batch.as_samples(timestamps),
+                gremlin.axis_batch.as_samples(values)
+            ) for key, (timestamps, values) in streams.items()
+        }
+
+    def transform_axis_streams(self):
+        """Returns the recorded axis samples after calibration and curves.
+
+        Unlike play this does not dispatch any events, the samples of every
+        axis are transformed as a single batch.
+
+        :return dictionary mapping (device guid, axis index) to a tuple of
+            the timestamps, calibrated values, and curved values
+        """
+        import gremlin.event_handler
+        el = gremlin.event_handler.EventListener()
+        result = {}
+        for key, (timestamps, values) in self.axis_streams().items():
+            result[key] = (timestamps,) + \
+                el.apply_transforms_batch(key[0], key[1], values)
+        return result
+
+    def _replay_keyboard(self, virtual_code, scan_code, is_extended, is_pressed):
+        import gremlin.event_handler
+        from gremlin.windows_event_hook import KeyEvent
+        gremlin.event_handler.EventListener()._keyboard_handler(
+            KeyEvent(virtual_code, scan_code, is_extended, is_pressed, False)
+        )
+
+    def _replay_midi(self, port_name, port_index, message_bytes):
+        import mido
+        import gremlin.input_devices
+        gremlin.input_devices.midi_client._midi_message_cb(
+            port_name,
+            port_index,
+            mido.Message.from_bytes(message_bytes)
+        )
+
+    def _replay_osc(self, message, args):
+        import gremlin.input_devices
+        gremlin.input_devices.osc_client._osc_message_cb(message, args)
+
+
+class OutputCapture:
+
+    """Captures the values written to vJoy devices.
+
+    Used together with the replayer this provides the output of a profile
+    for a given input stream, e.g. to compare against a known good result.
+    """
+
+    _functions = ("SetAxis", "SetBtn", "SetContPov", "SetDiscPov")
+
+    def __init__(self):
+        self.outputs = []
+        self._originals = {}
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Starts capturing vJoy output."""
+        from vjoy.vjoy_interface import VJoyInterface
+        if self._originals:
+            return
+        for name in OutputCapture._functions:
+            original = getattr(VJoyInterface, name, None)
+            if original is None:
+                continue
+            self._originals[name] = original
+            setattr(VJoyInterface, name, self._wrap(name, original))
+
+    def stop(self):
+        """Restores the vJoy functions."""
+        from vjoy.vjoy_interface import VJoyInterface
+        for name, original in self._originals.items():
+            setattr(VJoyInterface, name, original)
+        self._originals = {}
+
+    def _wrap(self, name, function):
+        def capture(*args):
+            with self._lock:
+                self.outputs.append((name,) + tuple(args))
+            return function(*args)
+        return capture
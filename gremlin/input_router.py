@@ -0,0 +1,178 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+"""Routes joystick events to the handlers subscribed to their input.
+
+Runtime consumers interested in a single input, such as gated axes or merged
+axes, subscribe with the (device_guid, input_type, input_id) of the input
+instead of connecting to the joystick event signal of the EventListener and
+filtering every event of every device themselves. The router is connected to
+the signal while at least one subscription exists and calls only the
+handlers subscribed to the input an event originates from.
+"""
+
+import logging
+import threading
+
+import gremlin.perf_stats
+from gremlin.singleton_decorator import SingletonDecorator
+
+
+@SingletonDecorator
+class InputRouter:
+
+    """Dispatches joystick events to per input subscribers."""
+
+    def __init__(self):
+        """Creates a new instance."""
+        self._lock = threading.Lock()
+        # handlers indexed by (device_guid, input_type, input_id), the
+        # handler tuples are replaced rather than modified so dispatching
+        # does not need to hold the lock
+        self._routes = {}
+        self._connected = False
+
+        # Statistics
+        self.events = 0
+        self.handler_calls = 0
+        self.handlers_per_event = gremlin.perf_stats.SampleStats()
+
+    def subscribe(self, device_guid, input_type, input_id, handler):
+        """Subscribes a handler to the events of an input.
+
+        :param device_guid GUID of the device providing the input
+        :param input_type InputType of the input
+        :param input_id identifier of the input on the device
+        :param handler callable invoked with the event
+        """
+        key = (device_guid, input_type, input_id)
+        with self._lock:
+            handlers = self._routes.get(key, ())
+            if handler in handlers:
+                return
+            self._routes[key] = handlers + (handler,)
+            connect = not self._connected
+            self._connected = True
+        if connect:
+            self._connect(True)
+
+    def unsubscribe(self, device_guid, input_type, input_id, handler):
+        """Removes the subscription of a handler to an input.
+
+        :param device_guid GUID of the device providing the input
+        :param input_type InputType of the input
+        :param input_id identifier of the input on the device
+        :param handler the previously subscribed callable
+        """
+        key = (device_guid, input_type, input_id)
+        with self._lock:
+            handlers = tuple(h for h in self._routes.get(key, ()) if h != handler)
+            if handlers:
+                self._routes[key] = handlers
+            else:
+                self._routes.pop(key, None)
+            disconnect = self._connected and not self._routes
+            if disconnect:
+                self._connected = False
+        if disconnect:
+            self._connect(False)
+
+    def clear(self):
+        """Removes all subscriptions."""
+        with self._lock:
+            self._routes = {}
+            disconnect = self._connected
+            self._connected = False
+        if disconnect:
+            self._connect(False)
+
+    @property
+    def subscriptions(self):
+        """Returns the number of subscribed handlers."""
+        with self._lock:
+            return sum(len(handlers) for handlers in self._routes.values())
+
+    def dispatch(self, event):
+        """Calls the handlers subscribed to the input of the event.
+
+        :param event the joystick event to route
+        :return number of handlers called
+        """
+        handlers = self._routes.get(
+            (event.device_guid, event.event_type, event.identifier), ()
+        )
+        count = len(handlers)
+        self.events += 1
+        self.handler_calls += count
+        self.handlers_per_event.add(count)
+        for handler in handlers:
+            try:
+                handler(event)
+            except Exception as e:
+                logging.getLogger("system").error(
+                    f"InputRouter: error in handler {handler}: {e}"
+                )
+        return count
+
+    def reset_statistics(self):
+        """Resets the dispatch statistics."""
+        self.events = 0
+        self.handler_calls = 0
+        self.handlers_per_event.reset()
+
+    def report(self):
+        """Returns the subscription and dispatch statistics."""
+        with self._lock:
+            inputs = len(self._routes)
+        return {
+            "inputs": inputs,
+            "subscriptions": self.subscriptions,
+            "events": self.events,
+            "handler_calls": self.handler_calls,
+            "handlers_per_event": self.handlers_per_event.summary()
+        }
+
+    def _connect(self, connect):
+        ''' connects or disconnects the router from the joystick events '''
+        import gremlin.event_handler
+        el = gremlin.event_handler.EventListener()
+        if connect:
+            el.joystick_event.connect(self.dispatch)
+        else:
+            el.joystick_event.disconnect(self.dispatch)
+
+
+def subscribe(device_guid, input_type, input_id, handler):
+    """Subscribes a handler to the events of an input.
+
+    :param device_guid GUID of the device providing the input
+    :param input_type InputType of the input
+    :param input_id identifier of the input on the device
+    :param handler callable invoked with the event
+    """
+    InputRouter().subscribe(device_guid, input_type, input_id, handler)
+
+
+def unsubscribe(device_guid, input_type, input_id, handler):
+    """Removes the subscription of a handler to an input.
+
+    :param device_guid GUID of the device providing the input
+    :param input_type InputType of the input
+    :param input_id identifier of the input on the device
+    :param handler the previously subscribed callable
+    """
+    InputRouter().unsubscribe(device_guid, input_type, input_id, handler)
@@ -0,0 +1,161 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+"""Sorted index of the value intervals configured on an axis.
+
+The boundaries of all intervals registered on an axis split the axis into
+slots: every boundary value is a slot and so is every open segment between
+two consecutive boundaries. The set of intervals containing a value is the
+same for every value of a slot, so it is computed once per slot when the
+index is built. Locating a value then only takes a bisection, and comparing
+the slot with the one of the previous value tells whether any interval was
+entered or exited.
+"""
+
+import bisect
+import threading
+
+from gremlin.singleton_decorator import SingletonDecorator
+
+
+class IntervalIndex:
+
+    """Index of the intervals of the owners registered on one axis."""
+
+    def __init__(self):
+        """Creates a new instance."""
+        self._lock = threading.Lock()
+        # intervals (low, high, low_included, high_included) by owner
+        self._intervals = {}
+        # (boundaries, owners by slot), None until built
+        self._table = None
+
+    def add(self, owner, intervals):
+        """Registers the intervals of an owner, replacing previous ones.
+
+        :param owner object the intervals belong to
+        :param intervals list of (low, high, low_included, high_included)
+        """
+        with self._lock:
+            self._intervals[owner] = [
+                (min(low, high), max(low, high), low_included, high_included)
+                for low, high, low_included, high_included in intervals
+            ]
+            self._table = None
+
+    def remove(self, owner):
+        """Removes the intervals of an owner.
+
+        :param owner object whose intervals to remove
+        """
+        with self._lock:
+            if self._intervals.pop(owner, None) is not None:
+                self._table = None
+
+    def __len__(self):
+        return len(self._intervals)
+
+    def lookup(self, value):
+        """Locates a value.
+
+        :param value the axis value to locate
+        :return (slot, owners) with the slot the value falls into and the
+            frozenset of owners with an interval containing the value
+        """
+        table = self._table
+        if table is None:
+            table = self._build()
+        points, slots = table
+        index = bisect.bisect_left(points, value)
+        if index < len(points) and points[index] == value:
+            slot = 2 * index + 1
+        else:
+            slot = 2 * index
+        return slot, slots[slot]
+
+    def _build(self):
+        ''' computes the owners of every slot '''
+        with self._lock:
+            intervals = [
+                (owner, interval)
+                for owner, owner_intervals in self._intervals.items()
+                for interval in owner_intervals
+            ]
+            points = sorted(set(
+                value for _, (low, high, _, _) in intervals for value in (low, high)
+            ))
+            slots = [frozenset()]
+            for index, point in enumerate(points):
+                # slot of the boundary itself
+                slots.append(frozenset(
+                    owner for owner, (low, high, low_included, high_included) in intervals
+                    if low < point < high
+                    or (point == low and low_included)
+                    or (point == high and high_included)
+                ))
+                # slot of the open segment up to the next boundary
+                if index + 1 < len(points):
+                    slots.append(frozenset(
+                        owner for owner, (low, high, _, _) in intervals
+                        if low <= point and high >= points[index + 1]
+                    ))
+            slots.append(frozenset())
+            self._table = (points, slots)
+            return self._table
+
+
+@SingletonDecorator
+class IntervalIndexRegistry:
+
+    """Shares one interval index per axis."""
+
+    def __init__(self):
+        """Creates a new instance."""
+        self._lock = threading.Lock()
+        self._indices = {}
+
+    def get(self, key):
+        """Returns the index of an axis, creating it if needed.
+
+        :param key identifier of the axis, such as (device_guid, input_id)
+        :return IntervalIndex of the axis
+        """
+        with self._lock:
+            index = self._indices.get(key)
+            if index is None:
+                index = IntervalIndex()
+                self._indices[key] = index
+            return index
+
+    def remove(self, key, owner):
+        """Removes the intervals of an owner from the index of an axis.
+
+        :param key identifier of the axis
+        :param owner object whose intervals to remove
+        """
+        with self._lock:
+            index = self._indices.get(key)
+            if index is None:
+                return
+            index.remove(owner)
+            if len(index) == 0:
+                del self._indices[key]
+
+    def clear(self):
+        """Removes all indices."""
+        with self._lock:
+            self._indices = {}
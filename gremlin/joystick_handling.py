@@ -369,7 +369,12 @@ def joystick_devices_initialization():
     # their matching SDL counterparts have been found.
     vjoy_proxy = VJoyProxy()
     should_terminate = False
-    for i in range(1, 17):
+    vjoy_ids = range(1, 17)
+    if vjoy.VJoyInterface.vjoy_dll is None:
+        # vJoy interface not loaded (headless runtime on a fake input backend)
+        syslog.warning("vJoy interface not initialized - skipping vJoy device association")
+        vjoy_ids = []
+    for i in vjoy_ids:
         # Only process devices that actually exist
         if not vjoy.device_exists(i):
             continue
@@ -21,15 +21,22 @@ import ctypes
 import logging
 from ctypes import wintypes
 import enum
-import win32api
-import win32con
+import sys
 
 # from gremlin.base_classes import TraceableList
 from gremlin.types import MouseButton
 # from gremlin.singleton_decorator import SingletonDecorator
 import gremlin.config
 
-user32 = ctypes.WinDLL("user32")
+if sys.platform == "win32":
+    import win32api
+    import win32con
+    user32 = ctypes.WinDLL("user32")
+else:
+    # no Windows keyboard API, e.g. headless runtime on a CI machine
+    from gremlin import fake_keyboard as win32api
+    from gremlin import fake_keyboard as win32con
+    from gremlin import fake_keyboard as user32
 
 def _create_function(lib_name, fn_name, param_types, return_type):
     """Creates a handle to a windows dll library function.
@@ -40,6 +47,8 @@ def _create_function(lib_name, fn_name, param_types, return_type):
     :param return_type return parameter type
     :return function handle
     """
+    if sys.platform != "win32":
+        return getattr(user32, fn_name)
     fn = getattr(ctypes.WinDLL(lib_name), fn_name)
     fn.argtypes = param_types
     fn.restype = return_type
@@ -1051,13 +1060,12 @@ class KeyMap:
     @staticmethod
     def toggle_numlock():
         import gremlin.sendinput
-        # key down
-        flags = win32con.KEYEVENTF_EXTENDEDKEY 
-        gremlin.sendinput.send_key(win32con.VK_NUMLOCK, 0x45, flags)
-
-        # key up
-        flags |= win32con.KEYEVENTF_KEYUP
-        gremlin.sendinput.send_key(win32con.VK_NUMLOCK, 0x45, flags)
+        # key down followed by key up
+        flags = win32con.KEYEVENTF_EXTENDEDKEY
+        gremlin.sendinput.send_keys([
+            (win32con.VK_NUMLOCK, 0x45, flags),
+            (win32con.VK_NUMLOCK, 0x45, flags | win32con.KEYEVENTF_KEYUP)
+        ])
 
     
     # holds the number pad scan codes
@@ -0,0 +1,253 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Synthetic input load generator used to stress test event dispatch.
+
+The generator simulates a number of devices producing axis samples at a
+fixed rate as well as button storms and hat sweeps. Inputs are injected into
+the EventListener raw joystick dispatch on the generator thread so they
+traverse the complete pipeline: calibration, curves, signal dispatch, and the
+profile's callbacks.
+
+A probe connected to the EventListener joystick signal measures when each
+generated event has been dispatched, which yields queue depth and dispatch
+latency. When the number of pending events exceeds the configured limit axis
+samples are coalesced, i.e. skipped as a newer sample supersedes them, and
+button and hat events are dropped.
+"""
+
+import collections
+import logging
+import math
+import threading
+import time
+import uuid
+
+from PySide6 import QtCore
+
+import dinput
+import dinput.fake
+import gremlin.event_handler
+import gremlin.perf_stats
+
+
+# DILL hat values swept by the generator
+_hat_sweep = [0, 4500, 9000, 13500, 18000, 22500, 27000, 31500, -1]
+
+
+class LoadGenerator(QtCore.QObject):
+
+    """Generates synthetic joystick input at configurable rates."""
+
+    def __init__(
+            self,
+            device_count=8,
+            axis_count=8,
+            rate=1000.0,
+            button_rate=0.0,
+            hat_rate=0.0,
+            max_pending=10000
+    ):
+        """Creates a new load generator.
+
+        :param device_count number of simulated devices
+        :param axis_count number of axes per device, at most 8
+        :param rate samples per second sent for every axis
+        :param button_rate button toggles per second and device
+        :param hat_rate hat steps per second and device
+        :param max_pending maximum number of generated events waiting to be
+            dispatched before events are coalesced or dropped
+        """
+        super().__init__()
+        self.device_count = device_count
+        self.axis_count = min(8, axis_count)
+        self.rate = rate
+        self.button_rate = button_rate
+        self.hat_rate = hat_rate
+        self.max_pending = max_pending
+
+        self._guids = [
+            dinput.fake.guid_from_uuid(uuid.uuid4()) for _ in range(device_count)
+        ]
+        self._guid_set = set(self._guids)
+        self._thread = None
+        self._stop_event = threading.Event()
+
+        self._pending = collections.deque()
+        self.latency = gremlin.perf_stats.SampleStats()
+        self._reset_counters()
+
+    @property
+    def device_guids(self):
+        return list(self._guids)
+
+    def _reset_counters(self):
+        self.sent = 0
+        self.dispatched = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.late_ticks = 0
+        self.max_queue_depth = 0
+        self.latency.reset()
+        self._start_time = None
+        self._stop_time = None
+
+    @property
+    def queue_depth(self):
+        ''' number of generated events not dispatched yet '''
+        return len(self._pending)
+
+    def start(self):
+        """Starts generating input."""
+        if self._thread is not None:
+            return
+        self._reset_counters()
+        self._pending.clear()
+        gremlin.event_handler.EventListener().joystick_event.connect(self._probe)
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="LoadGenerator", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stops generating input."""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        gremlin.event_handler.EventListener().joystick_event.disconnect(self._probe)
+
+    def report(self):
+        """Returns the statistics of the current or last run.
+
+        :return dictionary of the measured values, latencies in milliseconds
+        """
+        if self._start_time is None:
+            elapsed = 0.0
+        else:
+            end_time = self._stop_time or time.perf_counter()
+            elapsed = end_time - self._start_time
+        latency = self.latency.summary()
+        return {
+            "elapsed": elapsed,
+            "sent": self.sent,
+            "dispatched": self.dispatched,
+            "events_per_second": self.dispatched / elapsed if elapsed > 0 else 0.0,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            "late_ticks": self.late_ticks,
+            "latency_ms": {key: value * 1000.0 if key != "count" else value
+                           for key, value in latency.items()}
+        }
+
+    @QtCore.Slot(gremlin.event_handler.Event)
+    def _probe(self, event):
+        ''' runs on dispatch of every joystick event '''
+        if event.device_guid not in self._guid_set:
+            return
+        try:
+            sent_time = self._pending.popleft()
+        except IndexError:
+            return
+        self.dispatched += 1
+        self.latency.add(time.perf_counter() - sent_time)
+
+    def _send(self, guid, input_type, index, value, can_coalesce):
+        ''' injects a single raw input '''
+        el = gremlin.event_handler.EventListener()
+        if el._joystick_suspend_count > 0:
+            return
+        depth = len(self._pending)
+        if depth >= self.max_pending:
+            if can_coalesce:
+                self.coalesced += 1
+            else:
+                self.dropped += 1
+            return
+        if depth + 1 > self.max_queue_depth:
+            self.max_queue_depth = depth + 1
+
+        data = dinput._JoystickInputData()
+        data.device_guid = guid.ctypes
+        data.input_type = input_type
+        data.input_index = index
+        data.value = value
+        self._pending.append(time.perf_counter())
+        self.sent += 1
+        # dispatched directly on the generator thread, going through the DILL
+        # callback would move the watchdog registration of the DILL dispatch
+        # thread back and forth between the two threads
+        el._dispatch_joystick_event(data)
+
+    def _run(self):
+        ''' generator thread '''
+        syslog = logging.getLogger("system")
+        syslog.info(
+            f"Load generator: {self.device_count} devices x {self.axis_count} axes "
+            f"at {self.rate:0.0f} Hz, buttons {self.button_rate:0.0f}/s, hats {self.hat_rate:0.0f}/s"
+        )
+        period = 1.0 / self.rate
+        button_step = self.button_rate / self.rate
+        hat_step = self.hat_rate / self.rate
+        button_acc = 0.0
+        hat_acc = 0.0
+        button_state = [0] * self.device_count
+        button_index = [0] * self.device_count
+        hat_index = [0] * self.device_count
+
+        self._start_time = time.perf_counter()
+        next_tick = self._start_time
+        tick = 0
+        while not self._stop_event.is_set():
+            now = time.perf_counter()
+            if now < next_tick:
+                time.sleep(next_tick - now)
+            elif now - next_tick > period:
+                # generator can't keep up, skip the missed ticks
+                missed = int((now - next_tick) / period)
+                self.late_ticks += missed
+                next_tick += missed * period
+
+            phase = 2.0 * math.pi * tick * period
+            for device_index, guid in enumerate(self._guids):
+                for axis in range(self.axis_count):
+                    value = int(32767 * math.sin(phase + device_index + axis * 0.5))
+                    self._send(guid, 1, axis + 1, value, True)
+
+            button_acc += button_step
+            while button_acc >= 1.0:
+                button_acc -= 1.0
+                for device_index, guid in enumerate(self._guids):
+                    button_state[device_index] ^= 1
+                    self._send(guid, 2, button_index[device_index] + 1, button_state[device_index], False)
+                    if not button_state[device_index]:
+                        button_index[device_index] = (button_index[device_index] + 1) % 32
+
+            hat_acc += hat_step
+            while hat_acc >= 1.0:
+                hat_acc -= 1.0
+                for device_index, guid in enumerate(self._guids):
+                    hat_index[device_index] = (hat_index[device_index] + 1) % len(_hat_sweep)
+                    self._send(guid, 3, 1, _hat_sweep[hat_index[device_index]], False)
+
+            tick += 1
+            next_tick += period
+
+        self._stop_time = time.perf_counter()
+        syslog.info(f"Load generator stopped: {self.report()}")
@@ -18,23 +18,31 @@
 import collections
 import ctypes
 from ctypes import wintypes
-import functools
+import heapq
+import itertools
 import logging
-import time
-from threading import Event, Lock, Thread
+import sys
+from threading import Condition, Lock, Thread
 from lxml import etree as ElementTree
 
 from PySide6 import QtCore
 
-import win32con
-import win32api
+if sys.platform == "win32":
+    import win32con
+    import win32api
+else:
+    from gremlin import fake_keyboard as win32con
+    from gremlin import fake_keyboard as win32api
 
 import gremlin
+import gremlin.clock
 from gremlin.singleton_decorator import SingletonDecorator
 from gremlin.input_types import InputType
 import gremlin.error
 import gremlin.keyboard
+import gremlin.perf_stats
 import gremlin.sendinput
+import gremlin.thread_registry
 import gremlin.input_devices
 
 
@@ -56,6 +64,8 @@ def _create_function(lib_name, fn_name, param_types, return_type):
     :param return_type return parameter type
     :return function handle
     """
+    if sys.platform != "win32":
+        return getattr(win32api, fn_name)
     fn = getattr(ctypes.WinDLL(lib_name), fn_name)
     fn.argtypes = param_types
     fn.restype = return_type
@@ -256,7 +266,7 @@ def _send_key_down(key, is_local = True, is_remote = False, force_remote = False
 
     if force_remote:
         is_remote = True
-    flags = win32con.KEYEVENTF_EXTENDEDKEY if key.is_extended else 0
+    flags = _key_flags(key, True)
 
     if is_local:
         gremlin.sendinput.send_key(key.virtual_code, key.scan_code, flags)
@@ -276,14 +286,56 @@ def _send_key_up(key, is_local = True, is_remote = False, force_remote = False):
         _send_mouse_button(key.mouse_button, False, is_local, is_remote, force_remote )
         return
 
-    flags = win32con.KEYEVENTF_EXTENDEDKEY if key.is_extended else 0
-    flags |= win32con.KEYEVENTF_KEYUP
+    flags = _key_flags(key, False)
     if is_local:
         gremlin.sendinput.send_key(key.virtual_code, key.scan_code, flags)
         # win32api.keybd_event(key.virtual_code, key.scan_code, flags, 0)
     if is_remote:
         gremlin.input_devices.remote_client.send_key(key.virtual_code, key.scan_code, flags, force_remote )
 
+
+def _key_flags(key, is_pressed):
+    """Returns the SendInput flags of a key event.
+
+    :param key the key for which to send the event
+    :param is_pressed True for a KEYDOWN event, False for a KEYUP event
+    :return flags value of the key event
+    """
+    flags = win32con.KEYEVENTF_EXTENDEDKEY if key.is_extended else 0
+    if not is_pressed:
+        flags |= win32con.KEYEVENTF_KEYUP
+    return flags
+
+
+class _KeyBatch:
+
+    """Consecutive keyboard key actions of a compiled macro.
+
+    The key events are resolved once and sent locally with a single
+    SendInput call.
+    """
+
+    def __init__(self, actions):
+        """Creates a new batch.
+
+        :param actions KeyAction instances of keyboard keys to send in order
+        """
+        self.actions = tuple(actions)
+        self.messages = tuple(
+            (action.key.virtual_code, action.key.scan_code,
+             _key_flags(action.key, action.is_pressed))
+            for action in self.actions
+        )
+
+    def __call__(self, is_local = None, is_remote = None, force_remote = None):
+        is_local, is_remote = self.actions[0]._update_flags(is_local, is_remote, force_remote)
+        if is_local:
+            gremlin.sendinput.send_keys(self.messages)
+        if is_remote:
+            for message in self.messages:
+                gremlin.input_devices.remote_client.send_key(*message, force_remote)
+
+
 def key_from_code(scan_code, is_extended):
     ''' returns a key from a code '''
     return gremlin.keyboard.key_from_code(scan_code, is_extended)
@@ -294,10 +346,31 @@ def key_from_name(name, validate = False):
 
 
 
+class _MacroTask:
+
+    """Execution state of a single running macro."""
+
+    def __init__(self, macro, steps):
+        """Creates a new task.
+
+        :param macro the macro being executed
+        :param steps generator executing the macro's actions step by step
+        """
+        self.macro = macro
+        self.steps = steps
+        self.resumed = False
+
+
 @SingletonDecorator
 class MacroManager:
 
-    """Manages the proper dispatching and scheduling of macros."""
+    """Manages the proper dispatching and scheduling of macros.
+
+    All macros are executed by a single scheduler thread. Each running macro
+    is a resumable program which executes its actions until it reaches a
+    pause, at which point it yields the pause's duration and is resumed by
+    the scheduler once the deadline has passed.
+    """
 
     def __init__(self):
         """Initializes the instance."""
@@ -305,7 +378,11 @@ class MacroManager:
         self._queue = []
         self._flags = {}
         self._flags_lock = Lock()
-        self._queue_lock = Lock()
+        self._condition = Condition()
+
+        # Heap of (deadline, sequence number, task) of running macros
+        self._tasks = []
+        self._counter = itertools.count()
 
         # Default delay between subsequent message dispatch. This is to get
         # around some games not picking up messages if they are sent in too
@@ -314,35 +391,56 @@ class MacroManager:
 
         self._is_executing_exclusive = False
         self._is_running = False
-        self._schedule_event = Event()
 
         self._run_scheduler_thread = None
 
+        # Statistics
+        self.dispatched = 0
+        self.completed = 0
+        self.jitter = gremlin.perf_stats.SampleStats()
+        self._start_time = None
+        self._stop_time = None
+
     def start(self):
         """Starts the scheduler."""
-        self._active = {}
-        self._flags = {}
-        self._is_running = True
-        if self._run_scheduler_thread is None:
-            self._run_scheduler_thread = Thread(target=self._run_scheduler)
-        if not self._run_scheduler_thread.is_alive():
-            self._run_scheduler_thread.start()
+        with self._condition:
+            self._active = {}
+            self._flags = {}
+            self._tasks = []
+            self._is_executing_exclusive = False
+            self._is_running = True
+            self._reset_counters()
+            if self._run_scheduler_thread is None or \
+                    not self._run_scheduler_thread.is_alive():
+                self._run_scheduler_thread = Thread(
+                    target=self._run_scheduler,
+                    name="MacroManager",
+                    daemon=True
+                )
+                self._run_scheduler_thread.start()
 
     def stop(self):
         """Stops the scheduler."""
-        self._is_running = False
-        if self._run_scheduler_thread is not None and \
-                self._run_scheduler_thread.is_alive():
-
-            # Terminate the scheduler
-            self._schedule_event.set()
-            self._run_scheduler_thread.join()
-            self._run_scheduler_thread = None
+        with self._condition:
+            self._is_running = False
+            self._condition.notify()
+            thread = self._run_scheduler_thread
+        if thread is not None and thread.is_alive():
+            thread.join()
+        self._run_scheduler_thread = None
 
-            # Terminate any macro that is still active
+        # Terminate any macro that is still active
+        with self._condition:
             with self._flags_lock:
-                for key, value in self._flags.items():
+                for key in self._flags:
                     self._flags[key] = False
+            for _, _, task in self._tasks:
+                task.steps.close()
+            self._tasks = []
+            self._active = {}
+            self._is_executing_exclusive = False
+            if self._start_time is not None:
+                self._stop_time = gremlin.clock.now()
 
     def queue_macro(self, macro, is_local = None, is_remote = None):
         """Queues a macro in the schedule taking the repeat type into account.
@@ -352,79 +450,142 @@ class MacroManager:
         if isinstance(macro.repeat, ToggleRepeat) and macro.id in self._active:
             self.terminate_macro(macro)
         else:
-            # Preprocess macro to contain pauses as necessary
             if not is_local:
                 is_local = macro.is_local
             if not is_remote:
                 is_remote = macro.is_remote
 
-            self._preprocess_macro(macro)
-            with self._queue_lock:
+            self.compile(macro)
+            with self._condition:
                 self._queue.append(MacroEntry(macro, True, is_local, is_remote))
-            self._schedule_event.set()
+                self._condition.notify()
 
     def terminate_macro(self, macro):
         """Adds a termination request for a macro to the execution queue.
 
         :param macro the macro to terminate
         """
-        self._queue.append(MacroEntry(macro, False, macro.is_local, macro.is_remote))
-        self._schedule_event.set()
+        with self._condition:
+            self._queue.append(MacroEntry(macro, False, macro.is_local, macro.is_remote))
+            self._condition.notify()
+
+    def compile(self, macro):
+        """Returns the ready to execute steps of a macro.
+
+        The steps are compiled once and cached on the macro until its action
+        sequence is edited or the default delay changes.
+
+        :param macro the macro to compile
+        :return tuple of compiled steps
+        """
+        if macro._steps is None or macro._steps_delay != self.default_delay:
+            macro._steps = self._compile_steps(macro.sequence)
+            macro._steps_delay = self.default_delay
+        return macro._steps
+
+    def report(self):
+        """Returns the scheduler statistics, jitter in milliseconds."""
+        with self._condition:
+            elapsed = 0.0
+            if self._start_time is not None:
+                end = self._stop_time
+                if end is None:
+                    end = gremlin.clock.now()
+                elapsed = end - self._start_time
+            jitter = self.jitter.summary()
+            return {
+                "dispatched": self.dispatched,
+                "completed": self.completed,
+                "active": len(self._active),
+                "queued": len(self._queue),
+                "macros_per_second":
+                    self.completed / elapsed if elapsed > 0 else 0.0,
+                "jitter_ms": {key: value * 1000.0 if key != "count" else value
+                              for key, value in jitter.items()}
+            }
+
+    def _reset_counters(self):
+        self.dispatched = 0
+        self.completed = 0
+        self.jitter.reset()
+        self._start_time = gremlin.clock.now()
+        self._stop_time = None
 
     def _run_scheduler(self):
-        """Dispatches macros as required."""
-        while self._is_running:
-            # Wake up when the event triggers and reset it
-            self._schedule_event.wait()
-            self._schedule_event.clear()
-
-            # Run scheduled macros and ensure exclusive ones run separately
-            # from all other macros
-            with self._queue_lock:
-                entries_to_remove = []
-                has_exclusive = False
-                for i, entry in enumerate(self._queue):
-                    # Terminate macro if needed
-                    if entry.state is False:
-                        if entry.macro.id in self._flags \
-                                and self._flags[entry.macro.id]:
-                            # Terminate currently running macro
-                            with self._flags_lock:
-                                self._flags[entry.macro.id] = False
-                            # del self._queue[i]
-
-                            # Remove all queued up macros with the same id as
-                            # they should have been impossible to queue up
-                            # in the first place
-                            removal_list = []
-                            for queue_entry in self._queue:
-                                if queue_entry.macro.id == entry.macro.id:
-                                    removal_list.append(queue_entry)
-                            for queue_entry in removal_list:
-                                self._queue.remove(queue_entry)
-                    # Don't run a queued macro if the same instance is already
-                    # running
-                    elif entry.macro.id in self._active:
+        """Dispatches queued macros and resumes running ones when due."""
+        worker = gremlin.thread_registry.register("MacroManager")
+        try:
+            while True:
+                with self._condition:
+                    worker.beat()
+                    if not self._is_running:
+                        return
+                    self._process_queue()
+
+                    now = gremlin.clock.now()
+                    due = []
+                    while self._tasks and self._tasks[0][0] <= now:
+                        due.append(heapq.heappop(self._tasks))
+                    if not due:
+                        timeout = None
+                        if self._tasks:
+                            timeout = self._tasks[0][0] - now
+                        worker.idle()
+                        self._condition.wait(timeout)
                         continue
-                    # Handle exclusive macros
-                    elif entry.macro.exclusive:
-                        has_exclusive = True
-                        if len(self._active) == 0:
-                            self._dispatch_macro(entry.macro, entry.is_local, entry.is_remote)
-                            self._is_executing_exclusive = True
-                            entries_to_remove.append(entry)
-                    # Start a queued up macro
-                    elif not has_exclusive and not self._is_executing_exclusive:
-                        self._dispatch_macro(entry.macro, entry.is_local, entry.is_remote)
-                        entries_to_remove.append(entry)
-
-                # Remove all entries we've processed
-                for entry in entries_to_remove:
-                    if entry in self._queue:
-                        self._queue.remove(entry)
+
+                # Run the macro actions outside of the lock such that actions
+                # queueing further macros do not block
+                for deadline, _, task in due:
+                    self._step(task, deadline)
+        finally:
+            worker.unregister()
+
+    def _process_queue(self):
+        """Starts or terminates queued macros, the lock must be held."""
+        # Run scheduled macros and ensure exclusive ones run separately
+        # from all other macros
+        entries_to_remove = []
+        has_exclusive = False
+        for entry in list(self._queue):
+            # Terminate macro if needed
+            if entry.state is False:
+                if entry.macro.id in self._flags \
+                        and self._flags[entry.macro.id]:
+                    # Terminate currently running macro
+                    with self._flags_lock:
+                        self._flags[entry.macro.id] = False
+
+                    # Remove all queued up macros with the same id as
+                    # they should have been impossible to queue up
+                    # in the first place
+                    self._queue = [
+                        queue_entry for queue_entry in self._queue
+                        if queue_entry.macro.id != entry.macro.id
+                    ]
+            # Don't run a queued macro if the same instance is already
+            # running
+            elif entry.macro.id in self._active:
+                continue
+            # Handle exclusive macros
+            elif entry.macro.exclusive:
+                has_exclusive = True
+                if len(self._active) == 0:
+                    self._dispatch_macro(entry.macro, entry.is_local, entry.is_remote)
+                    self._is_executing_exclusive = True
+                    entries_to_remove.append(entry)
+            # Start a queued up macro
+            elif not has_exclusive and not self._is_executing_exclusive:
+                self._dispatch_macro(entry.macro, entry.is_local, entry.is_remote)
+                entries_to_remove.append(entry)
+
+        # Remove all entries we've processed
+        for entry in entries_to_remove:
+            if entry in self._queue:
+                self._queue.remove(entry)
 
     def _dispatch_macro(self, macro, is_local = None, is_remote = None):
-        """Dispatches a single macro to be run.
+        """Dispatches a single macro to be run, the lock must be held.
 
         :param macro the macro to dispatch
         :param is_local true if local control, set to None to use the macro flag
@@ -432,41 +593,86 @@ class MacroManager:
         """
         if macro.id not in self._active:
             self._active[macro.id] = macro
-            Thread(target=functools.partial(self._execute_macro, macro, is_local, is_remote)).start()
+            self.dispatched += 1
+            task = _MacroTask(
+                macro,
+                self._execute_macro(macro, is_local, is_remote)
+            )
+            heapq.heappush(
+                self._tasks,
+                (gremlin.clock.now(), next(self._counter), task)
+            )
         else:
             logging.getLogger("system").warning(
                 "Attempting to dispatch an already running macro"
             )
 
+    def _step(self, task, deadline):
+        """Runs a macro until its next pause or completion.
+
+        :param task the macro task to resume
+        :param deadline the time at which the task was due
+        """
+        if task.resumed:
+            self.jitter.add(max(0.0, gremlin.clock.now() - deadline))
+        task.resumed = True
+
+        try:
+            delay = next(task.steps)
+        except StopIteration:
+            self._finish_macro(task.macro)
+            return
+        except Exception as err:
+            logging.getLogger("system").error(
+                f"Macro {task.macro.id} failed: {err}"
+            )
+            self._finish_macro(task.macro)
+            return
+
+        with self._condition:
+            if self._is_running:
+                heapq.heappush(
+                    self._tasks,
+                    (gremlin.clock.now() + delay, next(self._counter), task)
+                )
+
+    def _finish_macro(self, macro):
+        """Removes a completed macro from the set of active macros.
+
+        :param macro the macro which completed
+        """
+        with self._condition:
+            self._active.pop(macro.id, None)
+            if macro.exclusive:
+                self._is_executing_exclusive = False
+            with self._flags_lock:
+                if macro.id in self._flags:
+                    self._flags[macro.id] = False
+            self.completed += 1
+
     def _execute_macro(self, macro, is_local = None, is_remote = None):
-        """Executes a given macro in a separate thread.
+        """Returns the program executing the given macro.
 
-        This method will run all provided actions and once they all have been
-        executed will remove the macro from the set of active macros and
-        inform the scheduler of the completion.
+        The program runs the macro's actions and yields the duration of
+        each pause, including the delay between repetitions, to the
+        scheduler instead of sleeping.
 
         The macro flags is_local/is_remote control where the macro actions are sent
 
         :param macro the macro object to be executed
+        :return generator yielding pause durations in seconds
         """
-        # Handle macros with a repeat mode
-        # if not is_local:
-        #     is_local = macro.is_local
-        # if not is_remote:
-        #     is_remote = macro.is_remote
-
-
         (state_is_local, state_is_remote) = gremlin.input_devices.remote_state.state
         if not is_remote:
             is_remote = state_is_remote
         if not is_local:
             is_local = state_is_local
-        
+
         if macro.force_remote:
             is_remote = True
             is_local = False
 
-
+        steps = self.compile(macro)
         if macro.repeat is not None:
             delay = macro.repeat.delay
 
@@ -477,50 +683,83 @@ class MacroManager:
             if isinstance(macro.repeat, CountRepeat):
                 count = 0
                 while count < macro.repeat.count and self._flags[macro.id]:
-                    for action in macro.sequence:
-                        action(is_local, is_remote)
+                    yield from self._execute_steps(
+                        steps, is_local, is_remote
+                    )
                     count += 1
-                    time.sleep(delay)
+                    yield delay
 
             # Handle continuous repeat modes
             elif type(macro.repeat) in [HoldRepeat, ToggleRepeat]:
                 while self._flags[macro.id]:
-                    for action in macro.sequence:
-                        action(is_local, is_remote)
-                    time.sleep(delay)
+                    yield from self._execute_steps(
+                        steps, is_local, is_remote
+                    )
+                    yield delay
 
         # Handle simple one shot macros
         else:
-            for action in macro.sequence:
-                action(is_local, is_remote, macro.force_remote)
+            yield from self._execute_steps(
+                steps, is_local, is_remote, macro.force_remote
+            )
             # indicate the macro is done
             if macro.completed_callback:
                 macro.completed_callback()
 
-        # Remove macro from active set, notify manager, and remove any
-        # potential callbacks
-        try:
-            del self._active[macro.id]
-            if macro.exclusive:
-                self._is_executing_exclusive = False
-            with self._flags_lock:
-                if macro.id in self._flags:
-                    self._flags[macro.id] = False
-            self._schedule_event.set()
-        except:
-            pass
+    def _execute_steps(self, steps, *args):
+        """Executes compiled macro steps, yielding at each pause.
 
-    def _preprocess_macro(self, macro):
-        """Inserts pauses as necessary into the macro."""
-        new_sequence = [macro.sequence[0]]
-        for a1, a2 in zip(macro.sequence[:-1], macro.sequence[1:]):
-            if isinstance(a1, PauseAction) or isinstance(a2, PauseAction):
-                new_sequence.append(a2)
+        :param steps the compiled steps to execute
+        :param args arguments passed to each action
+        :return generator yielding pause durations in seconds
+        """
+        for step in steps:
+            if isinstance(step, float):
+                yield step
+            elif isinstance(step, PauseAction):
+                yield step.pause_duration()
             else:
-                new_sequence.append(PauseAction(self.default_delay))
-                new_sequence.append(a2)
-        macro._sequence = new_sequence
+                step(*args)
 
+    def _compile_steps(self, sequence):
+        """Compiles an action sequence into ready to execute steps.
+
+        The default delay is inserted between actions not separated by a
+        pause, fixed pauses are resolved to their duration in seconds and
+        keyboard key actions following each other without a pause in between
+        are combined into a single batch.
+
+        :param sequence the actions to compile
+        :return tuple of actions, key batches, pause durations and random
+            pauses
+        """
+        actions = []
+        for i, action in enumerate(sequence):
+            if i > 0 and self.default_delay > 0 and \
+                    not isinstance(sequence[i-1], PauseAction) and \
+                    not isinstance(action, PauseAction):
+                actions.append(PauseAction(self.default_delay))
+            actions.append(action)
+
+        steps = []
+        keys = []
+        for action in actions:
+            if isinstance(action, KeyAction) and not action.key.is_mouse:
+                keys.append(action)
+                continue
+            if isinstance(action, PauseAction) and not action.is_random:
+                duration = float(action.duration)
+                if duration <= 0:
+                    continue
+                action = duration
+
+            if keys:
+                steps.append(_KeyBatch(keys))
+                keys = []
+            steps.append(action)
+        if keys:
+            steps.append(_KeyBatch(keys))
+        return tuple(steps)
 
 class Macro:
 
@@ -540,6 +779,9 @@ class Macro:
         
         """
         self._sequence = []
+        # compiled steps, see MacroManager.compile
+        self._steps = None
+        self._steps_delay = None
         self._id = Macro._next_macro_id
         Macro._next_macro_id += 1
         self.repeat = None
@@ -611,13 +853,18 @@ class Macro:
         :param action the action to add
         """
         self._sequence.append(action)
+        self.invalidate()
+
+    def invalidate(self):
+        """Discards the compiled steps, required after editing the sequence."""
+        self._steps = None
 
     def pause(self, duration):
         """Adds a pause of the given duration to the macro.
 
         :param duration the duration of the pause in seconds
         """
-        self._sequence.append(PauseAction(duration))
+        self.add_action(PauseAction(duration))
 
     def press(self, key):
         """Presses the specified key down.
@@ -660,7 +907,7 @@ class Macro:
         else:
             raise gremlin.error.KeyboardError("Invalid key specified")
 
-        self._sequence.append(KeyAction(key, is_pressed))
+        self.add_action(KeyAction(key, is_pressed))
 
 
 class MacroAbstractAction:
@@ -840,8 +1087,15 @@ class PauseAction(MacroAbstractAction):
         self.is_random = is_random
 
     def __call__(self, is_local = None, is_remote = None, force_remote = None):
-        import random
         # is_local, is_remote = self._update_flags(is_local, is_remote, force_remote)
+        gremlin.clock.sleep(self.pause_duration())
+
+    def pause_duration(self):
+        """Returns the duration of this pause.
+
+        :return duration in seconds, randomized if the pause is random
+        """
+        import random
         if self.is_random:
             # random pause
             duration_min = self.duration
@@ -854,8 +1108,7 @@ class PauseAction(MacroAbstractAction):
                 duration = random.uniform(0, duration_min)
         else:
             duration = self.duration
-
-        time.sleep(duration)
+        return duration
 
 
 class VJoyMacroAction(MacroAbstractAction):
@@ -0,0 +1,200 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+"""Merges any number of axis inputs into a single axis value.
+
+The merge operation is compiled once into a single function of the input
+values when the engine is created, so processing an input event only stores
+the new value and calls that function. The latest value of every input is
+cached so the partner axes never have to be read when one of them changes,
+and nothing is computed when an input reports the value it already had.
+
+Supported operations, the MergeAxisOperation values profiles store:
+
+    Sum                 sum of the inputs clamped to [-1, 1]
+    Average             mean of the inputs
+    Minimum, Maximum    smallest and largest input
+
+and the EngineOperation values, which need per input weights and rest
+values that profiles cannot store:
+
+    Weighted            sum of the inputs multiplied by their weight,
+                        clamped to [-1, 1]
+    PriorityOverride    the first input, in input order, deflected from its
+                        rest value by more than the threshold, the last
+                        input if none is
+"""
+
+import enum
+import operator
+
+import gremlin.error
+from gremlin.types import MergeAxisOperation
+
+
+class EngineOperation(enum.Enum):
+
+    """Merge operations only available to the engine."""
+
+    Weighted = 1
+    PriorityOverride = 2
+
+
+def _clamp(value):
+    return -1.0 if value < -1.0 else 1.0 if value > 1.0 else value
+
+
+def compile_merge(operation, count, weights=None, rest=None, threshold=0.05):
+    """Returns a function computing the merged value of a sequence of inputs.
+
+    :param operation the MergeAxisOperation or EngineOperation to perform
+    :param count number of inputs
+    :param weights weight of each input for the weighted operation, 1.0
+        for all inputs if not specified
+    :param rest value of each input when not in use for the priority
+        override operation, 0.0 for all inputs if not specified
+    :param threshold deflection from the rest value at which an input
+        overrides the inputs after it for the priority override operation
+    :return function taking the sequence of input values
+    """
+    if count < 1:
+        raise gremlin.error.GremlinError(
+            "A merged axis requires at least one input"
+        )
+
+    if operation == MergeAxisOperation.Sum:
+        return lambda values: _clamp(sum(values))
+    elif operation == MergeAxisOperation.Average:
+        scale = 1.0 / count
+        return lambda values: sum(values) * scale
+    elif operation == MergeAxisOperation.Minimum:
+        return min
+    elif operation == MergeAxisOperation.Maximum:
+        return max
+    elif operation == EngineOperation.Weighted:
+        weights = _per_input(weights, count, 1.0, "weights")
+        return lambda values: _clamp(sum(map(operator.mul, values, weights)))
+    elif operation == EngineOperation.PriorityOverride:
+        rest = _per_input(rest, count, 0.0, "rest values")
+        # (index, rest value) of every input able to override the last one
+        overrides = tuple(enumerate(rest[:-1]))
+        last = count - 1
+
+        def priority_override(values):
+            for index, rest_value in overrides:
+                value = values[index]
+                if abs(value - rest_value) > threshold:
+                    return value
+            return values[last]
+        return priority_override
+
+    raise gremlin.error.GremlinError(
+        f"Invalid merge axis operation detected, \"{str(operation)}\""
+    )
+
+
+def _per_input(values, count, default, name):
+    ''' returns a tuple with one value per input '''
+    if values is None:
+        return (default,) * count
+    values = tuple(float(value) for value in values)
+    if len(values) != count:
+        raise gremlin.error.GremlinError(
+            f"Merged axis with {count} inputs requires {count} {name}, got {len(values)}"
+        )
+    return values
+
+
+class MergeEngine:
+
+    """Caches the input values of a merged axis and computes its output."""
+
+    def __init__(
+            self,
+            count,
+            operation,
+            weights=None,
+            rest=None,
+            threshold=0.05,
+            initial=None
+    ):
+        """Creates a new instance.
+
+        :param count number of inputs
+        :param operation the MergeAxisOperation or EngineOperation to perform
+        :param weights weight of each input for the weighted operation
+        :param rest value of each input when not in use for the priority
+            override operation
+        :param threshold deflection from the rest value at which an input
+            overrides the inputs after it for the priority override operation
+        :param initial initial value of each input, 0.0 if not specified
+        """
+        self.count = count
+        self.operation = operation
+        self.compute = compile_merge(operation, count, weights, rest, threshold)
+        self.values = [0.0] * count
+        if initial is not None:
+            self.values[:] = [float(value) for value in initial]
+        self.value = None
+        self.updates = 0
+        self.computations = 0
+
+    def update(self, index, value):
+        """Stores the new value of an input and recomputes the output.
+
+        :param index index of the input whose value changed
+        :param value the new value of the input
+        :return the merged value if it changed, None otherwise
+        """
+        self.updates += 1
+        if self.values[index] == value and self.value is not None:
+            return None
+        self.values[index] = value
+        self.computations += 1
+        merged = self.compute(self.values)
+        if merged == self.value:
+            return None
+        self.value = merged
+        return merged
+
+    def reset(self, initial=None):
+        """Resets the cached input values and the output.
+
+        :param initial initial value of each input, 0.0 if not specified
+        """
+        if initial is None:
+            self.values[:] = [0.0] * self.count
+        else:
+            self.values[:] = [float(value) for value in initial]
+        self.value = None
+
+
+def two_axis_engine(operation, initial=None):
+    """Returns an engine merging two axes the way two axis merges always did.
+
+    The average of two axes is their halved difference, which turns two toe
+    brakes into a single rudder style axis, rather than their mean.
+
+    :param operation the MergeAxisOperation to perform
+    :param initial initial value of the two inputs
+    :return MergeEngine with two inputs
+    """
+    if operation == MergeAxisOperation.Average:
+        return MergeEngine(
+            2, EngineOperation.Weighted, weights=(0.5, -0.5), initial=initial
+        )
+    return MergeEngine(2, operation, initial=initial)
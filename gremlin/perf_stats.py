@@ -0,0 +1,105 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Lightweight runtime statistics used by the performance instrumentation."""
+
+import collections
+import math
+import threading
+
+
+def percentile(sorted_values, fraction):
+    """Returns the percentile of already sorted values.
+
+    Uses linear interpolation between the closest ranks.
+
+    :param sorted_values values sorted in ascending order
+    :param fraction the percentile to compute in [0, 1]
+    :return the percentile value, 0 if no values are provided
+    """
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * fraction
+    low = math.floor(position)
+    high = math.ceil(position)
+    if low == high:
+        return sorted_values[low]
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (position - low)
+
+
+class SampleStats:
+
+    """Tracks count, mean and extremes of a measurement with a bounded history.
+
+    The most recent samples are kept to compute percentiles, so memory use is
+    constant regardless of how long the measurement runs.
+    """
+
+    def __init__(self, history=10000):
+        """Creates a new instance.
+
+        :param history number of recent samples kept for percentiles
+        """
+        self._lock = threading.Lock()
+        self._history = history
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._samples = collections.deque(maxlen=self._history)
+            self.count = 0
+            self.total = 0.0
+            self.maximum = 0.0
+
+    def add(self, value):
+        """Records a sample.
+
+        :param value the measured value
+        """
+        with self._lock:
+            self._samples.append(value)
+            self.count += 1
+            self.total += value
+            if value > self.maximum:
+                self.maximum = value
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, fraction):
+        """Returns the given percentile of the recent samples.
+
+        :param fraction percentile to compute in [0, 1]
+        :return the percentile value
+        """
+        with self._lock:
+            values = sorted(self._samples)
+        return percentile(values, fraction)
+
+    def summary(self):
+        """Returns a dictionary summarizing the samples."""
+        with self._lock:
+            values = sorted(self._samples)
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "p50": percentile(values, 0.5),
+            "p90": percentile(values, 0.9),
+            "p99": percentile(values, 0.99),
+            "max": self.maximum
+        }
@@ -21,9 +21,10 @@ import ctypes.wintypes
 import enum
 import math
 import threading
-import time
 
 
+import gremlin.clock
+import gremlin.tick_engine
 from gremlin.util import deg2rad
 
 from gremlin.singleton_decorator import SingletonDecorator
@@ -104,23 +105,61 @@ class MouseMotion:
         delta_x = 0
         delta_y = 0
 
-        cur_time = time.time()
-        if self._dx_timestamp < cur_time:
+        # Emit a step once its time falls within the current tick
+        cur_time = gremlin.clock.now()
+        horizon = cur_time + 0.5 * MouseMotion.delta_t
+        if self._dx_timestamp <= horizon:
             delta_x = self._tick_dx_value
-            self._dx_timestamp = cur_time + self._tick_dx_time
-        if self._dy_timestamp < cur_time:
+            self._dx_timestamp = self._next_timestamp(
+                self._dx_timestamp, self._tick_dx_time, cur_time
+            )
+        if self._dy_timestamp <= horizon:
             delta_y = self._tick_dy_value
-            self._dy_timestamp = cur_time + self._tick_dy_time
+            self._dy_timestamp = self._next_timestamp(
+                self._dy_timestamp, self._tick_dy_time, cur_time
+            )
 
         return delta_x, delta_y
 
+    def reset(self):
+        """Restarts the motion steps, used when motion resumes after a rest."""
+        self._dx_timestamp = 0
+        self._dy_timestamp = 0
+
+    def update_ticks(self):
+        """Recomputes the discretization of the current velocities."""
+        self._tick_dx_value, self._tick_dx_time = self._compute_values(self.dx)
+        self._tick_dy_value, self._tick_dy_time = self._compute_values(self.dy)
+
+    def is_idle(self):
+        """Returns True if no motion is generated.
+
+        :return True if the motion is at rest
+        """
+        return self._tick_dx_value == 0 and self._tick_dy_value == 0
+
+    def _next_timestamp(self, timestamp, tick_time, cur_time):
+        """Returns the time of the next step along an axis.
+
+        Steps are spaced relative to the previous one to keep the average
+        speed exact, unless motion resumes after a rest.
+
+        :param timestamp time of the step just emitted
+        :param tick_time time between steps
+        :param cur_time the current time
+        :return time of the next step
+        """
+        if timestamp < cur_time - tick_time:
+            timestamp = cur_time
+        return timestamp + tick_time
+
     def _compute_values(self, delta):
         """Computes discretization values to send integer motions.
 
         :param delta the amount of change in pixels per second to discretize for
         """
         delta = 0.0 if abs(delta) < 1e-6 else delta
-        tick_value = math.ceil(abs(delta) / 100.0)
+        tick_value = math.ceil(abs(delta) * MouseMotion.delta_t)
         if tick_value == 0:
             tick_time = MouseMotion.delta_t
         else:
@@ -209,6 +248,14 @@ class AcceleratedMouseMotion(MouseMotion):
         return value * math.cos(deg2rad(direction)),\
             value * math.sin(deg2rad(direction))
 
+    def is_idle(self):
+        """Returns True if no motion is generated.
+
+        :return True if the motion is at rest and does not accelerate
+        """
+        return super().is_idle() and \
+            (self.acceleration <= 0 or self.current_velocity >= self.max_velocity)
+
     def __call__(self):
         """Returns the change in x and y for this point in time.
 
@@ -234,7 +281,11 @@ class AcceleratedMouseMotion(MouseMotion):
 @SingletonDecorator
 class MouseController:
 
-    """Centralizes sending mouse events in a organized manner."""
+    """Centralizes sending mouse events in a organized manner.
+
+    Motion is sent on the ticks of the runtime tick engine while a motion is
+    active, the controller is not ticked while the motion is at rest.
+    """
 
     def __init__(self):
         """Creates a new instance."""
@@ -242,7 +293,31 @@ class MouseController:
         self._delta_generator = FixedMouseMotion(0, 0)
 
         self._is_running = False
-        self._thread = threading.Thread(target=self._control_loop)
+        self._is_ticking = False
+        self._lock = threading.Lock()
+
+    @property
+    def tick_rate(self):
+        """Returns the number of motion updates per second."""
+        return gremlin.tick_engine.TickEngine().rate
+
+    @tick_rate.setter
+    def tick_rate(self, value):
+        """Sets the number of motion updates per second.
+
+        This sets the rate of the runtime tick engine.
+
+        :param value updates per second, clamped to [10, 1000]
+        """
+        engine = gremlin.tick_engine.TickEngine()
+        engine.rate = value
+        with self._lock:
+            self._set_time_step(engine.period)
+
+    @property
+    def is_active(self):
+        """Returns True if the controller is currently being ticked."""
+        return self._is_ticking
 
     def set_absolute_motion(self, dx=None, dy=None):
         """Configures a motion using absolute velocities.
@@ -252,17 +327,19 @@ class MouseController:
         :param dx velocity along the x axis in pixels per second
         :param dy velocity along the y axis in pixels per second
         """
-        if self._motion_type == MotionType.Fixed:
-            if dx is not None:
-                self._delta_generator.set_dx(dx)
-            if dy is not None:
-                self._delta_generator.set_dy(dy)
-        else:
-            self._motion_type = MotionType.Fixed
-            self._delta_generator = FixedMouseMotion(
-                dx if dx is not None else 0,
-                dy if dy is not None else 0
-            )
+        with self._lock:
+            if self._motion_type == MotionType.Fixed:
+                if dx is not None:
+                    self._delta_generator.set_dx(dx)
+                if dy is not None:
+                    self._delta_generator.set_dy(dy)
+            else:
+                self._motion_type = MotionType.Fixed
+                self._delta_generator = FixedMouseMotion(
+                    dx if dx is not None else 0,
+                    dy if dy is not None else 0
+                )
+            self._wake()
 
     def set_accelerated_motion(
             self,
@@ -278,38 +355,69 @@ class MouseController:
         :param max_speed maximum speed in pixels per second
         :param time_to_max_speed time to reach max_speed
         """
-        if self._motion_type == MotionType.Accelerated:
-            self._delta_generator.set_direction(direction)
-        else:
-            self._delta_generator = AcceleratedMouseMotion(
-                direction,
-                min_speed,
-                max_speed,
-                time_to_max_speed
-            )
-            self._motion_type = MotionType.Accelerated
+        with self._lock:
+            if self._motion_type == MotionType.Accelerated:
+                self._delta_generator.set_direction(direction)
+            else:
+                self._delta_generator = AcceleratedMouseMotion(
+                    direction,
+                    min_speed,
+                    max_speed,
+                    time_to_max_speed
+                )
+                self._motion_type = MotionType.Accelerated
+            self._wake()
 
     def start(self):
-        """Starts the thread that will send motions when required."""
-        if not self._is_running:
-            self._thread = threading.Thread(target=self._control_loop)
-            self._thread.start()
+        """Starts sending motions when required."""
+        with self._lock:
+            self._is_running = True
+            self._wake()
 
     def stop(self):
-        """Stops the thread that sends motion events."""
-        if self._thread.is_alive():
+        """Stops sending motion events."""
+        with self._lock:
             self._is_running = False
-            self._thread.join()
+            if self._is_ticking:
+                gremlin.tick_engine.TickEngine().remove(self._tick)
+                self._is_ticking = False
+
+    def _set_time_step(self, delta_t):
+        """Updates the motion time step, must be called with the lock held.
+
+        :param delta_t time between motion updates in seconds
+        """
+        if MouseMotion.delta_t != delta_t:
+            MouseMotion.delta_t = delta_t
+            # Rediscretize the active motion for the new time step
+            self._delta_generator.update_ticks()
 
-    def _control_loop(self):
-        """Loop responsible for creating and sending mouse motion events."""
-        self._is_running = True
+    def _wake(self):
+        """Registers with the tick engine if motion is requested while at rest.
 
-        while self._is_running:
+        Must be called with the lock held.
+        """
+        if self._is_running and not self._is_ticking and \
+                not self._delta_generator.is_idle():
+            self._delta_generator.reset()
+            self._is_ticking = True
+            gremlin.tick_engine.TickEngine().add(self._tick)
+
+    def _tick(self, delta_t):
+        """Creates the mouse motion of a single tick.
+
+        :param delta_t time since the previous tick
+        :return False once the motion is at rest
+        """
+        with self._lock:
+            if not self._is_running or self._delta_generator.is_idle():
+                self._is_ticking = False
+                return False
+            self._set_time_step(delta_t)
             dx, dy = self._delta_generator()
             if dx != 0 or dy != 0:
-                mouse_relative_motion(int(dx), int(dy))
-            time.sleep(0.01)
+                gremlin.tick_engine.TickEngine().move_mouse(dx, dy)
+        return True
 
 
 class _MOUSEINPUT(ctypes.Structure):
@@ -432,9 +540,32 @@ def _mouse_input(flags, dx=0, dy=0, data=0):
 
 
 
+# INPUT structures of key messages indexed by (virtual code, scan code, flags)
+_keyboard_input_cache = {}
+
+
+def keyboard_input(virtual_code, scan_code, flags):
+    ''' returns the cached INPUT structure of a key message '''
+    index = (virtual_code, scan_code, flags)
+    data = _keyboard_input_cache.get(index)
+    if data is None:
+        data = _keyboard_input(virtual_code, scan_code, flags)
+        _keyboard_input_cache[index] = data
+    return data
+
+
 def send_key(virtual_code, scan_code, flags):
     ''' sends a key message via send input '''
-    _send_input(_keyboard_input(virtual_code, scan_code, flags))
+    _send_input(keyboard_input(virtual_code, scan_code, flags))
+
+
+def send_keys(messages):
+    ''' sends several key messages with a single send input call
+
+    :param messages sequence of (virtual code, scan code, flags) tuples
+    '''
+    if messages:
+        _send_input(*[keyboard_input(*message) for message in messages])
 
 
 
@@ -16,10 +16,11 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 
-import threading
 import sys
 import uuid
 
+import gremlin.clock
+
 
 def module_property(func):
     """Decorator to turn module functions into properties.
@@ -68,6 +69,9 @@ ui = None
 # true if a profile is running
 is_running = False
 
+# true if running without the main window (headless runtime)
+is_headless = False
+
 # true if UI keyboard should be ignored (such as, when listening to keys)
 _suspend_ui_keyinput = 0
 
@@ -206,11 +210,10 @@ def delayed_input_highlighting_suspension():
     if _suspend_timer is not None:
         _suspend_timer.cancel()
 
-    _suspend_timer = threading.Timer(
+    _suspend_timer = gremlin.clock.call_later(
             2,
             lambda: pop_suspend_highlighting()
     )
-    _suspend_timer.start()
 
 # true if tabs are loading
 is_tab_loading = False 
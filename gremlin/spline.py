@@ -16,9 +16,16 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 
+import array
 import collections
+import gremlin.axis_batch
 import gremlin.util
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 # Named tuple to facilitate working with 2D coordinates
 Point2D = collections.namedtuple("Point2D", ["x", "y"])
@@ -98,6 +105,36 @@ class CubicSpline:
 
         return self.y[i] + (x - self.x[i]) * tmp
 
+    def evaluate_batch(self, values):
+        """Returns the function values at all the desired positions.
+
+        Numpy arrays are evaluated vectorized, any other sequence is
+        evaluated one value at a time.
+
+        :param values the locations at which to evaluate the function
+        :return function values at the provided positions
+        """
+        if numpy is None or not isinstance(values, numpy.ndarray):
+            return [self(x) for x in values]
+
+        values = values.astype(float, copy=False)
+        n = len(self.x)
+        x = numpy.asarray(self.x, dtype=float)
+        y = numpy.asarray(self.y, dtype=float)
+        z = numpy.asarray(self.z, dtype=float)
+
+        # Same interval choice as the scalar search: the first interval
+        # containing the value, the last one for values outside of the knots
+        i = numpy.clip(numpy.searchsorted(x, values, side="left") - 1, 0, n-2)
+        i[values < x[0]] = n-2
+
+        dx = values - x[i]
+        h = x[i+1] - x[i]
+        tmp = (z[i] / 2.0) + dx * (z[i+1] - z[i]) / (6 * h)
+        tmp = -(h/6.0) * (z[i+1] + 2 * z[i]) + (y[i+1] - y[i]) / h + dx * tmp
+
+        return y[i] + dx * tmp
+
 
 class CubicBezierSpline:
 
@@ -114,6 +151,7 @@ class CubicBezierSpline:
         self.knots = [pt for pt in points[::3]]
 
         self._lookup = []
+        self._lookup_arrays = None
         self._generate_lookup()
 
     def _generate_lookup(self):
@@ -204,3 +242,174 @@ class CubicBezierSpline:
         high = self._lookup[index][interval[1]][1]
 
         return low.y + (x - low.x) * ((high.y - low.y) / (high.x - low.x))
+
+    def evaluate_batch(self, values):
+        """Returns the function values at all the desired positions.
+
+        Numpy arrays are evaluated vectorized, any other sequence is
+        evaluated one value at a time.
+
+        :param values the locations at which to evaluate the function
+        :return function values at the provided positions
+        """
+        if numpy is None or not isinstance(values, numpy.ndarray):
+            return [self(x) for x in values]
+
+        if self._lookup_arrays is None:
+            self._lookup_arrays = [
+                (
+                    numpy.array([pt.x for _, pt in lookup]),
+                    numpy.array([pt.y for _, pt in lookup])
+                ) for lookup in self._lookup
+            ]
+
+        x = numpy.clip(values.astype(float, copy=False), -1.0, 1.0)
+
+        # Determine spline group to use for every value
+        knots = numpy.array([pt[0] for pt in self.knots], dtype=float)
+        segment_count = len(self._lookup)
+        segments = numpy.clip(
+            numpy.searchsorted(knots, x, side="left") - 1,
+            0,
+            segment_count-1
+        )
+        segments[x >= knots[-1]] = segment_count-1
+
+        # Linearly interpolate the lookup table data of each group
+        result = numpy.empty_like(x)
+        for index, (lookup_x, lookup_y) in enumerate(self._lookup_arrays):
+            mask = segments == index
+            if not mask.any():
+                continue
+            xs = x[mask]
+            low = numpy.clip(
+                numpy.searchsorted(lookup_x, xs, side="left") - 1,
+                0,
+                len(lookup_x)-2
+            )
+            high = low + 1
+            result[mask] = lookup_y[low] + (xs - lookup_x[low]) * (
+                (lookup_y[high] - lookup_y[low]) /
+                (lookup_x[high] - lookup_x[low])
+            )
+        return result
+
+
+class LookupTable:
+
+    """Piecewise linear approximation of a function on a range of values.
+
+    The function is sampled once at evenly spaced positions, evaluating
+    the table afterwards only requires a single interpolation. Values
+    outside of the range evaluate to the value at the closest end of it.
+    """
+
+    # Default number of intervals the range is split into
+    default_size = 4096
+
+    def __init__(self, values, start=-1.0, end=1.0):
+        """Creates a new LookupTable object.
+
+        :param values the function values at the positions returned by
+            LookupTable.positions
+        :param start the start of the range covered by the table
+        :param end the end of the range covered by the table
+        """
+        if gremlin.axis_batch.is_vectorized(values):
+            values = values.tolist()
+        self.values = array.array("d", values)
+        self.size = len(self.values) - 1
+        self.start = start
+        self.end = end
+        self._scale = self.size / (end - start)
+
+    @staticmethod
+    def positions(size=None, start=-1.0, end=1.0):
+        """Returns the positions at which a table samples its function.
+
+        :param size number of intervals the range is split into
+        :param start the start of the range
+        :param end the end of the range
+        :return batch of size + 1 evenly spaced positions
+        """
+        if size is None:
+            size = LookupTable.default_size
+        step = (end - start) / size
+        return gremlin.axis_batch.as_samples(
+            [start + i * step for i in range(size)] + [end]
+        )
+
+    @classmethod
+    def from_function(cls, function, size=None, start=-1.0, end=1.0):
+        """Returns a new table sampling the provided function.
+
+        :param function the function to sample, see gremlin.axis_batch.curve
+        :param size number of intervals the range is split into
+        :param start the start of the range
+        :param end the end of the range
+        :return LookupTable approximating the function
+        """
+        return cls(
+            gremlin.axis_batch.curve(function, cls.positions(size, start, end)),
+            start,
+            end
+        )
+
+    def __call__(self, x):
+        """Returns the function value at the desired position.
+
+        :param x the location at which to evaluate the function
+        :return function value at the provided position
+        """
+        position = (x - self.start) * self._scale
+        if position <= 0.0:
+            return self.values[0]
+        if position >= self.size:
+            return self.values[-1]
+        index = int(position)
+        low = self.values[index]
+        return low + (position - index) * (self.values[index+1] - low)
+
+
+class DeadzoneLookupTable:
+
+    """Response curve and deadzone baked into lookup tables.
+
+    The deadzone maps the input piecewise linearly onto the input of the
+    curve. Each of its two sloped parts gets a table of its own, which places
+    the corners of the deadzone on table boundaries where they are
+    reproduced exactly.
+    """
+
+    def __init__(self, function, deadzone, size=None):
+        """Creates a new DeadzoneLookupTable object.
+
+        :param function the response curve, see gremlin.axis_batch.curve
+        :param deadzone the [low, center low, center high, high] deadzone
+            limits, see gremlin.input_devices.deadzone
+        :param size number of intervals of each of the two tables
+        """
+        low, low_center, high_center, high = deadzone
+        self.low = self._create_table(function, deadzone, size, low, low_center)
+        self.high = self._create_table(function, deadzone, size, high_center, high)
+
+    def _create_table(self, function, deadzone, size, start, end):
+        positions = LookupTable.positions(size, start, end)
+        return LookupTable(
+            gremlin.axis_batch.curve(
+                function,
+                gremlin.axis_batch.deadzone(positions, *deadzone)
+            ),
+            start,
+            end
+        )
+
+    def __call__(self, x):
+        """Returns the curve value for the desired input.
+
+        :param x the input value
+        :return curve value after applying the deadzone
+        """
+        if x < 0.0:
+            return self.low(x)
+        return self.high(x)
@@ -0,0 +1,262 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Inventory of the runtime worker threads and a watchdog monitoring them.
+
+Long-lived worker loops register themselves under a name and signal
+progress with heartbeats. The watchdog periodically samples the number of
+threads in the process and reports workers busy without a heartbeat for
+longer than their stall timeout. Threads still alive after a profile stopped
+that did not exist before it started are reported as leaked.
+"""
+
+import collections
+import logging
+import threading
+import time
+
+import gremlin.clock
+import gremlin.perf_stats
+from gremlin.singleton_decorator import SingletonDecorator
+
+
+class Worker:
+
+    """Registration of a worker thread."""
+
+    def __init__(self, name, thread, stall_timeout, persistent):
+        """Creates a new instance.
+
+        :param name name of the worker
+        :param thread the thread running the worker
+        :param stall_timeout time in seconds the worker may be busy without
+            a heartbeat, None to disable stall detection
+        :param persistent True if the thread outlives a profile run
+        """
+        self.name = name
+        self.thread = thread
+        self.stall_timeout = stall_timeout
+        self.persistent = persistent
+        self.last_beat = gremlin.clock.now()
+        self.beats = 0
+        self.is_idle = False
+        self.is_stalled = False
+        self.stalls = 0
+
+    def beat(self):
+        """Signals the worker is making progress."""
+        self.last_beat = gremlin.clock.now()
+        self.beats += 1
+        self.is_idle = False
+
+    def idle(self):
+        """Signals the worker is waiting for work and cannot stall."""
+        self.is_idle = True
+
+    def unregister(self):
+        """Removes the worker from the registry."""
+        ThreadRegistry().unregister(self)
+
+
+@SingletonDecorator
+class ThreadRegistry:
+
+    """Tracks the worker threads of the runtime."""
+
+    # Number of thread count samples kept
+    history_size = 3600
+
+    def __init__(self):
+        """Creates a new instance."""
+        self._lock = threading.Lock()
+        self._workers = {}
+        self._baseline = set()
+        self._watchdog = None
+        self._watchdog_stop = None
+        self.interval = 1.0
+        self.thread_count = gremlin.perf_stats.SampleStats()
+        self.history = collections.deque(maxlen=self.history_size)
+        self.stalls = 0
+
+    def register(self, name, stall_timeout=1.0, persistent=False, thread=None):
+        """Registers a worker thread.
+
+        :param name name of the worker
+        :param stall_timeout time in seconds the worker may be busy without
+            a heartbeat, None to disable stall detection
+        :param persistent True if the thread is expected to outlive a
+            profile run
+        :param thread the thread running the worker, the calling thread if
+            not specified
+        :return Worker handle used to send heartbeats
+        """
+        if thread is None:
+            thread = threading.current_thread()
+        worker = Worker(name, thread, stall_timeout, persistent)
+        with self._lock:
+            self._workers[worker] = None
+        return worker
+
+    def unregister(self, worker):
+        """Removes a worker.
+
+        :param worker the Worker handle to remove
+        """
+        with self._lock:
+            self._workers.pop(worker, None)
+
+    @property
+    def workers(self):
+        """Returns the registered workers whose thread is alive."""
+        with self._lock:
+            return [w for w in self._workers if w.thread.is_alive()]
+
+    def set_baseline(self):
+        """Records the threads alive before a profile starts."""
+        with self._lock:
+            self._baseline = set(threading.enumerate())
+
+    def leaked_threads(self, timeout=1.0):
+        """Returns the threads started since the baseline that are still alive.
+
+        Threads of persistent workers are not considered leaked.
+
+        :param timeout time in seconds given to exiting threads to finish
+        :return list of thread names
+        """
+        with self._lock:
+            persistent = set(w.thread for w in self._workers if w.persistent)
+            baseline = self._baseline
+        candidates = [
+            t for t in threading.enumerate()
+            if t not in baseline and t not in persistent
+            and t is not threading.current_thread()
+        ]
+        deadline = time.monotonic() + timeout
+        for thread in candidates:
+            thread.join(max(0.0, deadline - time.monotonic()))
+        return [t.name for t in candidates if t.is_alive()]
+
+    def start_watchdog(self, interval=1.0):
+        """Starts the watchdog thread.
+
+        The watchdog runs on its own thread so that a stall of the timer
+        service is detected as well.
+
+        :param interval time in seconds between two checks
+        """
+        with self._lock:
+            self.interval = interval
+            self.stalls = 0
+            self.thread_count.reset()
+            self.history.clear()
+            if self._watchdog is None:
+                self._watchdog_stop = threading.Event()
+                self._watchdog = threading.Thread(
+                    target=self._run_watchdog,
+                    args=(self._watchdog_stop,),
+                    name="Watchdog",
+                    daemon=True
+                )
+                self._watchdog.start()
+
+    def stop_watchdog(self):
+        """Stops the watchdog thread."""
+        with self._lock:
+            thread = self._watchdog
+            self._watchdog = None
+            if thread is not None:
+                self._watchdog_stop.set()
+        if thread is not None:
+            thread.join()
+
+    def check(self):
+        """Samples the thread count and detects stalled workers.
+
+        :return list of the names of stalled workers
+        """
+        now = gremlin.clock.now()
+        count = threading.active_count()
+        self.thread_count.add(count)
+        self.history.append((now, count))
+
+        stalled = []
+        with self._lock:
+            # forget about workers whose thread has finished
+            for worker in [w for w in self._workers if not w.thread.is_alive()]:
+                del self._workers[worker]
+            workers = list(self._workers)
+
+        for worker in workers:
+            is_stalled = worker.stall_timeout is not None \
+                and not worker.is_idle \
+                and now - worker.last_beat > worker.stall_timeout
+            if is_stalled:
+                stalled.append(worker.name)
+                if not worker.is_stalled:
+                    worker.stalls += 1
+                    self.stalls += 1
+                    logging.getLogger("system").warning(
+                        f"Watchdog: {worker.name} has not responded for "
+                        f"{now - worker.last_beat:.1f}s"
+                    )
+            elif worker.is_stalled:
+                logging.getLogger("system").info(
+                    f"Watchdog: {worker.name} recovered"
+                )
+            worker.is_stalled = is_stalled
+        return stalled
+
+    def report(self):
+        """Returns the thread inventory and watchdog statistics."""
+        with self._lock:
+            workers = list(self._workers)
+        registered = set(w.thread for w in workers)
+        return {
+            "threads": threading.active_count(),
+            "thread_count": self.thread_count.summary(),
+            "stalls": self.stalls,
+            "workers": {
+                w.name: {
+                    "alive": w.thread.is_alive(),
+                    "beats": w.beats,
+                    "stalls": w.stalls,
+                    "stalled": w.is_stalled
+                } for w in workers
+            },
+            "unregistered": sorted(
+                t.name for t in threading.enumerate() if t not in registered
+            )
+        }
+
+    def _run_watchdog(self, stop_event):
+        ''' watchdog thread, runs until the stop event is set '''
+        while not stop_event.is_set():
+            self.check()
+            stop_event.wait(self.interval)
+
+
+def register(name, stall_timeout=1.0, persistent=False):
+    """Registers the calling thread as a worker.
+
+    :param name name of the worker
+    :param stall_timeout time in seconds the worker may be busy without a
+        heartbeat, None to disable stall detection
+    :param persistent True if the thread is expected to outlive a profile run
+    :return Worker handle used to send heartbeats
+    """
+    return ThreadRegistry().register(name, stall_timeout, persistent)
@@ -0,0 +1,247 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+"""Fixed rate tick engine driving continuous runtime outputs.
+
+Behaviours producing output continuously, such as mouse motion or relative
+axes, register a tick handler instead of running their own polling thread.
+All handlers are processed in a single pass per tick and the vJoy axis and
+mouse motion writes they request are collected and sent once at the end of
+the tick. Ticks are only scheduled while handlers are registered.
+"""
+
+import itertools
+import logging
+import threading
+
+import gremlin.clock
+import gremlin.error
+import gremlin.perf_stats
+from gremlin.singleton_decorator import SingletonDecorator
+
+
+@SingletonDecorator
+class TickEngine:
+
+    """Runs registered tick handlers at a fixed rate."""
+
+    def __init__(self):
+        """Creates a new instance."""
+        self._lock = threading.Lock()
+        # registration number of each handler, indexed by handler
+        self._handlers = {}
+        self._counter = itertools.count()
+        self._rate = 100.0
+        self._running = False
+        self._timer = None
+        self._next_tick = 0.0
+
+        # Output requested by handlers during the current tick
+        self._mouse_dx = 0
+        self._mouse_dy = 0
+        self._vjoy_axes = {}
+
+        # Statistics
+        self.ticks = 0
+        self.jitter = gremlin.perf_stats.SampleStats()
+        self.duration = gremlin.perf_stats.SampleStats()
+
+    @property
+    def rate(self):
+        """Returns the number of ticks per second."""
+        return self._rate
+
+    @rate.setter
+    def rate(self, value):
+        """Sets the number of ticks per second.
+
+        :param value ticks per second, clamped to [10, 1000]
+        """
+        self._rate = min(1000.0, max(10.0, float(value)))
+
+    @property
+    def period(self):
+        """Returns the time between ticks in seconds."""
+        return 1.0 / self._rate
+
+    @property
+    def is_active(self):
+        """Returns True if ticks are currently scheduled."""
+        return self._timer is not None
+
+    def start(self):
+        """Starts processing the registered handlers."""
+        with self._lock:
+            self._running = True
+            self._reset_counters()
+            self._wake()
+
+    def stop(self):
+        """Stops ticking and removes all handlers."""
+        with self._lock:
+            self._running = False
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._handlers = {}
+            self._mouse_dx = 0
+            self._mouse_dy = 0
+            self._vjoy_axes = {}
+
+    def add(self, handler):
+        """Registers a tick handler.
+
+        The handler is called with the time step in seconds on every tick
+        and stays registered until it returns False or is removed.
+
+        :param handler the callable to run on every tick
+        """
+        with self._lock:
+            self._handlers[handler] = next(self._counter)
+            self._wake()
+
+    def remove(self, handler):
+        """Removes a tick handler.
+
+        :param handler the handler to remove
+        """
+        with self._lock:
+            self._handlers.pop(handler, None)
+
+    def move_mouse(self, dx, dy):
+        """Requests a relative mouse motion as part of the current tick.
+
+        :param dx motion along the x axis in pixels
+        :param dy motion along the y axis in pixels
+        """
+        with self._lock:
+            self._mouse_dx += dx
+            self._mouse_dy += dy
+
+    def set_vjoy_axis(self, vjoy_id, axis_id, value):
+        """Requests a vJoy axis value as part of the current tick.
+
+        Only the last value requested for an axis within a tick is sent.
+
+        :param vjoy_id id of the vJoy device
+        :param axis_id id of the axis
+        :param value the new axis value
+        """
+        with self._lock:
+            self._vjoy_axes[(vjoy_id, axis_id)] = value
+
+    def report(self):
+        """Returns the tick statistics, times in milliseconds."""
+        def to_ms(summary):
+            return {key: value * 1000.0 if key != "count" else value
+                    for key, value in summary.items()}
+
+        with self._lock:
+            return {
+                "rate": self._rate,
+                "ticks": self.ticks,
+                "handlers": len(self._handlers),
+                "jitter_ms": to_ms(self.jitter.summary()),
+                "duration_ms": to_ms(self.duration.summary())
+            }
+
+    def _reset_counters(self):
+        self.ticks = 0
+        self.jitter.reset()
+        self.duration.reset()
+
+    def _wake(self):
+        """Schedules the first tick if handlers are waiting.
+
+        Must be called with the lock held.
+        """
+        if self._running and self._timer is None and self._handlers:
+            self._next_tick = gremlin.clock.now()
+            self._timer = gremlin.clock.call_later(0.0, self._tick)
+
+    def _tick(self):
+        """Runs all handlers once and sends the output they requested."""
+        start = gremlin.clock.now()
+        with self._lock:
+            if not self._running or not self._handlers:
+                self._timer = None
+                return
+            self.jitter.add(max(0.0, start - self._next_tick))
+            handlers = list(self._handlers.items())
+            period = self.period
+
+        finished = []
+        for handler, registration in handlers:
+            try:
+                if handler(period) is False:
+                    finished.append((handler, registration))
+            except Exception as err:
+                logging.getLogger("system").error(
+                    f"Tick handler {handler} failed: {err}"
+                )
+                finished.append((handler, registration))
+
+        with self._lock:
+            # Keep handlers registered again while they were running
+            for handler, registration in finished:
+                if self._handlers.get(handler) == registration:
+                    del self._handlers[handler]
+            dx, dy = self._mouse_dx, self._mouse_dy
+            self._mouse_dx = 0
+            self._mouse_dy = 0
+            axes = self._vjoy_axes
+            self._vjoy_axes = {}
+        self._flush(dx, dy, axes)
+
+        with self._lock:
+            self.ticks += 1
+            now = gremlin.clock.now()
+            self.duration.add(now - start)
+            if not self._running or not self._handlers:
+                self._timer = None
+                return
+
+            # Ticks are spaced relative to the previous deadline to avoid
+            # drift, unless the engine fell behind by more than a tick
+            self._next_tick += period
+            if self._next_tick < now - period:
+                self._next_tick = now
+            self._timer = gremlin.clock.call_later(
+                self._next_tick - now, self._tick
+            )
+
+    def _flush(self, dx, dy, axes):
+        """Sends the output collected during a tick.
+
+        :param dx accumulated mouse motion along the x axis
+        :param dy accumulated mouse motion along the y axis
+        :param axes vJoy axis values indexed by (vjoy id, axis id)
+        """
+        if dx != 0 or dy != 0:
+            import gremlin.sendinput
+            gremlin.sendinput.mouse_relative_motion(int(dx), int(dy))
+
+        if axes:
+            import gremlin.joystick_handling
+            proxy = gremlin.joystick_handling.VJoyProxy()
+            for (vjoy_id, axis_id), value in axes.items():
+                try:
+                    proxy[vjoy_id].axis(axis_id).value = value
+                except gremlin.error.VJoyError as err:
+                    logging.getLogger("system").error(
+                        f"Tick engine: unable to set vJoy {vjoy_id} axis {axis_id}: {err}"
+                    )
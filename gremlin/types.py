@@ -896,6 +896,15 @@ class VerboseMode(IntFlag):
         return  (self.value & item.value) == item.value
 
 
+@unique
+class RawInputSource(IntEnum):
+    ''' entry points of raw input data into the event listener '''
+    Joystick = 1 # DILL joystick data
+    Keyboard = 2 # keyboard hook event
+    Midi = 3 # MIDI message
+    Osc = 4 # OSC message
+
+
 @unique
 class TabDeviceType(int, Enum):
     ''' types of devices shown on device tabs '''
@@ -537,6 +537,23 @@ class OptionsUi(ui_common.BaseDialogUi):
         self.macro_axis_minimum_change_layout.addWidget(self.macro_axis_minimum_change_value)
         self.macro_axis_minimum_change_layout.addStretch()
 
+        # Runtime tick rate
+        self.tick_rate_widget = QtWidgets.QWidget()
+        self.tick_rate_widget.setContentsMargins(0,0,0,0)
+        self.tick_rate_layout = QtWidgets.QHBoxLayout(self.tick_rate_widget)
+        self.tick_rate_layout.setContentsMargins(0,0,0,0)
+
+        self.tick_rate_label = QtWidgets.QLabel("Runtime update rate (Hz)")
+        self.tick_rate_value = QtWidgets.QSpinBox()
+        self.tick_rate_value.setRange(10, 1000)
+        self.tick_rate_value.setSingleStep(10)
+        self.tick_rate_value.setValue(self.config.tick_rate)
+        self.tick_rate_value.setToolTip("Number of updates per second of continuous outputs such as mouse motion and relative axes, higher values give smoother output")
+        self.tick_rate_value.valueChanged.connect(self._tick_rate)
+        self.tick_rate_layout.addWidget(self.tick_rate_label)
+        self.tick_rate_layout.addWidget(self.tick_rate_value)
+        self.tick_rate_layout.addStretch()
+
 
         self.runtime_ui_update = QtWidgets.QCheckBox("Update UI when profile is active")
         self.runtime_ui_update.setChecked(self.config.runtime_ui_update)
@@ -634,6 +651,7 @@ class OptionsUi(ui_common.BaseDialogUi):
         self.general_layout.addWidget(self.show_mode_change_message)
         self.general_layout.addWidget(self.default_action_widget)
         self.general_layout.addWidget(self.macro_axis_minimum_change_widget)
+        self.general_layout.addWidget(self.tick_rate_widget)
         self.general_layout.addWidget(self.remote_control_widget)
         self.general_layout.addWidget(self.enable_broadcast_speech)
         self.general_layout.addStretch()
@@ -1197,6 +1215,13 @@ This setting is also available on a profile by profile basis on the profile tab,
         """
         self.config.macro_axis_minimum_change_rate = value
 
+    def _tick_rate(self, value):
+        """Updates the config with the newly set runtime update rate.
+
+        :param value the new number of updates per second
+        """
+        self.config.tick_rate = value
+
     def _create_hg_cb(self, *params):
         return lambda x: self._update_hg_device(x, *params)
 
@@ -481,7 +481,13 @@ class MidiInterface(QtCore.QObject):
         mido.set_backend('mido.backends.rtmidi')
         self._port_names = []
         self._port_map = {}
-        for index, name in enumerate(mido.get_input_names()):
+        try:
+            input_names = mido.get_input_names()
+        except Exception as error:
+            # MIDI backend not usable, e.g. no sound system on a build machine
+            logging.getLogger("system").warning(f"MIDI: unable to list input ports: {error}")
+            input_names = []
+        for index, name in enumerate(input_names):
             self._port_names.append(name)
             self._port_map[name] = index
         self._port_count = len(self._port_names)
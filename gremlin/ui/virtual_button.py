@@ -95,6 +95,10 @@ class VirtualAxisButtonWidget(AbstractVirtualButtonWidget):
             self.direction.addItem("Anywhere")
             self.direction.addItem("Above")
             self.direction.addItem("Below")
+            self.hysteresis = gremlin.ui.ui_common.DynamicDoubleSpinBox()
+            self.hysteresis.setRange(0.0, 0.5)
+            self.hysteresis.setSingleStep(0.01)
+            self.hysteresis.setToolTip("Distance by which the axis has to leave the range before the button is released, avoids repeated activations caused by noise at the range boundaries")
 
             self.setTitle("Virtual Button")
             self.range_layout.addWidget(
@@ -107,6 +111,8 @@ class VirtualAxisButtonWidget(AbstractVirtualButtonWidget):
                 QtWidgets.QLabel("when entering the range from")
             )
             self.range_layout.addWidget(self.direction)
+            self.range_layout.addWidget(QtWidgets.QLabel("hysteresis"))
+            self.range_layout.addWidget(self.hysteresis)
 
             self.range_layout.addStretch(1)
 
@@ -119,6 +125,7 @@ class VirtualAxisButtonWidget(AbstractVirtualButtonWidget):
             self.lower_limit.valueChanged.connect(self._lower_limit_cb)
             self.upper_limit.valueChanged.connect(self._upper_limit_cb)
             self.direction.currentTextChanged.connect(self._direction_changed_cb)
+            self.hysteresis.valueChanged.connect(self._hysteresis_cb)
         finally:
             VirtualAxisButtonWidget.locked = False
 
@@ -131,6 +138,7 @@ class VirtualAxisButtonWidget(AbstractVirtualButtonWidget):
                 self.condition_data.direction
             ).capitalize()
         )
+        self.hysteresis.setValue(self.condition_data.hysteresis)
 
     def _lower_limit_cb(self, value):
         """Updates the lower limit value.
@@ -148,6 +156,14 @@ class VirtualAxisButtonWidget(AbstractVirtualButtonWidget):
         self.condition_data.upper_limit = value
         self.virtual_button_modified.emit()
 
+    def _hysteresis_cb(self, value):
+        """Updates the hysteresis value.
+
+        :param value the new hysteresis of the virtual button
+        """
+        self.condition_data.hysteresis = value
+        self.virtual_button_modified.emit()
+
     def _direction_changed_cb(self, value):
         self.condition_data.direction = \
             gremlin.types.AxisButtonDirection.to_enum(value.lower())
@@ -33,7 +33,8 @@ from typing import Callable
 
 
 from PySide6 import QtCore, QtWidgets, QtGui
-from win32api import GetFileVersionInfo, LOWORD, HIWORD
+if sys.platform == "win32":
+    from win32api import GetFileVersionInfo, LOWORD, HIWORD
 from PySide6.QtGui import QColor
 
 from . import error
@@ -162,10 +163,12 @@ def script_path():
 
 def userprofile_path():
     """Returns the path to the user's profile folder, %userprofile%."""
-    path = os.path.abspath(os.path.join(os.getenv("userprofile"),"Joystick Gremlin Ex"))
+    # home folder outside of Windows
+    user_path = os.getenv("userprofile", os.path.expanduser("~"))
+    path = os.path.abspath(os.path.join(user_path,"Joystick Gremlin Ex"))
     if not os.path.isdir(path):
         # profile folder does not exist - see if we can create it from the original profile
-        source_path = os.path.abspath(os.path.join(os.getenv("userprofile"),"Joystick Gremlin"))
+        source_path = os.path.abspath(os.path.join(user_path,"Joystick Gremlin"))
         if os.path.isdir(source_path):
             try:
                 # copy from original profile
@@ -220,6 +223,12 @@ def display_error(msg):
 
     :param msg the error message to display
     """
+    import gremlin.shared_state
+
+    if gremlin.shared_state.is_headless:
+        # nobody to show a dialog to
+        logging.getLogger("system").error(msg)
+        return
 
     # verify an application exist
     app = QtWidgets.QApplication.instance()
@@ -459,7 +468,8 @@ def get_dll_version(path, as_string = True):
     :param path - the full path to the file
     :returns file major, file minor, product version major, product version minor as integers
     '''
-    if not os.path.isfile(path):
+    if not os.path.isfile(path) or sys.platform != "win32":
+        # version resources can only be read on Windows
         if as_string:
             return None
         return (0,0,0,0)
@@ -18,6 +18,7 @@
 
 import ctypes
 from ctypes import wintypes
+import sys
 import threading
 import time
 import gremlin.common
@@ -26,12 +27,17 @@ import gremlin.shared_state
 from gremlin.singleton_decorator import SingletonDecorator
 
 
-user32 = ctypes.WinDLL("user32")
+if sys.platform == "win32":
+    user32 = ctypes.WinDLL("user32")
+    import win32api
+else:
+    # low level hooks only exist on Windows, the hooks never start
+    user32 = None
+    from gremlin import fake_keyboard as win32api
 
 
 g_keyboard_callbacks = []
 g_mouse_callbacks = []
-import win32api
 import logging
 
 
@@ -121,44 +127,45 @@ def get_last_error():
 #     https://msdn.microsoft.com/en-us/library/windows/desktop/ms644967(v=vs.85).aspx
 
 # Signature of a hook callback function which can be used as a decorator
-HOOKPROC = ctypes.WINFUNCTYPE(
+HOOKPROC = getattr(ctypes, "WINFUNCTYPE", ctypes.CFUNCTYPE)(
     wintypes.LPARAM,
     ctypes.c_int,
     wintypes.WPARAM,
     wintypes.LPARAM
 )
 
-# Function to hook into an event stream
-user32.SetWindowsHookExW.restype = wintypes.HHOOK
-user32.SetWindowsHookExW.argtypes = (
-    ctypes.c_int,           # _In_ idHook
-    HOOKPROC,               # _In_ lpfn
-    wintypes.HINSTANCE,     # _In_ hMod
-    wintypes.DWORD          # _In_ dwThreadId
-)
+if user32 is not None:
+    # Function to hook into an event stream
+    user32.SetWindowsHookExW.restype = wintypes.HHOOK
+    user32.SetWindowsHookExW.argtypes = (
+        ctypes.c_int,           # _In_ idHook
+        HOOKPROC,               # _In_ lpfn
+        wintypes.HINSTANCE,     # _In_ hMod
+        wintypes.DWORD          # _In_ dwThreadId
+    )
 
-# Function to call next hook in the chain
-user32.CallNextHookEx.restype = wintypes.LPARAM
-user32.CallNextHookEx.argtypes = (
-    wintypes.HHOOK,         # _In_opt_ hhk
-    ctypes.c_int,           # _In_     nCode
-    wintypes.WPARAM,        # _In_     wParam
-    wintypes.LPARAM         # _In_     lParam
-)
+    # Function to call next hook in the chain
+    user32.CallNextHookEx.restype = wintypes.LPARAM
+    user32.CallNextHookEx.argtypes = (
+        wintypes.HHOOK,         # _In_opt_ hhk
+        ctypes.c_int,           # _In_     nCode
+        wintypes.WPARAM,        # _In_     wParam
+        wintypes.LPARAM         # _In_     lParam
+    )
 
-# Retrieve a single message from a stream
-user32.GetMessageW.argtypes = (
-    wintypes.LPMSG,         # _Out_    lpMsg
-    wintypes.HWND,          # _In_opt_ hWnd
-    wintypes.UINT,          # _In_     wMsgFilterMin
-    wintypes.UINT           # _In_     wMsgFilterMax
-)
+    # Retrieve a single message from a stream
+    user32.GetMessageW.argtypes = (
+        wintypes.LPMSG,         # _Out_    lpMsg
+        wintypes.HWND,          # _In_opt_ hWnd
+        wintypes.UINT,          # _In_     wMsgFilterMin
+        wintypes.UINT           # _In_     wMsgFilterMax
+    )
 
-# Convert message content
-user32.TranslateMessage.argtypes = (wintypes.LPMSG,)
+    # Convert message content
+    user32.TranslateMessage.argtypes = (wintypes.LPMSG,)
 
-# Dispatch message to hooked processes
-user32.DispatchMessageW.argtypes = (wintypes.LPMSG,)
+    # Dispatch message to hooked processes
+    user32.DispatchMessageW.argtypes = (wintypes.LPMSG,)
 
 # Action definitions
 HC_ACTION       = 0
@@ -374,7 +381,7 @@ class KeyboardHook:
 
     def start(self):
         """Starts the hook if it is not yet running."""
-        if self._running:
+        if self._running or user32 is None:
             return
         self._running = True
         self._listen_thread.start()
@@ -430,7 +437,7 @@ class MouseHook:
 
     def start(self):
         """Starts the hook if it is not yet running."""
-        if self._running:
+        if self._running or user32 is None:
             return
         self._running = True
         self._listen_thread.start()
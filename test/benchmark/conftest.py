@@ -0,0 +1,253 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+"""Benchmark support for the runtime hot path benchmarks.
+
+Benchmarks use the bench fixture to time a callable:
+
+    def test_bench_something(bench):
+        bench(function, arg1, arg2)
+
+The options below are only recognized when the benchmark directory is passed
+to pytest explicitly:
+
+    python -m pytest test/benchmark --bench-json results.json
+    python -m pytest test/benchmark --bench-baseline results.json
+
+--bench-json writes the results of all benchmarks as JSON, such a file can
+later be used as the baseline. With --bench-baseline every benchmark whose
+median time per call exceeds the baseline median by more than the tolerance
+fails.
+"""
+
+import sys
+sys.path.append(".")
+
+import datetime
+import json
+import platform
+import time
+import uuid
+
+import pytest
+
+import dinput.fake
+import gremlin.perf_stats
+from gremlin.input_types import InputType
+from gremlin.types import DeviceType
+
+
+_results_key = pytest.StashKey[dict]()
+_baseline_key = pytest.StashKey[dict]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("bench", "runtime benchmarks")
+    group.addoption(
+        "--bench-json",
+        default=None,
+        help="Write the benchmark results to the given JSON file"
+    )
+    group.addoption(
+        "--bench-baseline",
+        default=None,
+        help="Compare the benchmark results against the given JSON file"
+    )
+    group.addoption(
+        "--bench-tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown relative to the baseline, 0.25 = 25%%"
+    )
+    group.addoption(
+        "--bench-rounds",
+        type=int,
+        default=5,
+        help="Number of timed rounds per benchmark"
+    )
+    group.addoption(
+        "--bench-min-time",
+        type=float,
+        default=0.02,
+        help="Minimum duration in seconds of a single timed round"
+    )
+
+
+def pytest_configure(config):
+    config.stash[_results_key] = {}
+    baseline = {}
+    fname = config.getoption("--bench-baseline", None)
+    if fname:
+        with open(fname, "r") as fh:
+            baseline = json.load(fh).get("benchmarks", {})
+    config.stash[_baseline_key] = baseline
+
+
+def pytest_sessionfinish(session, exitstatus):
+    fname = session.config.getoption("--bench-json", None)
+    results = session.config.stash.get(_results_key, {})
+    if not fname or not results:
+        return
+    data = {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "benchmarks": results
+    }
+    with open(fname, "w") as fh:
+        json.dump(data, fh, indent=2, sort_keys=True)
+
+
+class Benchmark:
+
+    """Times a callable and records the result."""
+
+    def __init__(self, name, rounds, min_time, baseline, tolerance):
+        """Creates a new benchmark.
+
+        :param name name under which the result is stored
+        :param rounds number of timed rounds
+        :param min_time minimum duration of a single round in seconds
+        :param baseline baseline result of this benchmark, None if there is none
+        :param tolerance allowed slowdown relative to the baseline
+        """
+        self.name = name
+        self.rounds = rounds
+        self.min_time = min_time
+        self.baseline = baseline
+        self.tolerance = tolerance
+        self.result = None
+
+    def __call__(self, function, *args, **kwargs):
+        """Times the function and returns the result of its last call.
+
+        :param function the callable to time
+        :param args positional arguments passed to the callable
+        :param kwargs keyword arguments passed to the callable
+        :return value returned by the callable
+        """
+        # Calibrate the number of calls so a round lasts at least min_time
+        number = 1
+        while True:
+            duration = self._time(function, args, kwargs, number)
+            if duration >= self.min_time or number >= 1 << 24:
+                break
+            number *= 10 if duration < self.min_time / 10 else 2
+
+        stats = gremlin.perf_stats.SampleStats(history=self.rounds)
+        for _ in range(self.rounds):
+            stats.add(self._time(function, args, kwargs, number) / number)
+
+        summary = stats.summary()
+        self.result = {
+            "rounds": self.rounds,
+            "iterations": number,
+            "mean": summary["mean"],
+            "median": summary["p50"],
+            "max": summary["max"],
+            "ops_per_second": 1.0 / summary["p50"] if summary["p50"] > 0 else 0.0
+        }
+        self._check_baseline()
+        return function(*args, **kwargs)
+
+    def _time(self, function, args, kwargs, number):
+        start = time.perf_counter()
+        for _ in range(number):
+            function(*args, **kwargs)
+        return time.perf_counter() - start
+
+    def _check_baseline(self):
+        if not self.baseline:
+            return
+        limit = self.baseline["median"] * (1.0 + self.tolerance)
+        median = self.result["median"]
+        if median > limit:
+            pytest.fail(
+                f"{self.name}: median {median * 1e6:0.3f} us exceeds baseline "
+                f"{self.baseline['median'] * 1e6:0.3f} us by more than "
+                f"{self.tolerance * 100:0.0f}%"
+            )
+
+
+@pytest.fixture
+def bench(request):
+    """Returns a Benchmark recording its result under the test's name."""
+    config = request.config
+    name = request.node.nodeid.rsplit("/", 1)[-1]
+    benchmark = Benchmark(
+        name,
+        config.getoption("--bench-rounds", 5),
+        config.getoption("--bench-min-time", 0.02),
+        config.stash[_baseline_key].get(name),
+        config.getoption("--bench-tolerance", 0.25)
+    )
+    yield benchmark
+    if benchmark.result is not None:
+        config.stash[_results_key][name] = benchmark.result
+
+
+def build_profile(device_count=8, button_count=32, axis_count=8, actions=1):
+    """Creates a profile mapping every input of a number of devices.
+
+    Every input gets a basic container holding description actions, which
+    execute without side effects.
+
+    :param device_count number of joystick devices
+    :param button_count number of buttons per device
+    :param axis_count number of axes per device
+    :param actions number of actions per container
+    :return the profile
+    """
+    import gremlin.base_profile
+    import gremlin.plugin_manager
+
+    container_type = gremlin.plugin_manager.ContainerPlugins().tag_map["basic"]
+    action_type = gremlin.plugin_manager.ActionPlugins().tag_map["description"]
+
+    profile = gremlin.base_profile.Profile()
+    # profile modes are those of the keyboard device
+    profile.get_device_modes(
+        dinput.GUID_Keyboard,
+        DeviceType.Keyboard,
+        DeviceType.to_string(DeviceType.Keyboard)
+    ).ensure_mode_exists("Default")
+    for device_index in range(device_count):
+        device = profile.get_device_modes(
+            dinput.fake.guid_from_uuid(uuid.uuid4()),
+            DeviceType.Joystick,
+            f"Benchmark device {device_index + 1}"
+        )
+        device.ensure_mode_exists("Default")
+        mode = device.modes["Default"]
+        inputs = [(InputType.JoystickButton, i) for i in range(1, button_count + 1)] + \
+            [(InputType.JoystickAxis, i) for i in range(1, axis_count + 1)]
+        for input_type, input_id in inputs:
+            item = mode.get_data(input_type, input_id)
+            container = container_type(item)
+            for action_index in range(actions):
+                action = action_type(container)
+                action.description = f"{device.name} {input_id} {action_index}"
+                container.add_action(action)
+            item.add_container(container)
+    return profile
+
+
+@pytest.fixture
+def profile_factory():
+    """Returns the function creating synthetic profiles."""
+    return build_profile
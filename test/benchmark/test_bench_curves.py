@@ -0,0 +1,96 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import sys
+sys.path.append(".")
+
+import itertools
+
+import pytest
+
+import gremlin.curve_handler
+import gremlin.spline
+
+
+control_points = [
+    (-1.0, -1.0), (-0.6, -0.3), (-0.2, -0.05), (0.0, 0.0),
+    (0.2, 0.05), (0.6, 0.3), (1.0, 1.0)
+]
+bezier_points = [
+    (-1.0, -1.0), (-0.8, -0.9), (-0.3, -0.1),
+    (0.0, 0.0),
+    (0.3, 0.1), (0.8, 0.9), (1.0, 1.0)
+]
+
+# sweep of input values covering every spline segment
+sweep = [i / 500.0 - 1.0 for i in range(1001)]
+
+
+def _sweep(function):
+    values = itertools.cycle(sweep)
+    return lambda: function(next(values))
+
+
+def test_bench_cubic_spline(bench):
+    spline = gremlin.spline.CubicSpline(control_points)
+    bench(_sweep(spline))
+
+
+def test_bench_cubic_bezier_spline(bench):
+    spline = gremlin.spline.CubicBezierSpline(bezier_points)
+    bench(_sweep(spline))
+
+
+def test_bench_axis_curve_value(bench):
+    curve = gremlin.curve_handler.AxisCurveData()
+    curve.control_points = list(control_points)
+    curve.deadzone = [-1.0, -0.05, 0.05, 1.0]
+    curve.curve_update()
+    bench(_sweep(curve.curve_value))
+
+
+def test_bench_deadzone_lookup_table(bench):
+    spline = gremlin.spline.CubicSpline(control_points)
+    lookup = gremlin.spline.DeadzoneLookupTable(spline, [-1.0, -0.05, 0.05, 1.0])
+    bench(_sweep(lookup))
+
+
+def test_bench_bezier_deadzone_lookup_table(bench):
+    spline = gremlin.spline.CubicBezierSpline(bezier_points)
+    lookup = gremlin.spline.DeadzoneLookupTable(spline, [-1.0, -0.05, 0.05, 1.0])
+    bench(_sweep(lookup))
+
+
+def test_bench_cubic_spline_batch(bench):
+    numpy = pytest.importorskip("numpy")
+    spline = gremlin.spline.CubicSpline(control_points)
+    bench(spline.evaluate_batch, numpy.array(sweep))
+
+
+def test_bench_cubic_bezier_spline_batch(bench):
+    numpy = pytest.importorskip("numpy")
+    spline = gremlin.spline.CubicBezierSpline(bezier_points)
+    bench(spline.evaluate_batch, numpy.array(sweep))
+
+
+def test_bench_axis_curve_values(bench):
+    numpy = pytest.importorskip("numpy")
+    curve = gremlin.curve_handler.AxisCurveData()
+    curve.control_points = list(control_points)
+    curve.deadzone = [-1.0, -0.05, 0.05, 1.0]
+    curve.curve_update()
+    bench(curve.curve_values, numpy.array(sweep))
@@ -0,0 +1,98 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import sys
+sys.path.append(".")
+
+import itertools
+import uuid
+
+import pytest
+
+import dinput
+import dinput.fake
+import gremlin.event_handler
+import gremlin.keyboard
+import gremlin.shared_state
+from gremlin.event_handler import Event
+from gremlin.input_types import InputType
+
+
+device_guid = dinput.fake.guid_from_uuid(uuid.uuid4())
+
+
+def test_bench_event_construction(bench):
+    bench(
+        Event,
+        event_type=InputType.JoystickAxis,
+        identifier=3,
+        device_guid=device_guid,
+        value=0.5,
+        raw_value=16384,
+        is_axis=True
+    )
+
+
+def test_bench_event_hash(bench):
+    event = Event(InputType.JoystickButton, 12, device_guid, is_pressed=True)
+    bench(hash, event)
+
+
+def test_bench_event_dict_lookup(bench):
+    lookup = {
+        Event(InputType.JoystickButton, i, device_guid): i for i in range(1, 129)
+    }
+    event = Event(InputType.JoystickButton, 64, device_guid, is_pressed=True)
+    assert bench(lookup.get, event) == 64
+
+
+@pytest.fixture
+def event_handler():
+    eh = gremlin.event_handler.EventHandler()
+    eh.reset()
+    previous_mode = gremlin.shared_state.runtime_mode
+    gremlin.shared_state.runtime_mode = "Default"
+    yield eh
+    eh.reset()
+    gremlin.shared_state.runtime_mode = previous_mode
+
+
+def test_bench_matching_callbacks(bench, event_handler):
+    guids = [dinput.fake.guid_from_uuid(uuid.uuid4()) for _ in range(8)]
+    for guid in guids:
+        for input_id in range(1, 33):
+            event = Event(InputType.JoystickButton, input_id, guid)
+            event_handler.add_callback(guid, "Default", event, lambda event: None)
+
+    events = itertools.cycle([
+        Event(InputType.JoystickButton, input_id, guid, is_pressed=True)
+        for guid in guids for input_id in range(1, 33, 5)
+    ])
+    result = bench(lambda: event_handler._matching_callbacks(next(events)))
+    assert len(result) == 1
+
+
+def test_bench_keymap_find(bench):
+    assert bench(gremlin.keyboard.KeyMap.find, 0x1e, False) is not None
+
+
+def test_bench_keymap_find_virtual(bench):
+    bench(gremlin.keyboard.KeyMap.find_virtual, 0x41)
+
+
+def test_bench_keymap_find_by_name(bench):
+    assert bench(gremlin.keyboard.KeyMap.find_by_name, "leftshift") is not None
@@ -0,0 +1,57 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import sys
+sys.path.append(".")
+
+import itertools
+
+import gremlin.fsm
+from gremlin.fsm import Transition
+
+
+def _noop():
+    return False
+
+
+transitions = {
+    ("up", "press"): Transition(_noop, "down"),
+    ("up", "release"): Transition(_noop, "up"),
+    ("down", "release"): Transition(_noop, "up"),
+    ("down", "press"): Transition(_noop, "down"),
+}
+
+# axis button samples, mostly staying in the same state
+samples = ["press"] * 10 + ["release"] * 10
+
+
+def test_bench_fsm_perform(bench):
+    fsm = gremlin.fsm.FiniteStateMachine("up", ["up", "down"], ["press", "release"], transitions)
+    actions = itertools.cycle(samples)
+    bench(lambda: fsm.perform(next(actions)))
+
+
+def test_bench_compiled_fsm_perform(bench):
+    fsm = gremlin.fsm.CompiledStateMachine("up", ["up", "down"], ["press", "release"], transitions)
+    actions = itertools.cycle([fsm.action_id(action) for action in samples])
+    bench(lambda: fsm.perform_id(next(actions)))
+
+
+def test_bench_compiled_fsm_batch(bench):
+    fsm = gremlin.fsm.CompiledStateMachine("up", ["up", "down"], ["press", "release"], transitions)
+    batch = [fsm.action_id(action) for action in samples] * 50
+    bench(fsm.perform_batch, batch)
@@ -0,0 +1,62 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import sys
+sys.path.append(".")
+
+import itertools
+
+import pytest
+
+import gremlin.gated_handler
+
+
+# sweep of the full axis range back and forth
+sweep = [i / 250.0 - 1.0 for i in range(501)]
+sweep = sweep + sweep[-2:0:-1]
+
+
+@pytest.mark.parametrize("gate_count", [2, 5, 10])
+def test_bench_process_triggers(bench, gate_count):
+    gate_data = gremlin.gated_handler.GateData("Default", None)
+    for i in range(1, gate_count - 1):
+        gate_data.registerGate(-1.0 + 2.0 * i / (gate_count - 1))
+    ranges = gate_data.updateRanges()
+    assert len(ranges) == gate_count - 1
+    gate_data.pre_process()
+
+    values = itertools.cycle(sweep)
+    bench(lambda: gate_data.process_triggers(next(values), ranges))
+
+
+def test_bench_fast_sweep_1khz(bench):
+    # one second of a 1 kHz device sweeping across 10 gates, the most the
+    # range pool of GateData holds, in 50 ms strokes
+    gate_data = gremlin.gated_handler.GateData("Default", None)
+    for i in range(1, 9):
+        gate_data.registerGate(-1.0 + 2.0 * i / 9)
+    ranges = gate_data.updateRanges()
+    gate_data.pre_process()
+
+    stroke = [i / 25.0 - 1.0 for i in range(51)]
+    samples = list(itertools.islice(itertools.cycle(stroke + stroke[-2:0:-1]), 1000))
+
+    def run():
+        for value in samples:
+            gate_data.process_triggers(value, ranges)
+
+    bench(run)
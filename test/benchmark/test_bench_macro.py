@@ -0,0 +1,72 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import sys
+sys.path.append(".")
+
+import threading
+
+import pytest
+
+import gremlin.macro
+
+
+class CountAction(gremlin.macro.MacroAbstractAction):
+
+    """Macro action which only counts its executions."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, is_local = None, is_remote = None, force_remote = None):
+        self.count += 1
+
+
+@pytest.fixture
+def macro_manager():
+    manager = gremlin.macro.MacroManager()
+    default_delay = manager.default_delay
+    manager.default_delay = 0.0
+    manager.start()
+    yield manager
+    manager.stop()
+    manager.default_delay = default_delay
+
+
+@pytest.mark.parametrize("macro_count", [1, 16])
+def test_bench_macro_throughput(bench, macro_manager, macro_count):
+    action = CountAction()
+    done = threading.Semaphore(0)
+    macros = []
+    for _ in range(macro_count):
+        macro = gremlin.macro.Macro()
+        for _ in range(4):
+            macro.add_action(action)
+        macro.completed_callback = done.release
+        macros.append(macro)
+
+    def run_macros():
+        for macro in macros:
+            macro_manager.queue_macro(macro)
+        for _ in macros:
+            assert done.acquire(timeout=1.0)
+
+    bench(run_macros)
+    report = macro_manager.report()
+    assert report["completed"] == report["dispatched"]
+    assert action.count == 4 * report["completed"]
+    assert report["macros_per_second"] > 0
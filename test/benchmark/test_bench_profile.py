@@ -0,0 +1,86 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import sys
+sys.path.append(".")
+
+import os
+
+import pytest
+
+import gremlin.base_profile
+import gremlin.execution_graph
+import gremlin.shared_state
+from gremlin.event_handler import Event
+from gremlin.input_types import InputType
+from gremlin.types import DeviceType
+
+
+@pytest.fixture
+def large_profile(profile_factory):
+    return profile_factory(device_count=16, button_count=64, axis_count=8, actions=2)
+
+
+def _input_count(profile):
+    return sum(
+        len(items)
+        for device in profile.devices.values()
+        for mode in device.modes.values()
+        for items in mode.config.values()
+    )
+
+
+def test_bench_profile_to_xml(bench, large_profile, tmp_path):
+    fname = os.path.join(tmp_path, "profile.xml")
+    bench(large_profile.to_xml, fname)
+    assert os.path.getsize(fname) > 0
+
+
+def test_bench_profile_from_xml(bench, large_profile, tmp_path, monkeypatch):
+    fname = os.path.join(tmp_path, "profile.xml")
+    large_profile.to_xml(fname)
+    # restored after the test, from_xml reads the modes of the current profile
+    monkeypatch.setattr(gremlin.shared_state, "current_profile", None)
+
+    def load():
+        profile = gremlin.base_profile.Profile()
+        gremlin.shared_state.current_profile = profile
+        profile.from_xml(fname)
+        return profile
+
+    profile = bench(load)
+    assert _input_count(profile) == _input_count(large_profile)
+
+
+@pytest.mark.parametrize("actions", [1, 4])
+def test_bench_basic_container_execution(bench, profile_factory, actions):
+    profile = profile_factory(device_count=1, button_count=1, axis_count=0, actions=actions)
+    device = next(
+        device for device in profile.devices.values()
+        if device.type == DeviceType.Joystick
+    )
+    item = device.modes["Default"].get_data(InputType.JoystickButton, 1)
+    callback = gremlin.execution_graph.ContainerCallback(item.containers[0])
+
+    press = Event(InputType.JoystickButton, 1, device.device_guid, is_pressed=True)
+    release = Event(InputType.JoystickButton, 1, device.device_guid, is_pressed=False)
+
+    def press_release():
+        callback(press)
+        callback(release)
+
+    bench(press_release)
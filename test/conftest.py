@@ -1,17 +1,39 @@
+import os
 import sys
 sys.path.append(".")
 
 import pytest
 
 import dinput
+import dinput.fake
 
+import gremlin.clock
 import gremlin.event_handler
 import gremlin.joystick_handling
 
 
+def use_fake_input():
+    """Returns True if tests run against the fake DILL backend."""
+    return sys.platform != "win32" or "GREMLIN_FAKE_DILL" in os.environ
+
+
+# The backend has to be in place before test collection imports the modules
+# starting the event listener, which initializes DILL on first use
+if use_fake_input():
+    dinput.DILL.set_backend(dinput.fake.FakeDILL([
+        dinput.fake.FakeDevice("Fake Stick", axis_count=4, button_count=16, hat_count=1),
+        dinput.fake.FakeDevice("Fake Throttle", axis_count=8, button_count=32, hat_count=0)
+    ]))
+
+# the profile modules import each other circularly and only load when
+# base_profile is imported first, as the application does
+import gremlin.base_profile
+
+
 @pytest.fixture(scope="session", autouse=True)
 def joystick_init():
-    dinput.DILL.init()
+    if not use_fake_input():
+        dinput.DILL.init()
     gremlin.joystick_handling.joystick_devices_initialization()
 
 
@@ -19,4 +41,13 @@ def joystick_init():
 def terminate_event_listener(request):
     request.addfinalizer(
         lambda: gremlin.event_handler.EventListener().terminate()
-    )
\ No newline at end of file
+    )
+
+
+@pytest.fixture
+def virtual_clock():
+    """Replaces the clock with a VirtualClock for the duration of a test."""
+    clock = gremlin.clock.VirtualClock()
+    previous = gremlin.clock.set_clock(clock)
+    yield clock
+    gremlin.clock.set_clock(previous)
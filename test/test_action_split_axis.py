@@ -0,0 +1,86 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import sys
+sys.path.append(".")
+
+import random
+
+import pytest
+
+import action_plugins.split_axis as split_axis
+
+
+def _center_points():
+    rng = random.Random(42)
+    return [-0.999, -0.5, 0.0, 0.25, 0.999] + \
+        [rng.uniform(-0.99, 0.99) for _ in range(20)]
+
+
+def _original_split(value, center_point):
+    """Reference implementation computing the slopes on every event."""
+    if value < center_point:
+        value_range = -1.0 - center_point
+        return ((value - center_point) / value_range) * 2.0 - 1.0, -1.0
+    value_range = max(1.0 - center_point, 0.001)
+    return -1.0, ((value - center_point) / value_range) * 2.0 - 1.0
+
+
+@pytest.mark.parametrize("center_point", _center_points())
+def test_continuity_at_split_point(center_point):
+    split = split_axis.split_transform(center_point)
+    epsilon = 1e-9
+
+    # both outputs rest at -1 on either side of the split point
+    low, high = split(center_point - epsilon)
+    assert low == pytest.approx(-1.0, abs=1e-5)
+    assert high == -1.0
+    low, high = split(center_point)
+    assert low == -1.0
+    assert high == pytest.approx(-1.0)
+    low, high = split(center_point + epsilon)
+    assert low == -1.0
+    assert high == pytest.approx(-1.0, abs=1e-5)
+
+
+@pytest.mark.parametrize("center_point", _center_points())
+def test_endpoints_and_range(center_point):
+    split = split_axis.split_transform(center_point)
+    assert split(-1.0)[0] == pytest.approx(1.0)
+    assert split(1.0)[1] == pytest.approx(1.0)
+
+    previous = None
+    for i in range(201):
+        value = -1.0 + i * 0.01
+        low, high = split(value)
+        assert -1.0 - 1e-9 <= low <= 1.0 + 1e-9
+        assert -1.0 - 1e-9 <= high <= 1.0 + 1e-9
+        # the low output falls and the high output rises with the input
+        if previous is not None:
+            assert low <= previous[0] + 1e-9
+            assert high >= previous[1] - 1e-9
+        previous = (low, high)
+
+
+@pytest.mark.parametrize("center_point", _center_points())
+def test_matches_original(center_point):
+    split = split_axis.split_transform(center_point)
+    rng = random.Random(7)
+    for _ in range(200):
+        value = rng.uniform(-1.0, 1.0)
+        expected = _original_split(value, center_point)
+        assert split(value) == pytest.approx(expected)
@@ -0,0 +1,118 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import sys
+sys.path.append(".")
+
+import pytest
+
+import gremlin.axis_batch as axis_batch
+import gremlin.input_devices
+import gremlin.spline
+import gremlin.util
+
+
+control_points = [
+    (-1.0, -1.0), (-0.6, -0.3), (-0.2, -0.05), (0.0, 0.0),
+    (0.2, 0.05), (0.6, 0.3), (1.0, 1.0)
+]
+bezier_points = [
+    (-1.0, -1.0), (-0.8, -0.9), (-0.3, -0.1),
+    (0.0, 0.0),
+    (0.3, 0.1), (0.8, 0.9), (1.0, 1.0)
+]
+
+# values covering every segment, the knots, and values out of range
+sweep = [i / 100.0 - 1.2 for i in range(241)] + [pt[0] for pt in control_points]
+raw_sweep = list(range(-33000, 33000, 250)) + [-32768, 0, 32767]
+
+
+@pytest.fixture(params=["list", "numpy"])
+def as_batch(request):
+    """Converts samples into the batch representation under test."""
+    if request.param == "list":
+        return list
+    numpy = pytest.importorskip("numpy")
+    return lambda values: numpy.array(values)
+
+
+def _assert_matches(batch, expected):
+    assert len(batch) == len(expected)
+    assert list(batch) == pytest.approx(expected, abs=1e-12)
+
+
+@pytest.mark.parametrize("limits", [
+    (-32768, 0, 32767),
+    (-30000, 1200, 31000),
+    (-32768, -32768, 32767),
+    (0, 65535, 65535),
+])
+def test_calibrate(as_batch, limits):
+    calibration = gremlin.util.create_calibration_function(*limits)
+    _assert_matches(
+        axis_batch.calibrate(as_batch(raw_sweep), *limits),
+        [calibration(value) for value in raw_sweep]
+    )
+
+
+@pytest.mark.parametrize("limits", [
+    (-1.0, 0.0, 0.0, 1.0),
+    (-0.9, -0.1, 0.05, 0.95),
+])
+def test_deadzone(as_batch, limits):
+    _assert_matches(
+        axis_batch.deadzone(as_batch(sweep), *limits),
+        [gremlin.input_devices.deadzone(value, *limits) for value in sweep]
+    )
+
+
+@pytest.mark.parametrize("invert", [False, True])
+def test_scale_to_range(as_batch, invert):
+    _assert_matches(
+        axis_batch.scale_to_range(as_batch(sweep), -1.0, 1.0, 0.0, 1.0, invert),
+        [gremlin.util.scale_to_range(value, -1.0, 1.0, 0.0, 1.0, invert)
+         for value in sweep]
+    )
+
+
+@pytest.mark.parametrize("spline_type, points", [
+    (gremlin.spline.CubicSpline, control_points),
+    (gremlin.spline.CubicSpline, [(-1.0, 1.0), (1.0, -1.0)]),
+    (gremlin.spline.CubicBezierSpline, bezier_points),
+    (gremlin.spline.CubicBezierSpline, [(-1.0, -1.0), (-0.3, 0.5), (0.3, -0.5), (1.0, 1.0)]),
+])
+def test_curve(as_batch, spline_type, points):
+    spline = spline_type(points)
+    _assert_matches(
+        axis_batch.curve(spline, as_batch(sweep)),
+        [spline(value) for value in sweep]
+    )
+
+
+def test_curve_plain_function(as_batch):
+    _assert_matches(
+        axis_batch.curve(lambda x: x * x, as_batch(sweep)),
+        [value * value for value in sweep]
+    )
+
+
+def test_batch_representation():
+    samples = axis_batch.as_samples(raw_sweep)
+    assert axis_batch.is_vectorized(samples) == (axis_batch.numpy is not None)
+    assert axis_batch.is_vectorized(axis_batch.calibrate(samples, -32768, 0, 32767)) == \
+        axis_batch.is_vectorized(samples)
+    assert isinstance(axis_batch.calibrate(raw_sweep, -32768, 0, 32767), list)
@@ -0,0 +1,150 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import sys
+sys.path.append(".")
+
+import random
+
+import pytest
+
+import dinput
+import gremlin.actions
+import gremlin.axis_button
+import gremlin.base_buttons
+import gremlin.event_handler
+import gremlin.execution_graph
+from gremlin.input_types import InputType
+from gremlin.types import AxisButtonDirection
+
+
+def test_press_and_release():
+    converter = gremlin.axis_button.AxisButtonConverter(0.5, 0.2)
+    assert (converter.lower_limit, converter.upper_limit) == (0.2, 0.5)
+    assert converter.update(0.0) is None
+    assert converter.update(0.2) is True
+    assert converter.update(0.5) is None
+    assert converter.update(0.51) is False
+    assert converter.update(0.6) is None
+
+
+def test_hysteresis_suppresses_chatter():
+    rnd = random.Random(11)
+    plain = gremlin.axis_button.AxisButtonConverter(0.5, 1.0)
+    damped = gremlin.axis_button.AxisButtonConverter(0.5, 1.0, hysteresis=0.05)
+    # noisy axis resting on the lower boundary
+    samples = [0.5 + rnd.uniform(-0.02, 0.02) for _ in range(1000)]
+    plain_changes = [plain.update(value) for value in samples]
+    damped_changes = [damped.update(value) for value in samples]
+    assert sum(change is not None for change in plain_changes) > 100
+    assert [change for change in damped_changes if change is not None] == [True]
+
+    # leaving the widened range releases the button
+    assert damped.update(0.46) is None
+    assert damped.update(0.44) is False
+    assert damped.update(0.48) is None
+    assert damped.update(0.5) is True
+
+
+def test_matches_range_check_without_hysteresis():
+    rnd = random.Random(5)
+    converter = gremlin.axis_button.AxisButtonConverter(-0.3, 0.4)
+    for _ in range(2000):
+        value = rnd.choice([-0.3, 0.4, rnd.uniform(-1.0, 1.0)])
+        changes = converter.changes(value)
+        was_pressed = converter.pressed
+        converter.update(value)
+        assert converter.pressed == (-0.3 <= value <= 0.4)
+        assert changes == (converter.pressed != was_pressed)
+
+
+def test_jumped():
+    converter = gremlin.axis_button.AxisButtonConverter(-0.1, 0.1)
+    assert converter.jumped(-0.5, 0.5)
+    assert converter.jumped(0.5, -0.5)
+    assert not converter.jumped(-0.5, 0.0)
+    assert not converter.jumped(0.2, 0.5)
+
+
+def _axis_event(value):
+    return gremlin.event_handler.Event(
+        InputType.JoystickAxis, 1, dinput.GUID_Virtual, value=value
+    )
+
+
+def test_axis_button_direction():
+    below = gremlin.actions.AxisButton(0.2, 0.5, AxisButtonDirection.Below)
+    above = gremlin.actions.AxisButton(0.2, 0.5, AxisButtonDirection.Above)
+    for button in (below, above):
+        assert button.process_event(_axis_event(0.0)) is False
+
+    # only entering the range in the configured direction presses
+    assert below.process_event(_axis_event(0.3)) is True
+    assert below.is_pressed
+    assert above.process_event(_axis_event(0.3)) is False
+    assert not above.is_pressed
+
+    # releasing works in any direction
+    assert below.process_event(_axis_event(0.0)) is True
+    assert not below.is_pressed
+    assert above.process_event(_axis_event(0.8)) is False
+    assert above.process_event(_axis_event(0.4)) is True
+    assert above.is_pressed
+    assert above.process_event(_axis_event(0.9)) is True
+    assert not above.is_pressed
+
+
+@pytest.mark.parametrize("hysteresis", [0.0, 0.1])
+def test_axis_button_forced_activation(hysteresis):
+    button = gremlin.actions.AxisButton(
+        -0.1, 0.1, AxisButtonDirection.Anywhere, hysteresis
+    )
+    assert button.process_event(_axis_event(-0.5)) is False
+    assert not button.forced_activation
+
+    # jumping over the range presses the button, processing the same value
+    # again releases it even if it lies within the hysteresis
+    assert button.process_event(_axis_event(0.15)) is True
+    assert button.forced_activation
+    assert button.is_pressed
+    assert button.process_event(_axis_event(0.15)) is True
+    assert not button.forced_activation
+    assert not button.is_pressed
+
+
+def test_virtual_button_process_releases_forced_activation(virtual_clock):
+    virtual_clock.auto_advance = True
+    data = gremlin.base_buttons.VirtualAxisButton(-0.1, 0.1)
+    data.hysteresis = 0.1
+    process = gremlin.execution_graph.VirtualButtonProcess(data)
+    button = process.virtual_button
+
+    pressed = []
+    listener = gremlin.actions.VirtualButton.event_listener
+    record = lambda event: pressed.append(event.is_pressed) \
+        if event.identifier == button.identifier else None
+    listener.virtual_event.connect(record)
+    try:
+        process(_axis_event(-0.5))
+        start = virtual_clock.now()
+        process(_axis_event(0.15))
+    finally:
+        listener.virtual_event.disconnect(record)
+
+    assert pressed == [True, False]
+    assert not button.is_pressed
+    assert virtual_clock.now() - start == pytest.approx(0.05)
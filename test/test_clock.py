@@ -0,0 +1,157 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import sys
+sys.path.append(".")
+
+import logging
+import threading
+import time
+
+import pytest
+
+import gremlin.clock
+
+
+def test_call_later_order(virtual_clock):
+    calls = []
+    start = gremlin.clock.now()
+    gremlin.clock.call_later(0.3, calls.append, "c")
+    gremlin.clock.call_later(0.1, calls.append, "a")
+    gremlin.clock.call_later(0.2, calls.append, "b")
+    handle = gremlin.clock.call_later(0.15, calls.append, "cancelled")
+    assert virtual_clock.pending == 4
+
+    handle.cancel()
+    virtual_clock.advance(0.25)
+    assert calls == ["a", "b"]
+    assert gremlin.clock.now() == pytest.approx(start + 0.25)
+    assert not handle.active
+
+    virtual_clock.run_until_idle()
+    assert calls == ["a", "b", "c"]
+    assert virtual_clock.pending == 0
+
+
+def test_callback_sees_deadline(virtual_clock):
+    seen = []
+    start = gremlin.clock.now()
+    gremlin.clock.call_later(0.5, lambda: seen.append(gremlin.clock.now()))
+    virtual_clock.advance(2.0)
+    assert seen == [pytest.approx(start + 0.5)]
+
+
+def test_nested_call_later(virtual_clock):
+    calls = []
+
+    def tick():
+        calls.append(gremlin.clock.now())
+        if len(calls) < 5:
+            gremlin.clock.call_later(0.1, tick)
+
+    gremlin.clock.call_later(0.1, tick)
+    virtual_clock.advance(1.0)
+    assert len(calls) == 5
+
+
+def test_sleep(virtual_clock):
+    done = threading.Event()
+
+    def sleeper():
+        gremlin.clock.sleep(1.0)
+        done.set()
+
+    thread = threading.Thread(target=sleeper)
+    thread.start()
+    virtual_clock.advance(0.5)
+    assert not done.wait(0.05)
+    virtual_clock.advance(0.5)
+    assert done.wait(1.0)
+    thread.join()
+
+    virtual_clock.auto_advance = True
+    start = gremlin.clock.now()
+    gremlin.clock.sleep(3.0)
+    assert gremlin.clock.now() == pytest.approx(start + 3.0)
+
+
+def test_real_clock():
+    clock = gremlin.clock.RealClock()
+    done = threading.Event()
+    handle = clock.call_later(0.01, done.set)
+    assert done.wait(1.0)
+    assert not handle.active
+
+
+def test_timer_service():
+    clock = gremlin.clock.RealClock()
+    service = gremlin.clock.TimerService()
+    service.stop()
+    service.reset_statistics()
+
+    calls = []
+    threads = set()
+    nested = threading.Event()
+    done = threading.Event()
+
+    def record(name):
+        calls.append(name)
+        threads.add(threading.current_thread())
+
+    clock.call_later(0.03, record, "b")
+    clock.call_later(0.01, record, "a")
+    clock.call_later(0.02, clock.call_later, 0.0, nested.set)
+    clock.call_later(0.015, record, "cancelled").cancel()
+    clock.call_later(0.04, record, "c")
+    clock.call_later(0.05, done.set)
+    assert done.wait(1.0)
+    assert nested.is_set()
+
+    assert calls == ["a", "b", "c"]
+    # all delayed calls run on the single service thread
+    assert len(threads) == 1
+
+    report = service.report()
+    assert report["scheduled"] == 7
+    assert report["fired"] == 6
+    assert report["cancelled"] == 1
+    assert report["pending"] == 0
+    assert report["jitter_ms"]["count"] == 6
+    service.stop()
+
+
+def test_timer_service_reports_slow_calls(caplog):
+    clock = gremlin.clock.RealClock()
+    service = gremlin.clock.TimerService()
+    service.stop()
+    service.reset_statistics()
+    done = threading.Event()
+
+    def blocking():
+        time.sleep(service.slow_threshold * 2)
+
+    clock.call_later(0.0, blocking)
+    clock.call_later(0.0, blocking)
+    clock.call_later(0.01, done.set)
+    with caplog.at_level(logging.WARNING, logger="system"):
+        assert done.wait(1.0)
+    service.stop()
+
+    assert service.report()["slow"] == 2
+    # every slow callback is only logged once
+    warnings = [record for record in caplog.records if "blocking" in record.getMessage()]
+    assert len(warnings) == 1
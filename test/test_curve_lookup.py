@@ -0,0 +1,86 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import sys
+sys.path.append(".")
+
+import random
+
+import pytest
+
+import gremlin.input_devices
+import gremlin.spline
+
+
+control_points = [
+    (-1.0, -1.0), (-0.6, -0.3), (-0.2, -0.05), (0.0, 0.0),
+    (0.2, 0.05), (0.6, 0.3), (1.0, 1.0)
+]
+# curve with diagonal symmetry
+symmetric_points = [
+    (-1.0, -1.0), (-0.5, -0.8), (0.0, 0.0), (0.5, 0.8), (1.0, 1.0)
+]
+bezier_points = [
+    (-1.0, -1.0), (-0.8, -0.9), (-0.3, -0.1),
+    (0.0, 0.0),
+    (0.3, 0.1), (0.8, 0.9), (1.0, 1.0)
+]
+deadzones = [
+    [-1.0, 0.0, 0.0, 1.0],
+    [-0.95, -0.05, 0.05, 0.95],
+    [-0.8, -0.3, 0.0, 1.0],
+]
+
+
+def _inputs():
+    rng = random.Random(1)
+    return [i / 5000.0 - 1.1 for i in range(11001)] + \
+        [rng.uniform(-1.0, 1.0) for _ in range(5000)]
+
+
+@pytest.mark.parametrize("deadzone", deadzones)
+@pytest.mark.parametrize("spline_type, points", [
+    (gremlin.spline.CubicSpline, control_points),
+    (gremlin.spline.CubicSpline, symmetric_points),
+    (gremlin.spline.CubicBezierSpline, bezier_points),
+])
+def test_deadzone_lookup_matches_curve(spline_type, points, deadzone):
+    spline = spline_type(points)
+    lookup = gremlin.spline.DeadzoneLookupTable(spline, deadzone)
+
+    for value in _inputs():
+        expected = spline(gremlin.input_devices.deadzone(value, *deadzone))
+        assert lookup(value) == pytest.approx(expected, abs=1e-5)
+
+    # the corners of the deadzone are reproduced exactly
+    for value in deadzone:
+        expected = spline(gremlin.input_devices.deadzone(value, *deadzone))
+        assert lookup(value) == pytest.approx(expected, abs=1e-12)
+
+
+def test_lookup_table():
+    table = gremlin.spline.LookupTable.from_function(lambda x: 3.0 * x, 8, 0.0, 2.0)
+    assert table.size == 8
+    assert list(table.values) == [3.0 * i / 4.0 for i in range(9)]
+
+    # linear functions are reproduced exactly
+    for value in [0.0, 0.1, 0.25, 1.3, 2.0]:
+        assert table(value) == pytest.approx(3.0 * value)
+
+    # values outside of the range are clamped to the ends
+    assert table(-1.0) == 0.0
+    assert table(5.0) == 6.0
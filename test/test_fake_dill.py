@@ -0,0 +1,91 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import sys
+sys.path.append(".")
+
+import uuid
+
+import dinput
+import dinput.fake
+
+
+def test_device_information():
+    device = dinput.fake.FakeDevice(
+        "Stick",
+        axis_count=3,
+        button_count=12,
+        hat_count=2,
+        device_guid=uuid.UUID("b4ca5720-11d0-11e9-8002-444553540000")
+    )
+    backend = dinput.fake.FakeDILL([device])
+
+    assert backend.get_device_count() == 1
+    info = dinput.DeviceSummary(backend.get_device_information_by_index(0))
+    assert info.name == "Stick"
+    assert info.device_id == "{B4CA5720-11D0-11E9-8002-444553540000}"
+    assert info.axis_count == 3
+    assert info.button_count == 12
+    assert info.hat_count == 2
+    assert [entry.axis_index for entry in info.axis_map[:3]] == [1, 2, 3]
+    assert not info.is_virtual
+    assert backend.device_exists(device.device_guid.ctypes)
+
+
+def test_input_callbacks():
+    device = dinput.fake.FakeDevice("Stick", axis_count=2, button_count=4)
+    backend = dinput.fake.FakeDILL([device])
+
+    events = []
+    callback = dinput.C_EVENT_CALLBACK(
+        lambda data: events.append(
+            (dinput.GUID(data.device_guid), data.input_type, data.input_index, data.value)
+        )
+    )
+    backend.set_input_event_callback(callback)
+
+    guid = device.device_guid
+    backend.set_axis(guid, 2, 40000)
+    backend.set_button(guid, 3, True)
+    backend.set_hat(guid, 1, 9000)
+
+    assert events == [
+        (guid, 1, 2, 32767),
+        (guid, 2, 3, 1),
+        (guid, 3, 1, 9000)
+    ]
+    assert backend.get_axis(guid.ctypes, 2) == 32767
+    assert backend.get_button(guid.ctypes, 3)
+    assert backend.get_hat(guid.ctypes, 1) == 9000
+
+
+def test_device_change_callback():
+    backend = dinput.fake.FakeDILL()
+    changes = []
+    callback = dinput.C_DEVICE_CHANGE_CALLBACK(
+        lambda data, action: changes.append((data.name, action))
+    )
+    backend.set_device_change_callback(callback)
+
+    device = backend.add_device(dinput.fake.FakeDevice("Throttle"))
+    backend.remove_device(device.device_guid)
+
+    assert changes == [
+        (b"Throttle", dinput.DeviceActionType.Connected.value),
+        (b"Throttle", dinput.DeviceActionType.Disconnected.value)
+    ]
+    assert backend.get_device_count() == 0
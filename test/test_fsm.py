@@ -0,0 +1,129 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import sys
+sys.path.append(".")
+
+import random
+
+import pytest
+
+import gremlin.error
+import gremlin.fsm
+from gremlin.fsm import Transition
+
+
+def _button_transitions(log):
+    def record(name, result):
+        def callback():
+            log.append(name)
+            return result
+        return callback
+    return {
+        ("up", "press"): Transition(record("press", True), "down"),
+        ("up", "release"): Transition(record("noop", False), "up"),
+        ("down", "release"): Transition(record("release", True), "up"),
+        ("down", "press"): Transition(record("noop", False), "down"),
+    }
+
+
+@pytest.mark.parametrize("debug", [False, True])
+def test_compiled_matches_reference(debug):
+    reference_log = []
+    compiled_log = []
+    reference = gremlin.fsm.FiniteStateMachine(
+        "up", ["up", "down"], ["press", "release"], _button_transitions(reference_log)
+    )
+    compiled = gremlin.fsm.CompiledStateMachine(
+        "up", ["up", "down"], ["press", "release"], _button_transitions(compiled_log), debug
+    )
+    rnd = random.Random(3)
+    for _ in range(500):
+        action = rnd.choice(["press", "release"])
+        if rnd.random() < 0.5:
+            result = compiled.perform(action)
+        else:
+            result = compiled.perform_id(compiled.action_id(action))
+        assert result == reference.perform(action)
+        assert compiled.current_state == reference.current_state
+    assert compiled_log == reference_log
+
+
+def test_batch():
+    log = []
+    fsm = gremlin.fsm.CompiledStateMachine(
+        "up", ["up", "down"], ["press", "release"], _button_transitions(log)
+    )
+    press = fsm.action_id("press")
+    release = fsm.action_id("release")
+    results = fsm.perform_batch([press, press, release, release, press])
+    assert results == [True, False, True, False, True]
+    assert log == ["press", "noop", "release", "noop", "press"]
+    assert fsm.current_state == "down"
+    assert fsm.state == fsm.state_id("down")
+    fsm.reset()
+    assert fsm.current_state == "up"
+
+
+def test_validation():
+    transitions = _button_transitions([])
+    del transitions[("down", "press")]
+    with pytest.raises(gremlin.error.GremlinError):
+        gremlin.fsm.CompiledStateMachine("up", ["up", "down"], ["press", "release"], transitions)
+    with pytest.raises(gremlin.error.GremlinError):
+        gremlin.fsm.CompiledStateMachine("left", ["up", "down"], ["press", "release"], _button_transitions([]))
+
+    fsm = gremlin.fsm.CompiledStateMachine(
+        "up", ["up", "down"], ["press", "release"], _button_transitions([]), debug=True
+    )
+    with pytest.raises(gremlin.error.GremlinError):
+        fsm.perform_id(2)
+
+
+@pytest.mark.parametrize("debug", [False, True])
+def test_timed_deadline(virtual_clock, debug):
+    log = []
+    transitions = _button_transitions(log)
+    timed_transitions = dict(transitions)
+    timed_transitions[("up", "timeout")] = Transition(lambda: log.append("timeout"), "up")
+    timed_transitions[("down", "timeout")] = Transition(lambda: log.append("timeout"), "up")
+    fsm = gremlin.fsm.TimedFiniteStateMachine(
+        "up", ["up", "down"], ["press", "release"], timed_transitions, debug
+    )
+    fsm.perform("press")
+    fsm.set_deadline(0.5)
+    virtual_clock.advance(0.4)
+    # replacing the deadline discards the pending one
+    fsm.set_deadline(0.5)
+    virtual_clock.advance(0.4)
+    assert fsm.current_state == "down"
+    virtual_clock.advance(0.2)
+    assert fsm.current_state == "up"
+    assert not fsm.deadline_pending
+
+    fsm.perform_id(fsm.action_id("press"))
+    fsm.set_deadline(0.5)
+    fsm.reset()
+    virtual_clock.advance(1.0)
+    assert fsm.current_state == "up"
+    assert log == ["press", "timeout", "press"]
+
+    # the timeout transitions are part of the compiled table
+    with pytest.raises(gremlin.error.GremlinError):
+        gremlin.fsm.TimedFiniteStateMachine(
+            "up", ["up", "down"], ["press", "release"], transitions
+        )
@@ -0,0 +1,92 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import sys
+sys.path.append(".")
+
+import random
+
+from gremlin.gated_handler import GateCondition, _TriggerIndex
+
+
+class FakeRange:
+
+    def __init__(self, v1, v2, outside=False):
+        self.v1 = v1
+        self.v2 = v2
+        self.outside = outside
+
+    def inrange(self, value):
+        return self.v1 - 0.0001 <= value <= self.v2 + 0.0001
+
+    def hasContainers(self, condition):
+        return self.outside and condition == GateCondition.OutsideRange
+
+
+class FakeGate:
+
+    def __init__(self, value):
+        self.value = value
+
+
+def _linear_range(ranges, value):
+    for rng in ranges:
+        if rng.inrange(value):
+            return rng
+    return None
+
+
+def test_find_range_matches_linear_scan():
+    rnd = random.Random(42)
+    values = sorted(rnd.uniform(-1.0, 1.0) for _ in range(19))
+    bounds = [-1.0] + values + [1.0]
+    ranges = [FakeRange(v1, v2) for v1, v2 in zip(bounds, bounds[1:])]
+    # overlapping ranges and unsorted input, the first listed range wins
+    ranges.append(FakeRange(-0.5, 0.5))
+    ranges.insert(0, FakeRange(0.2, 0.3))
+    rnd.shuffle(ranges)
+    index = _TriggerIndex(ranges, [])
+    samples = [rnd.uniform(-1.1, 1.1) for _ in range(2000)] + bounds
+    for value in samples:
+        assert index.find_range(value) is _linear_range(ranges, value), value
+
+
+def test_find_range_gaps():
+    ranges = [FakeRange(-1.0, -0.5), FakeRange(0.5, 1.0)]
+    index = _TriggerIndex(ranges, [])
+    assert index.find_range(0.0) is None
+    assert index.find_range(-0.5) is ranges[0]
+    assert index.find_range(0.49995) is ranges[1]
+    assert index.find_range(1.5) is None
+
+
+def test_crossed_gates_order():
+    gates = [FakeGate(v) for v in [0.5, -0.5, 0.0, None]]
+    index = _TriggerIndex([], gates)
+    values = lambda result: [gate.value for gate in result]
+    assert values(index.crossed_gates(-1.0, 1.0)) == [-0.5, 0.0, 0.5]
+    # a fast sweep down reports the gates in the order they were crossed
+    assert values(index.crossed_gates(1.0, -1.0)) == [0.5, 0.0, -0.5]
+    assert values(index.crossed_gates(-0.5, 0.2)) == [-0.5, 0.0]
+    assert values(index.crossed_gates(0.1, 0.2)) == []
+    assert values(index.crossed_gates(None, 0.2)) == []
+
+
+def test_outside_ranges():
+    ranges = [FakeRange(-1.0, 0.0, outside=True), FakeRange(0.0, 1.0)]
+    index = _TriggerIndex(ranges, [])
+    assert index.outside_ranges == [ranges[0]]
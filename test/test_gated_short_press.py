@@ -0,0 +1,121 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import sys
+sys.path.append(".")
+
+import uuid
+
+import pytest
+
+import dinput.fake
+import gremlin.actions
+import gremlin.gated_handler
+from gremlin.event_handler import Event
+from gremlin.input_types import InputType
+
+
+device_guid = dinput.fake.guid_from_uuid(uuid.uuid4())
+
+
+class RecordingFunctor:
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.calls = []
+
+    def process_event(self, event, value):
+        self.calls.append((self.clock.now(), value.current))
+        return True
+
+
+@pytest.fixture
+def scheduler(virtual_clock):
+    scheduler = gremlin.gated_handler.ShortPressScheduler()
+    max_pending = scheduler.max_pending
+    scheduler.flush()
+    yield scheduler
+    scheduler.flush()
+    scheduler.max_pending = max_pending
+
+
+def _press(scheduler, functor, delay=250):
+    event = Event(InputType.JoystickButton, 1, device_guid)
+    value = gremlin.actions.Value(0.5)
+    scheduler.press(functor, event, value, delay)
+    # the triggering value is left untouched
+    assert value.current == 0.5
+
+
+def test_press_release(scheduler, virtual_clock):
+    functor = RecordingFunctor(virtual_clock)
+    start = virtual_clock.now()
+    _press(scheduler, functor)
+    assert functor.calls == [(start, True)]
+    assert scheduler.pending == 1
+
+    virtual_clock.advance(0.2)
+    assert len(functor.calls) == 1
+    virtual_clock.advance(0.1)
+    assert functor.calls == [(start, True), (pytest.approx(start + 0.25), False)]
+    assert scheduler.pending == 0
+
+
+def test_repeated_press_extends_release(scheduler, virtual_clock):
+    functor = RecordingFunctor(virtual_clock)
+    start = virtual_clock.now()
+    _press(scheduler, functor)
+    virtual_clock.advance(0.2)
+    _press(scheduler, functor)
+    virtual_clock.advance(0.2)
+    _press(scheduler, functor)
+    virtual_clock.run_until_idle()
+
+    # a single press and release, released one delay after the last press
+    assert functor.calls == [(start, True), (pytest.approx(start + 0.65), False)]
+
+
+def test_presses_alternate_per_functor(scheduler, virtual_clock):
+    functors = [RecordingFunctor(virtual_clock) for _ in range(3)]
+    for step in range(20):
+        _press(scheduler, functors[step % 3], delay=100)
+        virtual_clock.advance(0.04)
+    virtual_clock.run_until_idle()
+
+    for functor in functors:
+        states = [state for _, state in functor.calls]
+        assert states == [True, False] * (len(states) // 2)
+        assert len(states) > 0
+
+
+def test_pending_cap(scheduler, virtual_clock):
+    scheduler.max_pending = 4
+    functors = [RecordingFunctor(virtual_clock) for _ in range(6)]
+    for functor in functors:
+        _press(scheduler, functor)
+    assert scheduler.pending == 4
+
+    # the two oldest presses were released early to make room
+    assert [state for _, state in functors[0].calls] == [True, False]
+    assert [state for _, state in functors[1].calls] == [True, False]
+    assert [state for _, state in functors[5].calls] == [True]
+
+    scheduler.flush()
+    assert scheduler.pending == 0
+    assert all(functor.calls[-1][1] is False for functor in functors)
+    virtual_clock.run_until_idle()
+    assert all(len(functor.calls) == 2 for functor in functors)
@@ -0,0 +1,299 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import sys
+sys.path.append(".")
+
+import itertools
+
+import pytest
+
+import gremlin.error
+import gremlin.gesture
+
+
+class FakeEvent:
+
+    def __init__(self, index):
+        self.index = index
+
+    def clone(self):
+        return FakeEvent(self.index)
+
+
+class FakeValue:
+
+    def __init__(self, current):
+        self.current = current
+
+
+class Recorder:
+
+    """Records the outputs of a timing machine."""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.calls = []
+
+    def output(self, name):
+        def callback(event, value):
+            self.calls.append((name, self.clock.now(), value.current, event.index))
+        return callback
+
+    def states(self, name):
+        return [current for output, _, current, _ in self.calls if output == name]
+
+    def times(self, name):
+        return [time for output, time, _, _ in self.calls if output == name]
+
+
+def _tempo(clock, activate_on, delay=0.5):
+    recorder = Recorder(clock)
+    machine = gremlin.gesture.Gesture(
+        gremlin.gesture.tempo_spec(activate_on),
+        {"delay": delay},
+        {"short": recorder.output("short"), "long": recorder.output("long")}
+    )
+    return machine, recorder
+
+
+def _double_tap(clock, activate_on, delay=0.5):
+    recorder = Recorder(clock)
+    machine = gremlin.gesture.Gesture(
+        gremlin.gesture.double_tap_spec(activate_on),
+        {"delay": delay},
+        {"single": recorder.output("single"), "double": recorder.output("double")}
+    )
+    return machine, recorder
+
+
+def _gesture(clock, spec, params, delay=0.5):
+    recorder = Recorder(clock)
+    params = dict(params, delay=delay)
+    outputs = {name: recorder.output(name) for name in spec.outputs}
+    return gremlin.gesture.Gesture(spec, params, outputs), recorder
+
+
+def _triple_tap(clock, activate_on, delay=0.5):
+    return _gesture(clock, gremlin.gesture.multi_tap_spec(3), {}, delay)
+
+
+def _smart_toggle(clock, activate_on, delay=0.5):
+    return _gesture(clock, gremlin.gesture.smart_toggle_spec(), {}, delay)
+
+
+def _run(machine, clock, gaps):
+    """Alternates press and release separated by the given gaps."""
+    for index, gap in enumerate(gaps):
+        machine.process(FakeEvent(index), FakeValue(index % 2 == 0))
+        clock.advance(gap)
+    if len(gaps) % 2 == 1:
+        machine.process(FakeEvent(len(gaps)), FakeValue(False))
+    clock.run_until_idle()
+
+
+def test_tempo_release_short(virtual_clock):
+    machine, recorder = _tempo(virtual_clock, "release")
+    start = virtual_clock.now()
+    _run(machine, virtual_clock, [0.2])
+    assert recorder.states("short") == [True, False]
+    assert recorder.states("long") == []
+    # the press is sent on release and released after the pulse duration
+    assert recorder.times("short") == pytest.approx([start + 0.2, start + 0.25])
+    assert machine.state == "idle"
+
+
+def test_tempo_release_long(virtual_clock):
+    machine, recorder = _tempo(virtual_clock, "release")
+    start = virtual_clock.now()
+    _run(machine, virtual_clock, [0.8])
+    assert recorder.states("short") == []
+    assert recorder.states("long") == [True, False]
+    assert recorder.times("long") == pytest.approx([start + 0.5, start + 0.8])
+
+
+def test_tempo_press(virtual_clock):
+    machine, recorder = _tempo(virtual_clock, "press")
+    start = virtual_clock.now()
+    _run(machine, virtual_clock, [0.2, 0.3, 0.8])
+    assert recorder.states("short") == [True, False, True, False]
+    assert recorder.states("long") == [True, False]
+    assert recorder.times("short") == pytest.approx(
+        [start, start + 0.2, start + 0.5, start + 1.3]
+    )
+    assert recorder.times("long") == pytest.approx([start + 1.0, start + 1.3])
+
+
+def test_tempo_release_at_deadline(virtual_clock):
+    # releasing right before the delay cancels the long press for good
+    machine, recorder = _tempo(virtual_clock, "release")
+    _run(machine, virtual_clock, [0.4999])
+    virtual_clock.advance(1.0)
+    assert recorder.states("long") == []
+    assert recorder.states("short") == [True, False]
+
+
+def test_tempo_fast_taps(virtual_clock):
+    # taps faster than the pulse duration complete the previous short press
+    machine, recorder = _tempo(virtual_clock, "release")
+    _run(machine, virtual_clock, [0.01] * 10)
+    assert recorder.states("short") == [True, False] * 5
+    # every press is sent with the event of the press that started it
+    assert [index for _, _, _, index in recorder.calls][::2] == [0, 2, 4, 6, 8]
+
+
+def test_double_tap_exclusive_single(virtual_clock):
+    machine, recorder = _double_tap(virtual_clock, "exclusive")
+    start = virtual_clock.now()
+    _run(machine, virtual_clock, [0.1])
+    assert recorder.states("double") == []
+    assert recorder.states("single") == [True, False]
+    # the single tap is only sent once no second tap can follow anymore
+    assert recorder.times("single") == pytest.approx([start + 0.5, start + 0.55])
+
+
+def test_double_tap_exclusive_double(virtual_clock):
+    machine, recorder = _double_tap(virtual_clock, "exclusive")
+    start = virtual_clock.now()
+    _run(machine, virtual_clock, [0.1, 0.1, 0.1])
+    assert recorder.states("single") == []
+    assert recorder.states("double") == [True, False]
+    assert recorder.times("double") == pytest.approx([start + 0.2, start + 0.3])
+
+
+def test_double_tap_exclusive_held(virtual_clock):
+    machine, recorder = _double_tap(virtual_clock, "exclusive")
+    start = virtual_clock.now()
+    _run(machine, virtual_clock, [0.9])
+    assert recorder.states("single") == [True, False]
+    assert recorder.times("single") == pytest.approx([start + 0.5, start + 0.9])
+
+
+def test_double_tap_combined(virtual_clock):
+    machine, recorder = _double_tap(virtual_clock, "combined")
+    start = virtual_clock.now()
+    _run(machine, virtual_clock, [0.1, 0.1, 0.1, 1.0, 0.1])
+    assert recorder.states("single") == [True, False] * 3
+    assert recorder.states("double") == [True, False]
+    assert recorder.times("single")[:2] == pytest.approx([start, start + 0.1])
+    assert recorder.times("double") == pytest.approx([start + 0.2, start + 0.3])
+
+
+def test_double_tap_reset(virtual_clock):
+    machine, recorder = _double_tap(virtual_clock, "exclusive")
+    machine.process(FakeEvent(0), FakeValue(True))
+    machine.process(FakeEvent(1), FakeValue(False))
+    machine.reset()
+    assert machine.state == "idle"
+    virtual_clock.run_until_idle()
+    assert recorder.calls == []
+
+
+@pytest.mark.parametrize("factory, activate_on, outputs", [
+    (_tempo, "press", ["short", "long"]),
+    (_tempo, "release", ["short", "long"]),
+    (_double_tap, "exclusive", ["single", "double"]),
+    (_double_tap, "combined", ["single", "double"]),
+    (_triple_tap, None, ["tap_1", "tap_2", "tap_3"]),
+])
+def test_exhaustive_sequences(virtual_clock, factory, activate_on, outputs):
+    # gaps shorter than the pulse, shorter than the delay and longer than it
+    for gaps in itertools.product([0.01, 0.3, 0.7], repeat=6):
+        machine, recorder = factory(virtual_clock, activate_on)
+        _run(machine, virtual_clock, gaps)
+        assert machine.state == "idle"
+        assert virtual_clock.pending == 0
+        for name in outputs:
+            # outputs strictly alternate and always end up released
+            states = recorder.states(name)
+            assert states == [True, False] * (len(states) // 2), (gaps, name)
+
+        if activate_on in ("exclusive", None):
+            # exactly one output per tap sequence is ever active
+            active = 0
+            for _, _, current, _ in recorder.calls:
+                active += 1 if current else -1
+                assert 0 <= active <= 1
+
+
+def test_triple_tap(virtual_clock):
+    machine, recorder = _triple_tap(virtual_clock, None)
+    start = virtual_clock.now()
+    _run(machine, virtual_clock, [0.1, 0.1, 0.1, 0.1, 0.1])
+    assert recorder.states("tap_1") == []
+    assert recorder.states("tap_2") == []
+    assert recorder.states("tap_3") == [True, False]
+    assert recorder.times("tap_3") == pytest.approx([start + 0.4, start + 0.5])
+
+    # two taps are sent once no third tap can follow
+    recorder.calls.clear()
+    start = virtual_clock.now()
+    _run(machine, virtual_clock, [0.1, 0.1, 0.1])
+    assert recorder.states("tap_2") == [True, False]
+    assert recorder.times("tap_2") == pytest.approx([start + 0.7, start + 0.75])
+
+
+def test_hold_repeat(virtual_clock):
+    machine, recorder = _gesture(
+        virtual_clock, gremlin.gesture.hold_repeat_spec(), {"interval": 0.1}
+    )
+    start = virtual_clock.now()
+    _run(machine, virtual_clock, [0.75])
+    assert recorder.states("repeat") == [True, True, True, True, False]
+    assert recorder.times("repeat") == pytest.approx(
+        [start, start + 0.5, start + 0.6, start + 0.7, start + 0.75]
+    )
+    assert virtual_clock.pending == 0
+
+
+def test_click(virtual_clock):
+    machine, recorder = _gesture(virtual_clock, gremlin.gesture.click_spec(), {"window": 0.3})
+    start = virtual_clock.now()
+    _run(machine, virtual_clock, [0.2, 0.5, 0.4])
+    # only the press released within the window is a click
+    assert recorder.states("click") == [True, False]
+    assert recorder.times("click") == pytest.approx([start + 0.2, start + 0.25])
+
+
+def test_smart_toggle(virtual_clock):
+    machine, recorder = _smart_toggle(virtual_clock, None)
+    start = virtual_clock.now()
+    # a short press latches the output until the next press
+    _run(machine, virtual_clock, [0.1, 1.0, 0.1])
+    assert recorder.states("output") == [True, False]
+    assert recorder.times("output") == pytest.approx([start, start + 1.1])
+    # a long press is passed through
+    recorder.calls.clear()
+    start = virtual_clock.now()
+    _run(machine, virtual_clock, [0.8])
+    assert recorder.states("output") == [True, False]
+    assert recorder.times("output") == pytest.approx([start, start + 0.8])
+    assert machine.state == "idle"
+
+
+def test_spec_validation():
+    gesture = gremlin.gesture
+    with pytest.raises(gremlin.error.GremlinError):
+        gesture.GestureSpec("bad", ["idle"], [], [], {
+            ("idle", "press"): ([gesture.emit("missing", "current")], "idle")
+        })
+    with pytest.raises(gremlin.error.GremlinError):
+        gesture.GestureSpec("bad", ["idle"], [], [], {
+            ("idle", "press"): ([gesture.arm("delay")], "nowhere")
+        })
+    with pytest.raises(gremlin.error.GremlinError):
+        gesture.Gesture(gesture.click_spec(), {}, {"click": print})
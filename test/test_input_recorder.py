@@ -0,0 +1,127 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import sys
+sys.path.append(".")
+
+import types
+import uuid
+
+import dinput
+import dinput.fake
+import gremlin.input_recorder as input_recorder
+from gremlin.types import RawInputSource
+
+
+def _joystick_data(guid, input_type, input_index, value):
+    data = dinput._JoystickInputData()
+    data.device_guid = guid.ctypes
+    data.input_type = input_type
+    data.input_index = input_index
+    data.value = value
+    return data
+
+
+def test_joystick_roundtrip():
+    guid = dinput.fake.guid_from_uuid(
+        uuid.UUID("b4ca5720-11d0-11e9-8002-444553540000")
+    )
+    payload = input_recorder.encode_payload(
+        RawInputSource.Joystick,
+        _joystick_data(guid, 1, 3, -12345)
+    )
+    data, = input_recorder.decode_payload(RawInputSource.Joystick, payload)
+
+    assert dinput.GUID(data.device_guid) == guid
+    assert data.input_type == 1
+    assert data.input_index == 3
+    assert data.value == -12345
+
+
+def test_keyboard_midi_osc_roundtrip():
+    key_event = types.SimpleNamespace(
+        virtual_code=0x41,
+        scan_code=0x1e,
+        is_extended=False,
+        is_pressed=True
+    )
+    payload = input_recorder.encode_payload(RawInputSource.Keyboard, key_event)
+    assert input_recorder.decode_payload(RawInputSource.Keyboard, payload) == \
+        (0x41, 0x1e, False, True)
+
+    message = types.SimpleNamespace(bytes=lambda: [0xb0, 7, 100])
+    payload = input_recorder.encode_payload(RawInputSource.Midi, "Port A", 2, message)
+    assert input_recorder.decode_payload(RawInputSource.Midi, payload) == \
+        ("Port A", 2, bytes([0xb0, 7, 100]))
+
+    payload = input_recorder.encode_payload(
+        RawInputSource.Osc, "/gremlin/axis", [0.25, 3, "on", True]
+    )
+    assert input_recorder.decode_payload(RawInputSource.Osc, payload) == \
+        ("/gremlin/axis", [0.25, 3, "on", True])
+
+
+def test_log_file(tmp_path):
+    fname = tmp_path / "input.grec"
+    guid = dinput.fake.guid_from_uuid(uuid.uuid4())
+
+    writer = input_recorder.InputLogWriter(fname)
+    for i in range(100):
+        writer.write(
+            i * 0.001,
+            RawInputSource.Joystick,
+            input_recorder.encode_payload(
+                RawInputSource.Joystick,
+                _joystick_data(guid, 1, 1, i * 100)
+            )
+        )
+    writer.write(0.5, RawInputSource.Osc, input_recorder.encode_payload(
+        RawInputSource.Osc, "/a", [1.0]
+    ))
+    writer.close()
+
+    records = input_recorder.read_log(fname)
+    assert len(records) == 101
+    assert records[10][0] == 0.01
+    assert records[-1][1] == RawInputSource.Osc
+    data, = input_recorder.decode_payload(records[42][1], records[42][2])
+    assert data.value == 4200
+
+
+def test_axis_streams(tmp_path):
+    fname = tmp_path / "input.grec"
+    guid = dinput.fake.guid_from_uuid(uuid.uuid4())
+
+    writer = input_recorder.InputLogWriter(fname)
+    for i in range(10):
+        for input_type, index in [(1, 1), (1, 2), (2, 1)]:
+            writer.write(
+                i * 0.001,
+                RawInputSource.Joystick,
+                input_recorder.encode_payload(
+                    RawInputSource.Joystick,
+                    _joystick_data(guid, input_type, index, i * 100 * index)
+                )
+            )
+    writer.close()
+
+    # buttons are not part of the axis streams
+    streams = input_recorder.InputReplayer(fname).axis_streams()
+    assert sorted(index for _, index in streams) == [1, 2]
+    timestamps, values = streams[(guid, 2)]
+    assert list(timestamps) == [i * 0.001 for i in range(10)]
+    assert list(values) == [i * 200 for i in range(10)]
@@ -0,0 +1,101 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import sys
+sys.path.append(".")
+
+import pytest
+
+import gremlin.input_router
+from gremlin.input_types import InputType
+
+
+class FakeEvent:
+
+    def __init__(self, device_guid, event_type, identifier):
+        self.device_guid = device_guid
+        self.event_type = event_type
+        self.identifier = identifier
+
+
+@pytest.fixture
+def router(monkeypatch):
+    router = gremlin.input_router.InputRouter()
+    connections = []
+    # record the EventListener (dis)connections instead of performing them
+    monkeypatch.setattr(router, "_connect", connections.append)
+    router.clear()
+    router.reset_statistics()
+    router.connections = connections
+    yield router
+    router.clear()
+
+
+def test_routes_to_subscribers_only(router):
+    received = {}
+    def handler(name):
+        return lambda event: received.setdefault(name, []).append(event)
+
+    # sixteen gated axes on four devices, two of them on the same axis
+    handlers = {}
+    for device in range(4):
+        for axis in range(1, 5):
+            handlers[(device, axis)] = handler((device, axis))
+            router.subscribe(device, InputType.JoystickAxis, axis, handlers[(device, axis)])
+    shared = handler("shared")
+    router.subscribe(2, InputType.JoystickAxis, 3, shared)
+    assert router.subscriptions == 17
+    assert router.connections == [True]
+
+    assert router.dispatch(FakeEvent(1, InputType.JoystickAxis, 2)) == 1
+    assert list(received) == [(1, 2)]
+    assert router.dispatch(FakeEvent(2, InputType.JoystickAxis, 3)) == 2
+    assert set(received) == {(1, 2), (2, 3), "shared"}
+    # unrelated inputs do not call any handler
+    assert router.dispatch(FakeEvent(1, InputType.JoystickButton, 2)) == 0
+    assert router.dispatch(FakeEvent(7, InputType.JoystickAxis, 2)) == 0
+
+    report = router.report()
+    assert report["events"] == 4
+    assert report["handler_calls"] == 3
+    assert report["handlers_per_event"]["max"] == 2
+
+
+def test_subscription_lifetime(router):
+    calls = []
+    router.subscribe("guid", InputType.JoystickAxis, 1, calls.append)
+    # subscribing twice does not call the handler twice
+    router.subscribe("guid", InputType.JoystickAxis, 1, calls.append)
+    router.dispatch(FakeEvent("guid", InputType.JoystickAxis, 1))
+    assert len(calls) == 1
+
+    router.unsubscribe("guid", InputType.JoystickAxis, 1, calls.append)
+    router.dispatch(FakeEvent("guid", InputType.JoystickAxis, 1))
+    assert len(calls) == 1
+    assert router.subscriptions == 0
+    # the router only listens to joystick events while subscriptions exist
+    assert router.connections == [True, False]
+
+
+def test_handler_errors_are_isolated(router):
+    calls = []
+    def failing(event):
+        raise ValueError("boom")
+    router.subscribe("guid", InputType.JoystickAxis, 1, failing)
+    router.subscribe("guid", InputType.JoystickAxis, 1, calls.append)
+    assert router.dispatch(FakeEvent("guid", InputType.JoystickAxis, 1)) == 2
+    assert len(calls) == 1
@@ -0,0 +1,87 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import sys
+sys.path.append(".")
+
+import random
+
+import gremlin.interval_index
+
+
+def _contains(interval, value):
+    low, high, low_included, high_included = interval
+    if value == low:
+        return low_included
+    if value == high:
+        return high_included
+    return low < value < high
+
+
+def test_lookup_matches_linear_scan():
+    rnd = random.Random(7)
+    index = gremlin.interval_index.IntervalIndex()
+    intervals = {}
+    # detent zones and overlapping ranges, some sharing boundaries
+    boundaries = [round(rnd.uniform(-1.0, 1.0), 2) for _ in range(12)]
+    for owner in range(30):
+        low, high = sorted(rnd.sample(boundaries, 2))
+        owner_intervals = [(low, high, rnd.random() < 0.5, rnd.random() < 0.5)]
+        if owner % 3 == 0:
+            # symmetrical range
+            owner_intervals.append((-high, -low) + owner_intervals[0][2:])
+        intervals[owner] = owner_intervals
+        index.add(owner, owner_intervals)
+
+    samples = [rnd.uniform(-1.2, 1.2) for _ in range(2000)]
+    samples += boundaries + [-b for b in boundaries]
+    for value in samples:
+        _, owners = index.lookup(value)
+        expected = set(
+            owner for owner, owner_intervals in intervals.items()
+            if any(_contains(interval, value) for interval in owner_intervals)
+        )
+        assert owners == expected, value
+
+
+def test_slots_detect_transitions():
+    index = gremlin.interval_index.IntervalIndex()
+    index.add("low", [(-1.0, -0.5, True, True)])
+    index.add("high", [(0.5, 1.0, False, True)])
+    assert index.lookup(-0.7) == index.lookup(-0.6)
+    assert index.lookup(0.0)[1] == frozenset()
+    assert index.lookup(0.0) == index.lookup(0.2)
+    assert index.lookup(0.5)[1] == frozenset()
+    assert index.lookup(0.5)[0] != index.lookup(0.6)[0]
+    assert index.lookup(1.0)[1] == {"high"}
+
+    # changes rebuild the index
+    index.remove("high")
+    assert index.lookup(1.0)[1] == frozenset()
+    assert index.lookup(-1.0)[1] == {"low"}
+
+
+def test_registry_shares_indices_per_axis():
+    registry = gremlin.interval_index.IntervalIndexRegistry()
+    registry.clear()
+    index = registry.get(("guid", 1))
+    assert registry.get(("guid", 1)) is index
+    assert registry.get(("guid", 2)) is not index
+    index.add("range", [(0.0, 1.0, True, True)])
+    registry.remove(("guid", 1), "range")
+    assert registry.get(("guid", 1)) is not index
+    registry.clear()
@@ -0,0 +1,144 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import sys
+sys.path.append(".")
+
+import pytest
+
+import gremlin.macro
+import gremlin.sendinput
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    """Records the inputs of every SendInput call."""
+    calls = []
+    monkeypatch.setattr(
+        gremlin.sendinput,
+        "_send_input",
+        lambda *inputs: calls.append(inputs)
+    )
+    monkeypatch.setattr(gremlin.macro.MacroManager(), "default_delay", 0.0)
+    return calls
+
+
+def _run(macro):
+    """Executes the compiled steps of a macro locally, skipping pauses."""
+    manager = gremlin.macro.MacroManager()
+    steps = manager.compile(macro)
+    for _ in manager._execute_steps(steps, True, False):
+        pass
+    return steps
+
+
+def _key_inputs(call):
+    return [
+        (data.union.ki.wVk, data.union.ki.wScan, data.union.ki.dwFlags)
+        for data in call
+    ]
+
+
+def test_consecutive_keys_single_call(sent):
+    macro = gremlin.macro.Macro()
+    macro.press("a")
+    macro.press("b")
+    macro.release("b")
+    macro.release("a")
+
+    steps = _run(macro)
+    assert len(steps) == 1
+    assert len(sent) == 1
+    assert len(sent[0]) == 4
+    assert all(data.type == gremlin.sendinput.INPUT_KEYBOARD for data in sent[0])
+    assert _key_inputs(sent[0]) == list(steps[0].messages)
+
+
+def test_pause_splits_batch(sent):
+    macro = gremlin.macro.Macro()
+    macro.press("a")
+    macro.press("b")
+    macro.pause(0.1)
+    macro.release("b")
+    macro.release("a")
+
+    steps = _run(macro)
+    assert len(steps) == 3
+    assert steps[1] == 0.1
+    assert [len(call) for call in sent] == [2, 2]
+
+
+def test_non_key_action_splits_batch(sent):
+    macro = gremlin.macro.Macro()
+    macro.press("a")
+    macro.add_action(gremlin.macro.MouseMotionAction(5, 5))
+    macro.release("a")
+
+    steps = _run(macro)
+    assert len(steps) == 3
+    assert [len(call) for call in sent] == [1, 1, 1]
+    assert sent[0][0].type == gremlin.sendinput.INPUT_KEYBOARD
+    assert sent[1][0].type == gremlin.sendinput.INPUT_MOUSE
+    assert sent[2][0].type == gremlin.sendinput.INPUT_KEYBOARD
+
+
+def test_key_input_cache(sent):
+    macro = gremlin.macro.Macro()
+    macro.press("a")
+    macro.release("a")
+
+    _run(macro)
+    _run(macro)
+    assert len(sent) == 2
+
+    # the INPUT structure of each (vk, sc, flags) message is built once
+    press, release = sent[0]
+    assert press is not release
+    assert sent[1][0] is press
+    assert sent[1][1] is release
+    assert gremlin.sendinput.keyboard_input(*_key_inputs([press])[0]) is press
+
+
+def test_compiled_steps_cache(monkeypatch):
+    manager = gremlin.macro.MacroManager()
+    monkeypatch.setattr(manager, "default_delay", 0.0)
+    macro = gremlin.macro.Macro()
+    macro.press("a")
+    macro.release("a")
+
+    steps = manager.compile(macro)
+    assert manager.compile(macro) is steps
+
+    # editing the sequence discards the compiled steps
+    macro.pause(0.1)
+    edited = manager.compile(macro)
+    assert edited is not steps
+    assert len(edited) == 2
+    assert manager.compile(macro) is edited
+
+    macro.invalidate()
+    invalidated = manager.compile(macro)
+    assert invalidated is not edited
+    assert len(invalidated) == len(edited)
+
+    # so does a change of the default delay
+    monkeypatch.setattr(manager, "default_delay", 0.05)
+    delayed = manager.compile(macro)
+    assert delayed is not invalidated
+    assert delayed[1] == 0.05
+    assert len(delayed) == 4
+    assert manager.compile(macro) is delayed
@@ -0,0 +1,92 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import sys
+sys.path.append(".")
+
+import pytest
+
+import gremlin.error
+import gremlin.merge_engine
+from gremlin.merge_engine import EngineOperation
+from gremlin.types import MergeAxisOperation
+
+
+@pytest.mark.parametrize("operation, values, expected", [
+    (MergeAxisOperation.Sum, [0.5, 0.25, 0.5, -0.1], 1.0),
+    (MergeAxisOperation.Sum, [-0.5, 0.25, 0.1], -0.15),
+    (MergeAxisOperation.Average, [0.5, 0.25, -0.3, 0.1], 0.1375),
+    (MergeAxisOperation.Minimum, [0.5, 0.25, -0.3, 0.1], -0.3),
+    (MergeAxisOperation.Maximum, [0.5, 0.25, -0.3, 0.1], 0.5),
+])
+def test_operations(operation, values, expected):
+    merge = gremlin.merge_engine.compile_merge(operation, len(values))
+    assert merge(values) == pytest.approx(expected)
+
+
+def test_weighted():
+    # two toe brakes and a differential lever merged into a rudder
+    merge = gremlin.merge_engine.compile_merge(
+        EngineOperation.Weighted, 3, weights=[0.5, -0.5, 0.8]
+    )
+    assert merge([1.0, 0.0, 0.0]) == pytest.approx(0.5)
+    assert merge([0.2, 0.6, 0.5]) == pytest.approx(0.2)
+    assert merge([1.0, -1.0, 1.0]) == 1.0
+    with pytest.raises(gremlin.error.GremlinError):
+        gremlin.merge_engine.compile_merge(
+            EngineOperation.Weighted, 3, weights=[0.5, 0.5]
+        )
+
+
+def test_priority_override():
+    merge = gremlin.merge_engine.compile_merge(
+        EngineOperation.PriorityOverride, 3, rest=[0.0, -1.0, 0.0], threshold=0.1
+    )
+    # nothing deflected, the last input drives the output
+    assert merge([0.05, -0.95, 0.4]) == 0.4
+    assert merge([0.05, -0.5, 0.4]) == -0.5
+    assert merge([-0.3, -0.5, 0.4]) == -0.3
+
+
+def test_engine_only_recomputes_on_change():
+    engine = gremlin.merge_engine.MergeEngine(4, MergeAxisOperation.Sum)
+    assert engine.update(0, 0.25) == 0.25
+    assert engine.update(0, 0.25) is None
+    assert engine.computations == 1
+    assert engine.update(3, 0.25) == 0.5
+    assert engine.values == [0.25, 0.0, 0.0, 0.25]
+    # the output does not change although the input did
+    assert engine.update(1, 0.5) == 1.0
+    assert engine.update(2, 0.1) is None
+    assert engine.computations == 4
+    engine.reset()
+    assert engine.update(0, 0.0) == 0.0
+
+
+def test_two_axis_engine():
+    engine = gremlin.merge_engine.two_axis_engine(MergeAxisOperation.Average)
+    assert engine.update(0, 1.0) == 0.5
+    assert engine.update(1, 0.4) == pytest.approx(0.3)
+    engine = gremlin.merge_engine.two_axis_engine(
+        MergeAxisOperation.Maximum, initial=[0.2, 0.4]
+    )
+    assert engine.update(0, 0.3) == 0.4
+    assert engine.update(1, 0.1) == 0.3
+
+    # every operation the merged axes can select is stored by profiles
+    for operation in MergeAxisOperation:
+        assert MergeAxisOperation.to_enum(MergeAxisOperation.to_string(operation)) == operation
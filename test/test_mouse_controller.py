@@ -0,0 +1,100 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import sys
+sys.path.append(".")
+
+import pytest
+
+import gremlin.sendinput
+import gremlin.tick_engine
+
+
+@pytest.fixture
+def controller(virtual_clock, monkeypatch):
+    motions = []
+    monkeypatch.setattr(
+        gremlin.sendinput,
+        "mouse_relative_motion",
+        lambda dx, dy: motions.append((virtual_clock.now(), dx, dy))
+    )
+    engine = gremlin.tick_engine.TickEngine()
+    engine.start()
+    controller = gremlin.sendinput.MouseController()
+    controller.tick_rate = 100
+    controller.set_absolute_motion(0, 0)
+    controller.start()
+    controller.motions = motions
+    yield controller
+    controller.stop()
+    engine.stop()
+    controller.set_absolute_motion(0, 0)
+    controller.tick_rate = 100
+
+
+def test_idle_at_rest(controller, virtual_clock):
+    assert not controller.is_active
+    assert virtual_clock.pending == 0
+    virtual_clock.advance(1.0)
+    assert controller.motions == []
+
+
+def test_fixed_motion(controller, virtual_clock):
+    controller.set_absolute_motion(200, -50)
+    assert controller.is_active
+
+    virtual_clock.advance(0.995)
+    assert sum(dx for _, dx, _ in controller.motions) == 200
+    assert sum(dy for _, _, dy in controller.motions) == -50
+    # 2 pixels every tick along x
+    assert len(controller.motions) == 100
+    assert all(dx == 2 for _, dx, _ in controller.motions)
+
+    # returning to rest stops the ticks
+    controller.set_absolute_motion(0, 0)
+    virtual_clock.advance(0.1)
+    assert not controller.is_active
+    assert virtual_clock.pending == 0
+    count = len(controller.motions)
+    virtual_clock.advance(1.0)
+    assert len(controller.motions) == count
+
+
+def test_tick_rate(controller, virtual_clock):
+    controller.tick_rate = 250
+    controller.set_absolute_motion(1000, 0)
+    virtual_clock.advance(0.999)
+    assert len(controller.motions) == 250
+    assert all(dx == 4 and dy == 0 for _, dx, dy in controller.motions)
+
+    times = [timestamp for timestamp, _, _ in controller.motions]
+    intervals = [b - a for a, b in zip(times[:-1], times[1:])]
+    assert intervals == pytest.approx([0.004] * len(intervals))
+
+
+def test_accelerated_motion(controller, virtual_clock):
+    # accelerate along x from 100 to 500 pixels per second within a second
+    controller.set_accelerated_motion(90.0, 100, 500, 1.0)
+    virtual_clock.advance(1.0)
+    distance = sum(dx for _, dx, _ in controller.motions)
+    assert distance == pytest.approx(300, abs=10)
+    assert sum(abs(dy) for _, _, dy in controller.motions) == 0
+
+    # full speed is held once reached
+    controller.motions.clear()
+    virtual_clock.advance(1.0)
+    assert sum(dx for _, dx, _ in controller.motions) == pytest.approx(500, abs=10)
@@ -0,0 +1,48 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import sys
+sys.path.append(".")
+
+import pytest
+
+import gremlin.perf_stats as perf_stats
+
+
+def test_percentile():
+    values = [float(v) for v in range(101)]
+    assert perf_stats.percentile(values, 0.0) == 0.0
+    assert perf_stats.percentile(values, 0.5) == 50.0
+    assert perf_stats.percentile(values, 0.99) == 99.0
+    assert perf_stats.percentile([1.0, 2.0], 0.5) == 1.5
+    assert perf_stats.percentile([], 0.5) == 0.0
+
+
+def test_sample_stats():
+    stats = perf_stats.SampleStats(history=10)
+    for v in range(20):
+        stats.add(float(v))
+
+    summary = stats.summary()
+    assert summary["count"] == 20
+    assert summary["mean"] == pytest.approx(9.5)
+    assert summary["max"] == 19.0
+    # only the last 10 samples are used for percentiles
+    assert summary["p50"] == pytest.approx(14.5)
+
+    stats.reset()
+    assert stats.summary()["count"] == 0
@@ -0,0 +1,86 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import sys
+sys.path.append(".")
+
+import threading
+import time
+
+import gremlin.input_devices
+
+
+def test_drift_free_schedule():
+    registry = gremlin.input_devices.PeriodicRegistry()
+    times = []
+    done = threading.Event()
+
+    def tick():
+        times.append(time.perf_counter())
+        if len(times) == 10:
+            done.set()
+
+    registry.add(tick, 0.02)
+    start = time.perf_counter()
+    registry.start()
+    assert done.wait(2.0)
+    registry.stop()
+
+    # deadlines are multiples of the interval from the start, so errors
+    # don't accumulate over time
+    assert times[-1] - start >= 10 * 0.02
+    assert times[-1] - start < 10 * 0.02 + 0.1
+    assert registry.report()["tick"]["runs"] >= 10
+
+
+def test_wake_on_add_and_stop():
+    registry = gremlin.input_devices.PeriodicRegistry()
+    slow = threading.Event()
+    fast = threading.Event()
+    registry.add(slow.set, 60.0)
+    registry.start()
+
+    # a newly added function runs without waiting for the 60s entry
+    registry.add(fast.set, 0.01)
+    assert fast.wait(1.0)
+    assert not slow.is_set()
+
+    registry.remove(fast.set)
+    start = time.perf_counter()
+    registry.stop()
+    assert time.perf_counter() - start < 1.0
+
+
+def test_skip_missed():
+    registry = gremlin.input_devices.PeriodicRegistry()
+    done = threading.Event()
+    runs = []
+
+    def busy():
+        runs.append(time.perf_counter())
+        time.sleep(0.055)
+        if len(runs) == 3:
+            done.set()
+
+    registry.add(busy, 0.02, skip_missed=True)
+    registry.start()
+    assert done.wait(2.0)
+    registry.stop()
+
+    report = registry.report()["busy"]
+    assert report["missed"] >= 4
+    assert report["overrun_ms"]["count"] >= 2
@@ -0,0 +1,167 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import sys
+sys.path.append(".")
+
+import threading
+import uuid
+
+import dinput.fake
+import gremlin.clock
+import gremlin.thread_registry
+from gremlin.input_types import InputType
+from gremlin.types import DeviceType
+
+
+def _start_worker(name, stall_timeout=1.0):
+    """Starts a thread registering itself and waiting for instructions."""
+    registered = threading.Event()
+    stop = threading.Event()
+    handle = {}
+
+    def run():
+        handle["worker"] = gremlin.thread_registry.register(name, stall_timeout)
+        registered.set()
+        stop.wait()
+        handle["worker"].unregister()
+
+    thread = threading.Thread(target=run, name=name)
+    thread.start()
+    assert registered.wait(1.0)
+    return handle["worker"], stop, thread
+
+
+def test_stall_detection(virtual_clock):
+    registry = gremlin.thread_registry.ThreadRegistry()
+    worker, stop, thread = _start_worker("stalling")
+    try:
+        worker.beat()
+        virtual_clock.advance(0.5)
+        assert "stalling" not in registry.check()
+
+        # busy for longer than the stall timeout
+        virtual_clock.advance(1.0)
+        stalls = registry.stalls
+        assert "stalling" in registry.check()
+        assert "stalling" in registry.check()
+        assert registry.stalls == stalls + 1
+        assert registry.report()["workers"]["stalling"]["stalled"]
+
+        # recovers with a heartbeat
+        worker.beat()
+        assert "stalling" not in registry.check()
+
+        # waiting for work is not a stall
+        worker.idle()
+        virtual_clock.advance(10.0)
+        assert "stalling" not in registry.check()
+    finally:
+        stop.set()
+        thread.join()
+    assert "stalling" not in registry.report()["workers"]
+
+
+def test_leaked_threads():
+    registry = gremlin.thread_registry.ThreadRegistry()
+    registry.set_baseline()
+    worker, stop, thread = _start_worker("leaking", stall_timeout=None)
+    assert registry.leaked_threads(timeout=0.05) == ["leaking"]
+
+    # persistent workers are expected to outlive the profile
+    worker.persistent = True
+    assert registry.leaked_threads(timeout=0.05) == []
+    worker.persistent = False
+
+    stop.set()
+    assert registry.leaked_threads(timeout=1.0) == []
+    assert not thread.is_alive()
+
+
+def test_watchdog():
+    registry = gremlin.thread_registry.ThreadRegistry()
+    count = threading.active_count()
+    registry.start_watchdog(interval=0.01)
+    assert threading.active_count() == count + 1
+    gremlin.clock.sleep(0.05)
+    registry.stop_watchdog()
+    assert threading.active_count() == count
+
+    report = registry.report()
+    assert report["thread_count"]["count"] >= 2
+    assert report["thread_count"]["max"] >= count + 1
+
+
+def _write_minimal_profile(fname):
+    """Writes a profile mapping a single button to a description action."""
+    import gremlin.base_profile
+    import gremlin.plugin_manager
+
+    container_type = gremlin.plugin_manager.ContainerPlugins().tag_map["basic"]
+    action_type = gremlin.plugin_manager.ActionPlugins().tag_map["description"]
+
+    profile = gremlin.base_profile.Profile()
+    # profile modes are those of the keyboard device
+    profile.get_device_modes(
+        dinput.GUID_Keyboard,
+        DeviceType.Keyboard,
+        DeviceType.to_string(DeviceType.Keyboard)
+    ).ensure_mode_exists("Default")
+    device = profile.get_device_modes(
+        dinput.fake.guid_from_uuid(uuid.uuid4()),
+        DeviceType.Joystick,
+        "Fake device"
+    )
+    device.ensure_mode_exists("Default")
+    item = device.modes["Default"].get_data(InputType.JoystickButton, 1)
+    container = container_type(item)
+    container.add_action(action_type(container))
+    item.add_container(container)
+    profile.to_xml(fname)
+
+
+def test_runtime_stop_returns_to_baseline(tmp_path):
+    import gremlin.headless
+    import gremlin.shared_state
+
+    fname = str(tmp_path / "profile.xml")
+    _write_minimal_profile(fname)
+
+    is_headless = gremlin.shared_state.is_headless
+    runtime = gremlin.headless.HeadlessRuntime(dinput.fake.FakeDILL(
+        gremlin.headless.fake_devices_from_profile(fname)
+    ))
+    try:
+        runtime.load_profile(fname)
+
+        # the timer service thread lives for the whole process
+        started = threading.Event()
+        gremlin.clock.call_later(0.0, started.set)
+        assert started.wait(1.0)
+        count = threading.active_count()
+
+        registry = gremlin.thread_registry.ThreadRegistry()
+        runtime.start()
+        assert threading.active_count() > count
+        assert "Watchdog" in [t.name for t in threading.enumerate()]
+
+        runtime.stop()
+        assert registry.leaked_threads() == []
+        assert threading.active_count() == count
+    finally:
+        runtime.stop()
+        gremlin.shared_state.is_headless = is_headless
@@ -0,0 +1,103 @@
+# -*- coding: utf-8; -*-
+
+# Based on original work by (C) Lionel Ott -  (C) EMCS 2024 and other contributors
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+import sys
+sys.path.append(".")
+
+import pytest
+
+import gremlin.sendinput
+import gremlin.tick_engine
+
+
+@pytest.fixture
+def engine(virtual_clock, monkeypatch):
+    motions = []
+    monkeypatch.setattr(
+        gremlin.sendinput,
+        "mouse_relative_motion",
+        lambda dx, dy: motions.append((virtual_clock.now(), dx, dy))
+    )
+    engine = gremlin.tick_engine.TickEngine()
+    engine.rate = 100
+    engine.start()
+    engine.motions = motions
+    yield engine
+    engine.stop()
+
+
+def test_handlers(engine, virtual_clock):
+    assert not engine.is_active
+    calls = []
+
+    def first(delta_t):
+        calls.append(("first", virtual_clock.now(), delta_t))
+        return len(calls) < 10
+
+    def second(delta_t):
+        calls.append(("second", virtual_clock.now(), delta_t))
+
+    engine.add(first)
+    engine.add(second)
+    assert engine.is_active
+
+    virtual_clock.advance(0.1)
+    # both handlers run within the same pass of every tick
+    names = [name for name, _, _ in calls]
+    assert names[:6] == ["first", "second"] * 3
+    assert all(delta_t == pytest.approx(0.01) for _, _, delta_t in calls)
+    ticks = sorted(set(timestamp for _, timestamp, _ in calls))
+    intervals = [b - a for a, b in zip(ticks[:-1], ticks[1:])]
+    assert intervals == pytest.approx([0.01] * len(intervals))
+
+    # handler returning False is removed, the other one stays registered
+    count = len(calls)
+    virtual_clock.advance(0.05)
+    assert all(name == "second" for name, _, _ in calls[count:])
+
+    engine.remove(second)
+    virtual_clock.advance(0.05)
+    assert not engine.is_active
+    assert virtual_clock.pending == 0
+
+
+def test_mouse_batching(engine, virtual_clock):
+    def handler(delta_t):
+        engine.move_mouse(1, 0)
+        engine.move_mouse(2, -1)
+
+    engine.add(handler)
+    virtual_clock.advance(0.095)
+    # one motion per tick combining every request of that tick
+    assert len(engine.motions) == 10
+    assert all(dx == 3 and dy == -1 for _, dx, dy in engine.motions)
+
+
+def test_rate_and_report(engine, virtual_clock):
+    engine.rate = 250
+    calls = []
+    engine.add(lambda delta_t: calls.append(delta_t))
+    virtual_clock.advance(0.999)
+    assert len(calls) == 250
+    assert calls[0] == pytest.approx(0.004)
+
+    report = engine.report()
+    assert report["rate"] == 250
+    assert report["ticks"] == 250
+    assert report["handlers"] == 1
+    assert report["jitter_ms"]["count"] == 250
+    assert report["jitter_ms"]["max"] == pytest.approx(0.0, abs=1e-6)
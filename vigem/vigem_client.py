@@ -10,6 +10,7 @@ from ctypes import CDLL, POINTER, CFUNCTYPE, c_void_p, c_uint, c_ushort, c_ulong
 from .vigem_commons import XUSB_REPORT, DS4_REPORT, DS4_REPORT_EX, VIGEM_TARGET_TYPE
 import os
 import logging
+import sys
 from gremlin.util import display_error, get_dll_version
 
 
@@ -33,6 +34,11 @@ class VigemClient():
 
         if VigemClient._dll is None:
 
+            if sys.platform != "win32":
+                # the ViGEm client dll only exists for Windows
+                logging.getLogger("system").warning("ViGEm is not available on this platform")
+                return
+
             dll_folder = os.path.dirname(__file__)
             dll_file = "ViGEmClient.dll"
             _dll_path = os.path.join(dll_folder, dll_file )
@@ -39,6 +39,11 @@ class VBus:
     Virtual USB bus (ViGEmBus)
     """
     def __init__(self):
+        if vcli.vigemClient is None:
+            # client dll not loaded, no bus to connect to
+            self._busp = None
+            self.valid = False
+            return
         # keep internal references so GC does not remove the dll before the objects are terminated properly
         self.vigem_disconnect = vcli.vigem_disconnect
         self.vigem_free = vcli.vigem_free
@@ -49,6 +54,8 @@ class VBus:
         return self._busp
 
     def __del__(self):
+        if self._busp is None:
+            return
         self.vigem_disconnect(self._busp)
         self.vigem_free(self._busp)
 
@@ -19,12 +19,11 @@
 import ctypes
 import enum
 import logging
-import threading
-import time
 import os
 
 from vjoy.vjoy_interface import VJoyState, VJoyInterface
 from gremlin.error import VJoyError
+import gremlin.clock
 import gremlin.common
 import gremlin.spline
 import gremlin.types
@@ -499,12 +498,11 @@ class VJoy:
         self._hat = self._init_hats()
 
         # Timestamp of the last time the device was used
-        self._last_active = time.time()
-        self._keep_alive_timer = threading.Timer(
+        self._last_active = gremlin.clock.now()
+        self._keep_alive_timer = gremlin.clock.call_later(
             VJoy.keep_alive_timeout,
             self._keep_alive
         )
-        self._keep_alive_timer.start()
 
         # Reset all controls
         self.reset()
@@ -704,7 +702,7 @@ class VJoy:
 
     def used(self):
         """Updates the timestamp of the last time the device has been used."""
-        self._last_active = time.time()
+        self._last_active = gremlin.clock.now()
 
     def invalidate(self):
         """Releases all resources claimed by this instance.
@@ -724,13 +722,12 @@ class VJoy:
         If the device hasn't been used in the last 60 seconds the device will
         be reset to ensure it doesn't time out.
         """
-        if self._last_active + VJoy.keep_alive_timeout < time.time():
+        if self._last_active + VJoy.keep_alive_timeout < gremlin.clock.now():
             self.reset()
-        self._keep_alive_timer = threading.Timer(
+        self._keep_alive_timer = gremlin.clock.call_later(
             VJoy.keep_alive_timeout,
             self._keep_alive
         )
-        self._keep_alive_timer.start()
 
     def _init_axes(self):
         """Retrieves all axes present on the vJoy device and creates their